@@ -1,4 +1,5 @@
 import 'package:flutter/material.dart';
+import '../services/asset_loader.dart';
 import 'dart:convert';
 import 'package:http/http.dart' as http;
 import 'package:shared_preferences/shared_preferences.dart';
@@ -22,6 +23,14 @@ class AppLocalizations {
   static Future<void> initialize(String langCode) async {
     if (_isInitialized && _dynamicTranslations.containsKey(langCode)) return;
 
+    // 빌드 시 미리 번역된 UI 문자열 (수동 번역 언어는 빠진 키만 들어있음)
+    final bundled = await _loadBundledTranslations(langCode);
+    if (bundled != null) {
+      _dynamicTranslations[langCode] = bundled;
+      _isInitialized = true;
+      return;
+    }
+
     // 수동 번역이 있는 언어는 스킵
     if (_localizedValues.containsKey(langCode)) {
       _isInitialized = true;
@@ -44,6 +53,21 @@ class AppLocalizations {
     _isInitialized = true;
   }
 
+  // scripts/pre_translate_ui.py가 만든 assets/ui_translations.json에서 로드
+  static Future<Map<String, String>?> _loadBundledTranslations(
+      String langCode) async {
+    try {
+      final jsonString =
+          await AssetLoader.loadString('assets/ui_translations.json');
+      final Map<String, dynamic> data = json.decode(jsonString);
+      final strings = data['languages']?[langCode];
+      if (strings == null) return null;
+      return Map<String, String>.from(strings);
+    } catch (e) {
+      return null;
+    }
+  }
+
   // UI 문자열 자동 번역
   static Future<void> _translateUIStrings(String langCode) async {
     final englishStrings = _localizedValues['en']!;
@@ -142,6 +166,7 @@ class AppLocalizations {
       'share': 'Share',
       'copy': 'Copy',
       'copied_to_clipboard': 'Copied to clipboard',
+      'related_quotes': 'Similar Quotes',
 
       // Settings
       'notifications': 'Notifications',
@@ -155,6 +180,9 @@ class AppLocalizations {
       'notification_off': 'Notification disabled',
       'notification_time_changed': 'Notification time changed to',
       'notification_permission_required': 'Notification permission required',
+      'notification_title': "Today's Quote 💬",
+      'notification_channel': 'Daily Quote',
+      'notification_channel_desc': 'Get daily inspiring quotes',
       'app_info': 'App Info',
       'version': 'Version',
       'quote_data': 'Quote Data',
@@ -240,6 +268,7 @@ class AppLocalizations {
       'share': '공유',
       'copy': '복사',
       'copied_to_clipboard': '클립보드에 복사되었습니다',
+      'related_quotes': '비슷한 명언',
 
       // Settings
       'notifications': '알림',
@@ -253,6 +282,9 @@ class AppLocalizations {
       'notification_off': '알림이 해제되었습니다',
       'notification_time_changed': '알림 시간이 변경되었습니다:',
       'notification_permission_required': '알림 권한이 필요합니다',
+      'notification_title': '오늘의 명언 💬',
+      'notification_channel': '오늘의 명언',
+      'notification_channel_desc': '매일 명언을 알려드립니다',
       'app_info': '앱 정보',
       'version': '버전',
       'quote_data': '명언 데이터',
@@ -328,6 +360,7 @@ class AppLocalizations {
       'share': '共有',
       'copy': 'コピー',
       'copied_to_clipboard': 'クリップボードにコピーしました',
+      'related_quotes': '似た名言',
       'notifications': '通知',
       'daily_notification': '毎日の名言通知',
       'notification_time': '通知時間',
@@ -410,6 +443,7 @@ class AppLocalizations {
       'share': '分享',
       'copy': '复制',
       'copied_to_clipboard': '已复制到剪贴板',
+      'related_quotes': '相似名言',
       'notifications': '通知',
       'daily_notification': '每日名言通知',
       'notification_time': '通知时间',
@@ -476,6 +510,7 @@ class AppLocalizations {
       'share': 'Compartir',
       'copy': 'Copiar',
       'copied_to_clipboard': 'Copiado al portapapeles',
+      'related_quotes': 'Citas similares',
       'notifications': 'Notificaciones',
       'daily_notification': 'Notificación diaria',
       'notification_time': 'Hora de notificación',
@@ -506,9 +541,10 @@ class AppLocalizations {
   String get(String key) {
     final langCode = locale.languageCode;
 
-    // 1. 수동 번역 확인
+    // 1. 수동 번역 확인 (빠진 키는 미리 번역된 문자열로 보충)
     if (_localizedValues.containsKey(langCode)) {
       return _localizedValues[langCode]?[key] ??
+          _dynamicTranslations[langCode]?[key] ??
           _localizedValues['en']?[key] ??
           key;
     }
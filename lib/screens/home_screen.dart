@@ -4,6 +4,7 @@ import '../models/quote.dart';
 import '../services/quote_service.dart';
 import '../services/ad_service.dart';
 import '../widgets/quote_card.dart';
+import 'quote_list_screen.dart';
 import '../l10n/app_localizations.dart';
 
 class HomeScreen extends StatefulWidget {
@@ -472,9 +473,27 @@ class _HomeScreenState extends State<HomeScreen> {
     }
   }
 
+  // 비슷한 명언 목록 (assets/quote_related.json)
+  Future<void> _showRelatedQuotes(List<Quote> related) async {
+    final l10n = AppLocalizations.of(context);
+    await Navigator.push(
+      context,
+      MaterialPageRoute(
+        builder: (context) => QuoteListScreen(
+          title: l10n.get('related_quotes'),
+          quotes: related,
+        ),
+      ),
+    );
+    setState(() {});
+  }
+
   @override
   Widget build(BuildContext context) {
     final l10n = AppLocalizations.of(context);
+    final related = _currentQuote == null
+        ? const <Quote>[]
+        : _quoteService.getRelatedQuotes(_currentQuote!);
 
     return Scaffold(
       body: Container(
@@ -604,6 +623,9 @@ class _HomeScreenState extends State<HomeScreen> {
                             onFavoritePressed: _toggleFavorite,
                             isLocked: _isCurrentQuoteLocked,
                             onUnlockPressed: _unlockQuotes,
+                            onRelatedPressed: related.isEmpty
+                                ? null
+                                : () => _showRelatedQuotes(related),
                           ),
                         ),
                       ),
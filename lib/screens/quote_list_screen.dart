@@ -28,6 +28,20 @@ class _QuoteListScreenState extends State<QuoteListScreen> {
     setState(() {});
   }
 
+  Future<void> _showRelatedQuotes(List<Quote> related) async {
+    final l10n = AppLocalizations.of(context);
+    await Navigator.push(
+      context,
+      MaterialPageRoute(
+        builder: (context) => QuoteListScreen(
+          title: l10n.get('related_quotes'),
+          quotes: related,
+        ),
+      ),
+    );
+    setState(() {});
+  }
+
   // 명언이 잠겨있는지 확인 (짝수번째 = 잠금)
   bool _isQuoteLocked(int index) {
     if (_adService.isPremium || _adService.isUnlocked) return false;
@@ -78,6 +92,7 @@ class _QuoteListScreenState extends State<QuoteListScreen> {
             );
           }
 
+          final related = _quoteService.getRelatedQuotes(quote);
           return Padding(
             padding: const EdgeInsets.only(bottom: 10),
             child: QuoteCard(
@@ -85,6 +100,9 @@ class _QuoteListScreenState extends State<QuoteListScreen> {
               isFavorite: _quoteService.isFavorite(quote),
               onFavoritePressed: () => _toggleFavorite(quote),
               compact: true,
+              onRelatedPressed: related.isEmpty
+                  ? null
+                  : () => _showRelatedQuotes(related),
             ),
           );
         },
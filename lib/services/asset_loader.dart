@@ -0,0 +1,48 @@
+import 'dart:convert';
+import 'package:flutter/foundation.dart' show kIsWeb;
+import 'package:flutter/services.dart' show rootBundle;
+import 'package:http/http.dart' as http;
+
+/// 데이터 에셋(JSON) 로더
+/// 웹에서는 scripts/web_assets.py가 만든 asset_manifest.json으로 콘텐츠 해시 파일명을 찾아서 받는다
+/// (immutable 캐시, 서버가 gzip_static 등으로 .br/.gz 사전 압축본을 골라 보낼 때만 압축본이 쓰임). 매니페스트가 없거나 웹이 아니면 번들 에셋을 읽는다.
+class AssetLoader {
+  static const String manifestPath = 'asset_manifest.json';
+
+  // 에셋 경로 -> 해시 파일 경로 (앱 실행 중 한 번만 받음)
+  static Future<Map<String, String>>? _manifest;
+
+  static Future<Map<String, String>> _loadManifest() async {
+    try {
+      // 상대 경로는 브라우저가 index.html의 <base href> 기준으로 푼다
+      // 매니페스트는 배포마다 바뀌므로 _headers에서 no-cache로 내려준다
+      final response = await http.get(Uri.parse(manifestPath))
+          .timeout(const Duration(seconds: 10));
+      if (response.statusCode != 200) return {};
+      final Map<String, dynamic> data = json.decode(utf8.decode(response.bodyBytes));
+      final Map<String, dynamic> files = data['files'] ?? {};
+      return files.map((path, entry) => MapEntry(path, entry['file'] as String));
+    } catch (e) {
+      print('Error loading web asset manifest: $e');
+      return {};
+    }
+  }
+
+  static Future<String> loadString(String path) async {
+    if (kIsWeb) {
+      final manifest = await (_manifest ??= _loadManifest());
+      final file = manifest[path];
+      if (file != null) {
+        try {
+          final response = await http.get(Uri.parse(file));
+          if (response.statusCode == 200) {
+            return utf8.decode(response.bodyBytes);
+          }
+        } catch (e) {
+          print('Error loading hashed asset $file: $e');
+        }
+      }
+    }
+    return rootBundle.loadString(path);
+  }
+}
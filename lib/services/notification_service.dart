@@ -1,7 +1,10 @@
+import 'dart:convert';
+import 'dart:ui' as ui;
 import 'package:flutter_local_notifications/flutter_local_notifications.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 import 'package:timezone/timezone.dart' as tz;
 import 'package:timezone/data/latest.dart' as tz;
+import 'asset_loader.dart';
 import 'quote_service.dart';
 
 class NotificationService {
@@ -70,10 +73,14 @@ class NotificationService {
       scheduledDate = scheduledDate.add(const Duration(days: 1));
     }
 
-    // 알림 제목과 내용 설정
-    final title = useEnglish ? "Today's Quote 💬" : '오늘의 명언 💬';
+    // 알림 제목과 내용 설정 (미리 번역된 페이로드가 있으면 그대로 사용)
+    final langCode =
+        useEnglish ? 'en' : ui.PlatformDispatcher.instance.locale.languageCode;
+    final payload = await _loadPayload(langCode, now, quote.id);
     final quoteText = quote.text.length > 100 ? '${quote.text.substring(0, 100)}...' : quote.text;
-    final body = '"$quoteText" - ${quote.author}';
+    final title = payload?['title'] as String? ??
+        (useEnglish ? "Today's Quote 💬" : '오늘의 명언 💬');
+    final body = payload?['body'] as String? ?? '"$quoteText" - ${quote.author}';
 
     final androidDetails = AndroidNotificationDetails(
       'daily_quote_channel',
@@ -114,6 +121,25 @@ class NotificationService {
     await prefs.setBool('notification_use_english', useEnglish);
   }
 
+  // scripts/pre_translate_ui.py가 만든 assets/notification_payloads.json에서 날짜/언어별 문구 로드
+  Future<Map<String, dynamic>?> _loadPayload(
+      String langCode, DateTime date, int quoteId) async {
+    try {
+      final jsonString =
+          await AssetLoader.loadString('assets/notification_payloads.json');
+      final Map<String, dynamic> data = json.decode(jsonString);
+      final day = '${date.year.toString().padLeft(4, '0')}-'
+          '${date.month.toString().padLeft(2, '0')}-'
+          '${date.day.toString().padLeft(2, '0')}';
+      final payload = data['languages']?[langCode]?[day];
+      // 필터 등으로 오늘의 명언이 달라졌으면 쓰지 않음
+      if (payload == null || payload['id'] != quoteId) return null;
+      return Map<String, dynamic>.from(payload);
+    } catch (e) {
+      return null;
+    }
+  }
+
   Future<void> cancelAllNotifications() async {
     await _notifications.cancelAll();
     
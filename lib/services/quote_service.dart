@@ -1,8 +1,9 @@
 import 'dart:convert';
 import 'dart:math';
-import 'package:flutter/services.dart';
+import 'package:crypto/crypto.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 import '../models/quote.dart';
+import 'asset_loader.dart';
 
 class QuoteService {
   static final QuoteService _instance = QuoteService._internal();
@@ -19,6 +20,18 @@ class QuoteService {
   bool _filterFamousOnly = false;
   bool _filterShortOnly = false;
 
+  // 비슷한 명언 (assets/quote_related.json: quotes.json 위치 기준 이웃 배열)
+  List<int> _relatedNeighbors = [];
+  int _relatedK = 0;
+  Map<int, int> _positionById = {};
+
+  // 필터 인덱스 (assets/quote_indexes.json, corpus 순서로 되돌린 목록)
+  // 파일이 없거나 다른 corpus로 만든 것이면 null이고, 필터는 _quotes 전체를 훑는다
+  Map<String, List<Quote>>? _categoryIndex;
+  List<Quote>? _famousIndex;
+  List<Quote>? _shortIndex;
+  Set<int>? _famousIds;
+
   // 특수 카테고리 상수
   static const String categoryFamous = '_FAMOUS_';
   static const String categoryShort = '_SHORT_';
@@ -144,9 +157,11 @@ class QuoteService {
   Future<void> loadQuotes() async {
     try {
       final String jsonString =
-          await rootBundle.loadString('assets/quotes.json');
+          await AssetLoader.loadString('assets/quotes.json');
       final List<dynamic> jsonList = json.decode(jsonString);
       _quotes = jsonList.map((json) => Quote.fromJson(json)).toList();
+      await _loadRelated();
+      await _loadIndexes();
       await _loadFavorites();
       await _loadSelectedCategory();
       await _loadRewardedQuotes();
@@ -221,6 +236,8 @@ class QuoteService {
 
   // 유명인 명언인지 확인
   bool _isFamousQuote(Quote quote) {
+    final famousIds = _famousIds;
+    if (famousIds != null) return famousIds.contains(quote.id);
     final authorLower = quote.author.toLowerCase();
     return _famousPeople
         .any((person) => authorLower.contains(person.toLowerCase()));
@@ -261,16 +278,13 @@ class QuoteService {
       baseQuotes = _quotes;
     } else if (_selectedCategory == categoryFamous) {
       // 특수 카테고리: Famous (유명인)
-      baseQuotes = _quotes.where((q) => _isFamousQuote(q)).toList();
+      baseQuotes = _famousQuotes;
     } else if (_selectedCategory == categoryShort) {
       // 특수 카테고리: Short (100자 이하)
-      baseQuotes = _quotes.where((q) => _isShortQuote(q)).toList();
+      baseQuotes = _shortQuotes;
     } else {
       // 일반 카테고리
-      baseQuotes = _quotes
-          .where((q) =>
-              q.category.toLowerCase() == _selectedCategory!.toLowerCase())
-          .toList();
+      baseQuotes = _categoryQuotes(_selectedCategory!);
     }
 
     // 추가 필터 적용 (특수 카테고리가 아닌 경우에만)
@@ -282,9 +296,24 @@ class QuoteService {
     return baseQuotes;
   }
 
+  // 인덱스가 있으면 미리 만든 목록, 없으면 전체 스캔
+  List<Quote> get _famousQuotes =>
+      _famousIndex ?? _quotes.where((q) => _isFamousQuote(q)).toList();
+
+  List<Quote> get _shortQuotes =>
+      _shortIndex ?? _quotes.where((q) => _isShortQuote(q)).toList();
+
+  List<Quote> _categoryQuotes(String category) {
+    final index = _categoryIndex;
+    if (index != null) return index[category.toLowerCase()] ?? const [];
+    return _quotes
+        .where((q) => q.category.toLowerCase() == category.toLowerCase())
+        .toList();
+  }
+
   // 특수 카테고리별 명언 수
-  int get famousQuotesCount => _quotes.where((q) => _isFamousQuote(q)).length;
-  int get shortQuotesCount => _quotes.where((q) => _isShortQuote(q)).length;
+  int get famousQuotesCount => _famousQuotes.length;
+  int get shortQuotesCount => _shortQuotes.length;
 
   // 현재 필터에 맞는 명언 수 (추가 필터 적용 후)
   int get currentFilteredCount => _filteredQuotes.length;
@@ -298,14 +327,12 @@ class QuoteService {
     } else if (category == categoryFamous || category == categoryShort) {
       // 특수 카테고리는 추가 필터 적용 안함
       if (category == categoryFamous) {
-        return _quotes.where((q) => _isFamousQuote(q)).length;
+        return famousQuotesCount;
       } else {
-        return _quotes.where((q) => _isShortQuote(q)).length;
+        return shortQuotesCount;
       }
     } else {
-      baseQuotes = _quotes
-          .where((q) => q.category.toLowerCase() == category.toLowerCase())
-          .toList();
+      baseQuotes = _categoryQuotes(category);
     }
 
     return _applyAdditionalFilters(baseQuotes).length;
@@ -348,10 +375,7 @@ class QuoteService {
   }
 
   List<Quote> getQuotesByCategory(String category) {
-    return _quotes
-        .where(
-            (quote) => quote.category.toLowerCase() == category.toLowerCase())
-        .toList();
+    return List.of(_categoryQuotes(category));
   }
 
   List<String> getCategories() {
@@ -360,14 +384,117 @@ class QuoteService {
     return categories;
   }
 
+  Future<void> _loadRelated() async {
+    try {
+      final String jsonString =
+          await AssetLoader.loadString('assets/quote_related.json');
+      final Map<String, dynamic> data = json.decode(jsonString);
+      // 다른 corpus로 만든 파일이면 위치가 어긋나므로 사용하지 않음
+      // (명언 수가 같아도 순서/내용이 바뀌었으면 corpus_hash가 다름)
+      if (data['count'] != _quotes.length ||
+          data['corpus_hash'] != corpusHash(_quotes.map((q) => q.id))) {
+        return;
+      }
+      _relatedK = data['k'] as int;
+      _relatedNeighbors = List<int>.from(data['neighbors']);
+      _positionById = {
+        for (var i = 0; i < _quotes.length; i++) _quotes[i].id: i,
+      };
+    } catch (e) {
+      print('Error loading related quotes: $e');
+    }
+  }
+
+  Future<void> _loadIndexes() async {
+    _categoryIndex = null;
+    _famousIndex = null;
+    _shortIndex = null;
+    _famousIds = null;
+    try {
+      final String jsonString =
+          await AssetLoader.loadString('assets/quote_indexes.json');
+      final Map<String, dynamic> data = json.decode(jsonString);
+      // _loadRelated와 같은 검사: 다른 corpus로 만든 인덱스면 전체 스캔 유지
+      if (data['count'] != _quotes.length ||
+          data['corpus_hash'] != corpusHash(_quotes.map((q) => q.id))) {
+        return;
+      }
+      final positionById = {
+        for (var i = 0; i < _quotes.length; i++) _quotes[i].id: i,
+      };
+      // 인덱스의 id 배열은 id 순이므로 corpus 순서로 되돌림
+      // (getDailyQuote 등이 전체 스캔과 같은 순서의 목록을 보도록)
+      List<Quote> slice(dynamic ids) {
+        final positions = [for (final id in ids) positionById[id]!]..sort();
+        return [for (final i in positions) _quotes[i]];
+      }
+
+      final Map<String, dynamic> categories = data['categories'];
+      final categoryIndex = {
+        for (final entry in categories.entries) entry.key: slice(entry.value),
+      };
+      final famous = slice(data['famous']);
+      final short = slice(data['length']['short']);
+      _categoryIndex = categoryIndex;
+      _famousIndex = famous;
+      _shortIndex = short;
+      _famousIds = {for (final q in famous) q.id};
+    } catch (e) {
+      print('Error loading quote indexes: $e');
+    }
+  }
+
+  // scripts/translation_shards.py의 corpus_hash와 같은 계산
+  // (id 배열을 파이썬 json.dumps 형식으로 쓴 문자열의 sha256 앞 16자리)
+  static String corpusHash(Iterable<int> ids) {
+    final encoded = utf8.encode('[${ids.join(', ')}]');
+    return sha256.convert(encoded).toString().substring(0, 16);
+  }
+
+  List<Quote> getRelatedQuotes(Quote quote) {
+    final position = _positionById[quote.id];
+    if (position == null || _relatedK == 0) return [];
+    return _relatedNeighbors
+        .sublist(position * _relatedK, (position + 1) * _relatedK)
+        .where((i) => i >= 0)
+        .map((i) => _quotes[i])
+        .toList();
+  }
+
   // 즐겨찾기 관련
   Future<void> _loadFavorites() async {
     final prefs = await SharedPreferences.getInstance();
-    final favIds = prefs.getStringList('favorites') ?? [];
+    final favIds =
+        await _migrateFavoriteIds(prefs, prefs.getStringList('favorites') ?? []);
     _favorites =
         _quotes.where((q) => favIds.contains(q.id.toString())).toList();
   }
 
+  // 명언 데이터 재생성으로 id가 바뀐 경우 즐겨찾기 id 변환 (assets/quote_id_map.json)
+  Future<List<String>> _migrateFavoriteIds(
+      SharedPreferences prefs, List<String> favIds) async {
+    try {
+      final String jsonString =
+          await AssetLoader.loadString('assets/quote_id_map.json');
+      final Map<String, dynamic> data = json.decode(jsonString);
+      final version = data['version'] as String?;
+      if (version == null ||
+          prefs.getString('quote_id_map_version') == version) {
+        return favIds;
+      }
+
+      final idMap = Map<String, dynamic>.from(data['map'] ?? {});
+      final migrated =
+          favIds.map((id) => idMap[id]?.toString() ?? id).toSet().toList();
+      await prefs.setStringList('favorites', migrated);
+      await prefs.setString('quote_id_map_version', version);
+      return migrated;
+    } catch (e) {
+      print('Error migrating favorite ids: $e');
+      return favIds;
+    }
+  }
+
   Future<void> toggleFavorite(Quote quote) async {
     final prefs = await SharedPreferences.getInstance();
     final favIds = prefs.getStringList('favorites') ?? [];
@@ -1,6 +1,7 @@
 import 'dart:convert';
 import 'package:http/http.dart' as http;
 import 'package:shared_preferences/shared_preferences.dart';
+import 'asset_loader.dart';
 
 class TranslationService {
   static final TranslationService _instance = TranslationService._internal();
@@ -10,6 +11,31 @@ class TranslationService {
   // 캐시된 번역 저장
   final Map<String, Map<String, String>> _cache = {};
 
+  // 빌드 시 미리 번역된 언어별 샤드 (언어 코드 -> 명언 id -> 번역)
+  final Map<String, Map<int, String>> _bundled = {};
+
+  // scripts/pre_translate_quotes.py가 만든 assets/translations/<lang>.json 로드
+  // 샤드의 i번째 번역은 ids.json의 i번째 id에 해당
+  Future<Map<int, String>> _loadBundled(String targetLang) async {
+    final loaded = _bundled[targetLang];
+    if (loaded != null) return loaded;
+
+    final result = <int, String>{};
+    try {
+      final List<dynamic> ids = json.decode(
+          await AssetLoader.loadString('assets/translations/ids.json'));
+      final List<dynamic> texts = json.decode(
+          await AssetLoader.loadString('assets/translations/$targetLang.json'));
+      for (var i = 0; i < ids.length && i < texts.length; i++) {
+        if (texts[i] != null) result[ids[i] as int] = texts[i] as String;
+      }
+    } catch (e) {
+      // 해당 언어 샤드 없음 - 온라인 번역으로 대체
+    }
+    _bundled[targetLang] = result;
+    return result;
+  }
+
   // 로컬 번역 캐시 로드
   Future<void> loadCache() async {
     final prefs = await SharedPreferences.getInstance();
@@ -28,11 +54,17 @@ class TranslationService {
     await prefs.setString('translation_cache', json.encode(_cache));
   }
 
-  // 번역 가져오기 (캐시 우선)
-  Future<String?> getTranslation(String text, String targetLang) async {
+  // 번역 가져오기 (미리 번역된 샤드 -> 캐시 -> 온라인 순)
+  Future<String?> getTranslation(String text, String targetLang,
+      {int? quoteId}) async {
     // 영어면 번역 필요 없음
     if (targetLang == 'en') return null;
 
+    if (quoteId != null) {
+      final bundled = (await _loadBundled(targetLang))[quoteId];
+      if (bundled != null) return bundled;
+    }
+
     final cacheKey = '${text.hashCode}_$targetLang';
     
     // 캐시에서 확인
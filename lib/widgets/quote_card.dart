@@ -13,6 +13,8 @@ class QuoteCard extends StatefulWidget {
   final bool compact;
   final bool isLocked;
   final VoidCallback? onUnlockPressed;
+  // 비슷한 명언 보기 (없으면 버튼 숨김)
+  final VoidCallback? onRelatedPressed;
 
   const QuoteCard({
     super.key,
@@ -22,6 +24,7 @@ class QuoteCard extends StatefulWidget {
     this.compact = false,
     this.isLocked = false,
     this.onUnlockPressed,
+    this.onRelatedPressed,
   });
 
   @override
@@ -76,9 +79,9 @@ class _QuoteCardState extends State<QuoteCard> {
       return;
     }
 
-    // 온라인 번역 시도
-    final translation =
-        await _translationService.getTranslation(widget.quote.text, langCode);
+    // 미리 번역된 샤드, 없으면 온라인 번역 시도
+    final translation = await _translationService
+        .getTranslation(widget.quote.text, langCode, quoteId: widget.quote.id);
     if (mounted) {
       setState(() {
         _translation = translation;
@@ -306,6 +309,12 @@ class _QuoteCardState extends State<QuoteCard> {
                     icon: const Icon(Icons.copy),
                     tooltip: l10n.get('copy'),
                   ),
+                  if (widget.onRelatedPressed != null)
+                    IconButton(
+                      onPressed: widget.onRelatedPressed,
+                      icon: const Icon(Icons.auto_awesome_outlined),
+                      tooltip: l10n.get('related_quotes'),
+                    ),
                 ],
               ),
             ],
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+OpenAI API 호출용 공유 HTTP 클라이언트
+
+- 연결 풀 + keep-alive: 수천 건의 요청이 매번 TCP/TLS 핸드셰이크를 하지 않도록 연결을 재사용
+- 타임아웃을 connect/read로 나눔 (연결이 안 되는 것과 응답이 느린 것을 구분)
+- 연결 단계 오류만 제한된 횟수로 즉시 재시도, 429/5xx/타임아웃은 RetryableError로 올려서
+  ApiEngine의 백오프/레이트 리미터가 처리한다
+- httpx[http2]가 설치되어 있으면 HTTP/2 다중화 사용 가능 (http2=True)
+- stream_events()는 'stream': true 요청의 server-sent events를 도착하는 대로 JSON으로 yield
+
+사용 예:
+  configure(pool_size=8, connect_timeout=5, read_timeout=60)
+  response = get_client().post_json(API_URL, API_KEY, payload)
+  for event in get_client().stream_events(API_URL, API_KEY, payload):
+      ...
+"""
+
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from api_engine import RetryableError, parse_retry_after
+
+try:
+    import httpx
+except ImportError:  # HTTP/2는 선택 사항
+    httpx = None
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+# 연결 수립 실패만 재시도 (요청이 이미 전송됐을 수 있는 read 오류는 중복 요청이 될 수 있어 제외)
+DEFAULT_CONNECT_RETRIES = 2
+
+
+class ApiError(Exception):
+    """재시도해도 소용없는 API 오류 (4xx 등) - 스트리밍 요청에서 응답 객체 대신 올림"""
+
+    def __init__(self, status_code, text):
+        super().__init__(f"API Error: {status_code} - {text}")
+        self.status_code = status_code
+        self.text = text
+
+
+def iter_sse(lines):
+    """
+    SSE 줄(bytes/str) -> 이벤트 data를 JSON으로 yield
+    여러 data: 줄은 줄바꿈으로 합치고, 빈 줄에서 이벤트 하나를 내보낸다. 'data: [DONE]'에서 끝
+    [DONE] 없이 줄이 끝나거나(연결이 정상 종료돼도) JSON이 아닌 이벤트가 오면 스트림이 잘린 것으로 보고
+    RetryableError (정상 반환은 항상 [DONE]까지 받았다는 뜻)
+    """
+    data = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        line = line.rstrip('\r')
+        if line:
+            if line.startswith('data:'):
+                value = line[5:]
+                data.append(value[1:] if value.startswith(' ') else value)
+            # 주석(:)과 event:/id:/retry: 필드는 쓰지 않음
+            continue
+        if not data:
+            continue
+        payload = '\n'.join(data)
+        data = []
+        if payload == '[DONE]':
+            return
+        try:
+            yield json.loads(payload)
+        except json.JSONDecodeError:
+            raise RetryableError(f"Malformed stream event: {payload[:80]!r}")
+    # 마지막 빈 줄 없이 끝난 [DONE]은 인정
+    if '\n'.join(data) == '[DONE]':
+        return
+    raise RetryableError("Stream ended before [DONE]")
+
+
+class ApiClient:
+    """스레드 간에 공유하는 풀링 HTTP 클라이언트"""
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, connect_retries=DEFAULT_CONNECT_RETRIES, http2=False):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.http2 = http2
+        pool_size = max(1, int(pool_size))
+
+        if http2:
+            if httpx is None:
+                raise RuntimeError("HTTP/2 requires httpx: pip install 'httpx[http2]'")
+            limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            self._session = httpx.Client(
+                http2=True,
+                limits=limits,
+                transport=httpx.HTTPTransport(http2=True, limits=limits, retries=connect_retries),
+            )
+            self._network_errors = (httpx.TransportError,)
+        else:
+            retry = Retry(
+                total=connect_retries, connect=connect_retries, read=0, status=0, other=0,
+                backoff_factor=0.2, allowed_methods=None, raise_on_status=False,
+            )
+            # 워커 수만큼 연결을 유지해야 풀이 넘쳐서 연결을 버리고 새로 맺는 일이 없다
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+            self._session = requests.Session()
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            # ChunkedEncodingError: 스트리밍 응답이 중간에 끊긴 경우
+            self._network_errors = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+    def post_json(self, url, api_key, payload, read_timeout=None):
+        """
+        JSON POST 후 응답 반환
+        네트워크 오류/429/5xx는 RetryableError (429는 Retry-After 반영)
+        """
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {api_key}',
+        }
+        read_timeout = read_timeout or self.read_timeout
+        if self.http2:
+            timeout = httpx.Timeout(read_timeout, connect=self.connect_timeout)
+        else:
+            timeout = (self.connect_timeout, read_timeout)
+
+        try:
+            response = self._session.post(url, headers=headers, json=payload, timeout=timeout)
+        except self._network_errors as e:
+            raise RetryableError(f"Network error: {e}")
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableError(
+                f"API Error: {response.status_code}",
+                retry_after=parse_retry_after(response.headers.get('Retry-After')),
+            )
+        return response
+
+    def _raise_for_status(self, response, read_body):
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableError(
+                f"API Error: {response.status_code}",
+                retry_after=parse_retry_after(response.headers.get('Retry-After')),
+            )
+        if response.status_code != 200:
+            raise ApiError(response.status_code, read_body())
+
+    def stream_events(self, url, api_key, payload, read_timeout=None):
+        """
+        'stream': true로 POST 후 SSE 이벤트(JSON)를 도착하는 대로 yield
+        연결/스트림 도중 네트워크 오류와 429/5xx는 RetryableError, 그 밖의 비정상 응답은 ApiError
+        (read_timeout은 청크 사이 최대 대기 시간)
+        """
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream',
+            'Authorization': f'Bearer {api_key}',
+        }
+        payload = {**payload, 'stream': True}
+        read_timeout = read_timeout or self.read_timeout
+
+        try:
+            if self.http2:
+                timeout = httpx.Timeout(read_timeout, connect=self.connect_timeout)
+                with self._session.stream('POST', url, headers=headers, json=payload, timeout=timeout) as response:
+                    self._raise_for_status(response, lambda: response.read().decode('utf-8', 'replace'))
+                    yield from iter_sse(response.iter_lines())
+            else:
+                timeout = (self.connect_timeout, read_timeout)
+                with self._session.post(url, headers=headers, json=payload, timeout=timeout, stream=True) as response:
+                    self._raise_for_status(response, lambda: response.text)
+                    # 청크 단위로 읽어서 줄이 끝나는 대로 넘김 (SSE는 charset이 없으므로 bytes로 받아 UTF-8 디코딩)
+                    yield from iter_sse(response.iter_lines(chunk_size=None))
+        except self._network_errors as e:
+            raise RetryableError(f"Network error: {e}")
+
+    def close(self):
+        self._session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def configure(**options):
+    """공유 클라이언트를 옵션(ApiClient 인자)으로 다시 만듦 - 스크립트 main()에서 CLI 인자로 호출"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = ApiClient(**options)
+        return _client
+
+
+def get_client():
+    """공유 클라이언트 (configure()를 안 했으면 기본값으로 생성)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ApiClient()
+        return _client
+
+
+def add_client_args(parser):
+    """API 스크립트 공통 HTTP 옵션"""
+    parser.add_argument('--connect-timeout', type=float, default=DEFAULT_CONNECT_TIMEOUT, help='연결 타임아웃 (초)')
+    parser.add_argument('--read-timeout', type=float, default=DEFAULT_READ_TIMEOUT, help='응답 대기 타임아웃 (초)')
+    parser.add_argument('--connect-retries', type=int, default=DEFAULT_CONNECT_RETRIES,
+                        help='연결 실패 시 즉시 재시도 횟수')
+    parser.add_argument('--http2', action='store_true', help="HTTP/2 다중화 사용 (httpx[http2] 필요)")
+
+
+def configure_from_args(args):
+    """add_client_args()로 받은 인자 + 동시 요청 수로 공유 클라이언트 설정"""
+    return configure(
+        pool_size=args.concurrency,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        connect_retries=args.connect_retries,
+        http2=args.http2,
+    )
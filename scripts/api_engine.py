@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+OpenAI API 호출용 동시 실행 엔진
+토큰 버킷 레이트 리미터 + 429/5xx 적응형 백오프 + 스레드 풀
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+
+class RetryableError(Exception):
+    """429/5xx/타임아웃 등 다시 시도하면 성공할 수 있는 오류"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def estimate_tokens(text):
+    """대략적인 토큰 수 추정 (영문 기준 4글자 ≈ 1토큰)"""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더 값을 초 단위로 변환 (없거나 잘못된 값이면 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """초당 rate만큼 채워지고 capacity까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount=1.0):
+        """amount만큼 토큰을 예약하고 기다려야 할 시간(초)을 반환"""
+        # 한 번에 capacity보다 큰 요청은 capacity만큼만 기다림 (영원히 막히지 않도록)
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, amount=1.0):
+        """토큰이 생길 때까지 블로킹"""
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    요청 수(requests/sec)와 토큰 수(tokens/min)를 동시에 제한하는 리미터
+
+    429를 받으면 모든 워커가 함께 쉬도록 전역 대기 시간을 설정하고,
+    요청 속도를 절반으로 줄였다가 성공이 이어지면 조금씩 원래 속도로 복구한다 (AIMD).
+    """
+
+    def __init__(self, requests_per_sec=3.0, tokens_per_min=None, min_requests_per_sec=0.2):
+        self.max_rps = float(requests_per_sec)
+        self.min_rps = min(float(min_requests_per_sec), self.max_rps)
+        self._requests = TokenBucket(self.max_rps, max(1.0, self.max_rps))
+        self._tokens = None
+        if tokens_per_min:
+            self._tokens = TokenBucket(tokens_per_min / 60.0, tokens_per_min)
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_sec(self):
+        return self._requests.rate
+
+    def acquire(self, tokens=0):
+        """요청 1건(과 추정 토큰 수)만큼 허용될 때까지 블로킹"""
+        while True:
+            with self._lock:
+                pause = self._pause_until - time.monotonic()
+            if pause <= 0:
+                break
+            time.sleep(pause)
+        self._requests.acquire(1)
+        if self._tokens is not None and tokens:
+            self._tokens.acquire(tokens)
+
+    def on_success(self):
+        """성공 시 요청 속도를 조금씩 복구 (additive increase)"""
+        with self._lock:
+            if self._requests.rate < self.max_rps:
+                self._requests.rate = min(self.max_rps, self._requests.rate + self.max_rps * 0.05)
+
+    def on_throttle(self, delay):
+        """429/5xx 시 전역 대기 + 요청 속도 절반 (multiplicative decrease)"""
+        with self._lock:
+            self._pause_until = max(self._pause_until, time.monotonic() + delay)
+            self._requests.rate = max(self.min_rps, self._requests.rate / 2)
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """지수 백오프 + full jitter"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class ApiEngine:
+    """
+    작업 목록을 스레드 풀에서 동시에 실행하는 엔진
+
+    worker(job)는 API를 1회 호출하고 결과를 반환하거나,
+    재시도가 필요하면 RetryableError를 발생시킨다.
+    """
+
+    def __init__(self, limiter, concurrency=4, max_retries=5, backoff_base=1.0, backoff_cap=60.0, metrics=None,
+                 budget=None):
+        self.limiter = limiter
+        self.concurrency = max(1, int(concurrency))
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        # metrics.Metrics - 요청 지연/재시도/실패를 라벨별로 기록 (없으면 기록 안 함)
+        self.metrics = metrics
+        # token_budget.BudgetGuard - 예산을 넘으면 남은 작업은 호출 없이 None (없으면 제한 없음)
+        self.budget = budget
+        # 마지막 run의 {future: job}과 yield한 future (중단 시 drain이 사용)
+        self._futures = {}
+        self._reported = set()
+
+    def _call(self, worker, job, tokens, labels):
+        if self.budget is None:
+            return self._attempt(worker, job, tokens, labels)
+        if not self.budget.reserve():
+            if self.metrics is not None:
+                self.metrics.inc('budget_skipped', **labels)
+            return None
+        try:
+            return self._attempt(worker, job, tokens, labels)
+        finally:
+            self.budget.release()
+
+    def _attempt(self, worker, job, tokens, labels):
+        attempt = 0
+        while True:
+            self.limiter.acquire(tokens)
+            started = time.monotonic()
+            try:
+                result = worker(job)
+            except RetryableError as e:
+                if self.metrics is not None:
+                    self.metrics.inc('requests', **labels)
+                    self.metrics.observe('latency_s', time.monotonic() - started, **labels)
+                if attempt >= self.max_retries:
+                    print(f"  [GIVE UP] {e} (after {attempt + 1} attempts)")
+                    if self.metrics is not None:
+                        self.metrics.inc('failures', **labels)
+                    return None
+                delay = e.retry_after
+                if delay is None:
+                    delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+                self.limiter.on_throttle(delay)
+                if self.metrics is not None:
+                    self.metrics.inc('retries', **labels)
+                attempt += 1
+                continue
+            if self.metrics is not None:
+                self.metrics.inc('requests', **labels)
+                self.metrics.observe('latency_s', time.monotonic() - started, **labels)
+                if result is None:
+                    self.metrics.inc('failures', **labels)
+            self.limiter.on_success()
+            return result
+
+    def run(self, jobs, worker, token_cost=None, labels=None):
+        """
+        jobs를 동시에 실행하고 완료되는 순서대로 (job, result)를 yield
+        token_cost(job)로 토큰 수를 추정하면 tokens/min 제한에 반영된다
+        labels(job)는 메트릭 라벨 dict (예: {'lang': 'ko'})
+        Ctrl-C 등으로 중단되면 호출자가 drain()으로 끝났지만 받지 못한 결과를 가져간다
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {
+                pool.submit(
+                    self._call, worker, job,
+                    token_cost(job) if token_cost else 0,
+                    labels(job) if labels else {},
+                ): job
+                for job in jobs
+            }
+            self._futures, self._reported = futures, set()
+            try:
+                for future in as_completed(futures):
+                    self._reported.add(future)
+                    yield futures[future], future.result()
+            finally:
+                # Ctrl-C 등으로 중단되면 아직 시작하지 않은 작업은 취소
+                for future in futures:
+                    future.cancel()
+
+    def drain(self):
+        """
+        중단된 run 정리: 시작하지 않은 작업은 취소하고 진행 중인 요청이 끝나길 기다린 뒤,
+        끝났지만 아직 yield하지 못한 (job, result) 목록 반환 (호출자가 저널에 기록)
+        """
+        for future in self._futures:
+            future.cancel()
+        wait(self._futures)
+        return [
+            (job, future.result())
+            for future, job in self._futures.items()
+            if future not in self._reported and not future.cancelled() and future.exception() is None
+        ]
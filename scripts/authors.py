@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+작가 이름 정규화 + 유명인 판정 (Aho-Corasick)
+
+- 'T.S. Eliot' / 'T. S. Eliot', 'Thomas A. Edison' / 'Thomas Edison'(별칭 표) 같은 표기 차이를
+  하나의 정규 작가로 묶고 안정적인 author_id(슬러그)를 붙인다 (중간 이니셜이 다르면 다른 사람)
+- _famousPeople 이름 수백 개를 작가마다 하나씩 부분 문자열 검사하는 대신,
+  Aho-Corasick 오토마톤으로 작가 문자열을 한 번만 훑어서 판정한다 (앱과 같은 부분 일치 의미)
+
+사용 예:
+  python scripts/authors.py                 # assets/quotes.json에 author_id/famous 추가
+  python scripts/authors.py --report        # 묶인 작가 표기 목록만 출력
+"""
+
+import argparse
+import os
+import re
+import unicodedata
+from collections import Counter, deque
+
+from corpus_io import iter_records, write_records
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+QUOTE_SERVICE_FILE = os.path.join(SCRIPT_DIR, '..', 'lib', 'services', 'quote_service.dart')
+
+# 규칙으로 잡히지 않는 별칭 (정규화 키 -> 정규화 키)
+# 중간 이니셜은 키에 남기므로 ('George H. W. Bush' != 'George W. Bush') 이니셜 유무만 다른 같은 사람은 여기에 적는다
+ALIASES = {
+    'einstein': 'albert einstein',
+    'edison': 'thomas edison',
+    'thomas a edison': 'thomas edison',
+    'thomas alva edison': 'thomas edison',
+    'john kennedy': 'john f kennedy',
+    'jfk': 'john f kennedy',
+    'franklin roosevelt': 'franklin d roosevelt',
+    'fdr': 'franklin d roosevelt',
+    'john rockefeller': 'john d rockefeller',
+    'pearl buck': 'pearl s buck',
+    'gandhi': 'mahatma gandhi',
+    'mohandas gandhi': 'mahatma gandhi',
+    'mohandas k gandhi': 'mahatma gandhi',
+    'gautama buddha': 'buddha',
+    'the buddha': 'buddha',
+    'martin luther king': 'martin luther king jr',
+    'mlk': 'martin luther king jr',
+    'theodor seuss geisel': 'dr seuss',
+    'saint teresa of calcutta': 'mother teresa',
+    'lao-tzu': 'lao tzu',
+    'laozi': 'lao tzu',
+    'lao tse': 'lao tzu',
+    'kong fuzi': 'confucius',
+    'anonymous': 'unknown',
+    'unknown author': 'unknown',
+}
+
+
+def load_famous_people(path=QUOTE_SERVICE_FILE):
+    """quote_service.dart의 _famousPeople 목록을 그대로 읽어옴 (앱과 같은 목록 유지)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    match = re.search(r'_famousPeople\s*=\s*\[(.*?)\];', source, re.S)
+    if not match:
+        raise ValueError(f"_famousPeople not found in {path}")
+    body = re.sub(r'//[^\n]*', '', match.group(1))
+    return [m.group(2) for m in re.finditer(r"(['\"])(.*?)(?<!\\)\1", body)]
+
+
+def author_key(name):
+    """
+    비교용 정규화 키
+    소문자, 악센트/마침표 제거 ('T.S. Eliot' / 'T. S. Eliot' -> 't s eliot')
+    중간 이니셜은 사람을 구분하므로 남기고, 같은 사람의 이니셜 생략 표기는 ALIASES로 묶는다
+    """
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    text = re.sub(r'[.,]', ' ', text)
+    key = ' '.join(text.split()) or 'unknown'
+    return ALIASES.get(key, key)
+
+
+def author_slug(key):
+    return re.sub(r'[^a-z0-9]+', '-', key).strip('-') or 'unknown'
+
+
+class AhoCorasick:
+    """여러 패턴의 부분 문자열 일치를 텍스트 길이에 비례한 시간에 찾는 오토마톤"""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [set()]
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build()
+
+    def _add(self, pattern):
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            state = nxt
+        self._out[state].add(pattern)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def matches(self, text):
+        """패턴이 하나라도 나타나면 True"""
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._out[state]:
+                return True
+        return False
+
+
+class AuthorMatcher:
+    """작가 문자열 -> (author_id, famous) 판정 (작가별 결과 캐시)"""
+
+    def __init__(self, famous_people):
+        self._famous = AhoCorasick([person.lower() for person in famous_people])
+        self._cache = {}
+
+    def is_famous(self, author):
+        """QuoteService.isFamousPerson()과 같은 의미 (소문자 부분 문자열 일치)"""
+        return self._famous.matches((author or '').lower())
+
+    def lookup(self, author):
+        result = self._cache.get(author)
+        if result is None:
+            key = author_key(author)
+            result = (author_slug(key), self.is_famous(author))
+            self._cache[author] = result
+        return result
+
+
+def canonical_names(records):
+    """author_id -> 가장 많이 쓰인 표기 (동률이면 더 긴 표기)"""
+    variants = {}
+    for record in records:
+        author = record.get('author') or 'Unknown'
+        variants.setdefault(author_slug(author_key(author)), Counter())[author] += 1
+    return {
+        author_id: max(counter.items(), key=lambda item: (item[1], len(item[0])))[0]
+        for author_id, counter in variants.items()
+    }
+
+
+def enrich_authors(records, matcher):
+    """레코드마다 author_id와 famous 플래그를 붙여서 yield (한 번 훑기)"""
+    for record in records:
+        author_id, famous = matcher.lookup(record.get('author') or 'Unknown')
+        record = dict(record)
+        record['author_id'] = author_id
+        record['famous'] = famous
+        yield record
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Canonicalize authors and flag famous people')
+    parser.add_argument('--input', default='assets/quotes.json')
+    parser.add_argument('--output', default=None, help='기본은 입력 파일을 그대로 갱신')
+    parser.add_argument('--report', action='store_true', help='여러 표기로 묶인 작가만 출력하고 종료')
+    args = parser.parse_args()
+
+    if args.report:
+        variants = {}
+        for record in iter_records(args.input):
+            author = record.get('author') or 'Unknown'
+            variants.setdefault(author_slug(author_key(author)), set()).add(author)
+        for author_id, names in sorted(variants.items()):
+            if len(names) > 1:
+                print(f"{author_id}: {sorted(names)}")
+        return
+
+    matcher = AuthorMatcher(load_famous_people())
+    records = list(enrich_authors(iter_records(args.input), matcher))
+    write_records(args.output or args.input, records)
+
+    print(f"Authors: {len({r['author_id'] for r in records})} canonical "
+          f"from {len({r.get('author') for r in records})} spellings")
+    print(f"Famous quotes: {sum(r['famous'] for r in records)} / {len(records)}")
+
+
+if __name__ == '__main__':
+    main()
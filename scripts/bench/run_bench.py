@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+데이터 파이프라인 벤치마크
+
+합성 corpus 크기별로 로드/파싱, 중복 제거, 인덱스 빌드, 번들/저장소/검색 인덱스 생성 시간과 검색 지연을 재고,
+번역 엔진은 지연/429 비율을 설정한 로컬 스텁 API에 대해 처리량을 잰다.
+결과는 JSON으로 출력해서 커밋 간 회귀를 비교할 수 있게 한다.
+
+사용 예:
+  python scripts/bench/run_bench.py --sizes 2000,20000,100000 --output bench.json
+  python scripts/bench/run_bench.py --sizes 1000000 --skip dedup --translate-jobs 0
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from authors import load_famous_people  # noqa: E402
+from build_corpus import Dedup  # noqa: E402
+from build_indexes import build_indexes  # noqa: E402
+from corpus_io import load_records, write_records  # noqa: E402
+from corpus_store import CorpusStore, build_store  # noqa: E402
+from quote_bundle import build_bundle  # noqa: E402
+from search_index import SearchIndex, build_index, tokenize  # noqa: E402
+from stub_api import StubServer  # noqa: E402
+from synthetic import synthetic_quotes  # noqa: E402
+
+BENCHMARKS = ['write', 'json_load', 'stream_load', 'dedup', 'index', 'bundle', 'store', 'search']
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def bench_corpus(size, workdir, skip, famous_people):
+    """크기 1개에 대한 corpus 처리 단계별 시간"""
+    path = os.path.join(workdir, f'quotes_{size}.json')
+    results = {'size': size}
+
+    seconds, _ = _timed(lambda: write_records(path, synthetic_quotes(size)))
+    if 'write' not in skip:
+        results['write_s'] = round(seconds, 4)
+    results['json_bytes'] = os.path.getsize(path)
+
+    if 'json_load' not in skip:
+        def json_load():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        results['json_load_s'] = round(_timed(json_load)[0], 4)
+
+    seconds, records = _timed(lambda: load_records(path))
+    if 'stream_load' not in skip:
+        results['stream_load_s'] = round(seconds, 4)
+
+    if 'dedup' not in skip:
+        seconds, kept = _timed(lambda: sum(1 for _ in Dedup().run(records)))
+        results['dedup_s'] = round(seconds, 4)
+        results['dedup_kept'] = kept
+
+    if 'index' not in skip:
+        results['index_s'] = round(_timed(lambda: build_indexes(records, famous_people, days=365))[0], 4)
+
+    if 'bundle' not in skip:
+        bundle_path = os.path.join(workdir, f'quotes_{size}.bundle')
+        seconds, bundle_bytes = _timed(lambda: build_bundle(records, bundle_path, compress=True))
+        results['bundle_s'] = round(seconds, 4)
+        results['bundle_bytes'] = bundle_bytes
+
+    if 'store' not in skip:
+        store_path = os.path.join(workdir, f'quotes_{size}.sqlite')
+        results['store_build_s'] = round(_timed(lambda: build_store(store_path, records))[0], 4)
+        target = records[len(records) // 2]['id']
+
+        def open_and_get():
+            with CorpusStore(store_path, readonly=True) as store:
+                return store.get(target)
+        results['store_open_get_ms'] = round(_timed(open_and_get)[0] * 1000, 3)
+        results['store_bytes'] = os.path.getsize(store_path)
+
+    if 'search' not in skip:
+        index_path = os.path.join(workdir, f'quotes_{size}.idx')
+        seconds, (_, index_bytes) = _timed(lambda: build_index((r['quote'] for r in records), index_path))
+        results['search_build_s'] = round(seconds, 4)
+        results['search_index_bytes'] = index_bytes
+        queries = [' '.join(tokenize(r['quote'])[:2]) for r in records[::max(1, len(records) // 200)]]
+        with SearchIndex(index_path) as index:
+            seconds, _ = _timed(lambda: [index.search(query) for query in queries])
+        results['search_query_ms'] = round(seconds / len(queries) * 1000, 4)
+
+    os.remove(path)
+    return results
+
+
+def bench_translation(jobs, latency, rate_429, concurrency, rps, batch_size):
+    """번역 엔진을 스텁 API에 대해 실행 (단건 + 배치)"""
+    import pre_translate_quotes as pt
+    from api_engine import ApiEngine, RateLimiter
+
+    quotes = list(synthetic_quotes(max(1, jobs // len(pt.TARGET_LANGUAGES) + 1), seed=7))
+    work = [
+        (q['id'], q['quote'], code, name)
+        for q in quotes
+        for code, name in pt.TARGET_LANGUAGES.items()
+    ][:jobs]
+
+    results = {
+        'jobs': len(work), 'latency_s': latency, 'rate_429': rate_429,
+        'concurrency': concurrency, 'rps': rps,
+    }
+    with StubServer(latency=latency, rate_429=rate_429, retry_after=0.05) as server:
+        pt.API_URL = server.url
+        pt.API_KEY = pt.API_KEY or 'bench'
+
+        engine = ApiEngine(RateLimiter(requests_per_sec=rps), concurrency=concurrency, max_retries=8)
+        seconds, done = _timed(lambda: sum(
+            1 for _, translation in engine.run(work, lambda job: pt.translate_quote(*job[1:]), pt.translation_token_cost)
+            if translation
+        ))
+        stats = server.stats.snapshot()
+        results['single'] = {
+            'seconds': round(seconds, 4), 'translated': done,
+            'per_s': round(done / seconds, 2) if seconds else None, **stats,
+        }
+
+        batches = pt.make_batches(work, 'quotes', batch_size)
+        engine = ApiEngine(RateLimiter(requests_per_sec=rps), concurrency=concurrency, max_retries=8)
+        seconds, done = _timed(lambda: sum(
+            len(result or {}) for _, result in engine.run(batches, pt.translate_batch, pt.batch_token_cost)
+        ))
+        after = server.stats.snapshot()
+        results['batched'] = {
+            'seconds': round(seconds, 4), 'translated': done, 'batch_size': batch_size,
+            'per_s': round(done / seconds, 2) if seconds else None,
+            **{key: after[key] - stats[key] for key in after},
+        }
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the quotes data pipeline')
+    parser.add_argument('--sizes', default='2000,20000,100000', help='corpus 크기 목록 (쉼표 구분, 최대 1000000)')
+    parser.add_argument('--skip', default='', help=f"건너뛸 항목 (쉼표 구분): {', '.join(BENCHMARKS)}")
+    parser.add_argument('--translate-jobs', type=int, default=600, help='번역 엔진 벤치 작업 수 (0이면 생략)')
+    parser.add_argument('--latency', type=float, default=0.05, help='스텁 API 응답 지연 (초)')
+    parser.add_argument('--rate-429', type=float, default=0.05, help='스텁 API 429 비율')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--rps', type=float, default=50.0)
+    parser.add_argument('--batch-size', type=int, default=20)
+    parser.add_argument('--output', default=None, help='결과 JSON 파일 (기본 stdout)')
+    args = parser.parse_args()
+
+    skip = {name.strip() for name in args.skip.split(',') if name.strip()}
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'corpus': [],
+    }
+
+    famous_people = load_famous_people()
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+            print(f"Benchmarking corpus of {size} quotes...", file=sys.stderr)
+            report['corpus'].append(bench_corpus(size, workdir, skip, famous_people))
+
+    if args.translate_jobs > 0:
+        print(f"Benchmarking translation engine ({args.translate_jobs} jobs)...", file=sys.stderr)
+        report['translation'] = bench_translation(
+            args.translate_jobs, args.latency, args.rate_429, args.concurrency, args.rps, args.batch_size
+        )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
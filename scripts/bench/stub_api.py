@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+벤치마크/테스트용 로컬 OpenAI chat completions 스텁 서버
+지연 시간과 429 비율을 설정할 수 있고, 요청 수/연결 수를 센다
+'stream': true 요청에는 응답을 작은 조각으로 나눠 SSE(chunked)로 보낸다 (--stream-interval 간격,
+--stream-truncate를 주면 일부 요청은 [DONE] 없이 중간에 끊어서 깨진 꼬리를 흉내냄)
+--certfile/--keyfile을 주면 TLS로 열어서 keep-alive로 핸드셰이크가 줄었는지 확인할 수 있다
+
+사용 예:
+  python scripts/bench/stub_api.py --port 8765 --latency 0.05 --rate-429 0.1
+  OPENAI_API_KEY=x OPENAI_API_URL=http://127.0.0.1:8765/v1/chat/completions python scripts/pre_translate_quotes.py
+
+  openssl req -x509 -newkey rsa:2048 -nodes -days 1 -subj /CN=127.0.0.1 \
+      -addext subjectAltName=IP:127.0.0.1 -keyout stub.key -out stub.crt
+  python scripts/bench/stub_api.py --certfile stub.crt --keyfile stub.key
+  REQUESTS_CA_BUNDLE=stub.crt OPENAI_API_URL=https://127.0.0.1:8765/v1/chat/completions ...
+"""
+
+import argparse
+import json
+import random
+import ssl
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.connections = 0
+
+    def snapshot(self):
+        with self.lock:
+            return {'requests': self.requests, 'throttled': self.throttled, 'connections': self.connections}
+
+
+def _completion_text(body):
+    """요청 종류(배치 번역 / 명언 생성 / 단건 번역)에 맞는 가짜 응답 텍스트"""
+    content = body['messages'][-1]['content']
+    if body.get('response_format'):
+        items = json.loads(content).get('items', [])
+        text = json.dumps({'translations': [
+            {'key': item['key'], 'translation': f"[{item['lang']}] {item['text']}"} for item in items
+        ]}, ensure_ascii=False)
+    elif content.startswith('Generate'):
+        category = content.split('about ', 1)[-1].split('.', 1)[0].strip()
+        text = '\n'.join(f'"Stub {category} quote number {i} for testing" - Stub Author {i}' for i in range(30))
+    else:
+        text = f"[stub] {content}"
+    return text
+
+
+def _usage(body, text):
+    return {'prompt_tokens': len(json.dumps(body)) // 4, 'completion_tokens': len(text) // 4}
+
+
+def _completion(body):
+    text = _completion_text(body)
+    return {
+        'choices': [{'message': {'role': 'assistant', 'content': text}}],
+        'usage': _usage(body, text),
+    }
+
+
+# SSE 조각 크기 (글자 수) - 줄 경계와 무관하게 잘라서 클라이언트가 줄을 이어 붙이게 함
+STREAM_PIECE = 7
+
+
+def make_handler(stats, latency, rate_429, retry_after, seed, stream_interval=0.0, stream_truncate=0.0):
+    rng = random.Random(seed)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            with stats.lock:
+                stats.connections += 1
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, payload, headers=None):
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _chunk(self, text):
+            data = text.encode('utf-8')
+            self.wfile.write(f'{len(data):x}\r\n'.encode('ascii') + data + b'\r\n')
+            self.wfile.flush()
+
+        def _stream(self, body, truncate):
+            """chat.completion.chunk 이벤트를 chunked transfer로 보냄"""
+            text = _completion_text(body)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            pieces = [text[i:i + STREAM_PIECE] for i in range(0, len(text), STREAM_PIECE)]
+            if truncate:
+                pieces = pieces[:len(pieces) * 2 // 3]
+            for piece in pieces:
+                event = {'object': 'chat.completion.chunk', 'choices': [{'index': 0, 'delta': {'content': piece}}]}
+                self._chunk(f'data: {json.dumps(event, ensure_ascii=False)}\n\n')
+                if stream_interval:
+                    time.sleep(stream_interval)
+            if truncate:
+                # 끝 청크 없이 연결을 닫아서 스트림 도중 끊긴 상황을 만든다
+                self.close_connection = True
+                return
+            event = {'object': 'chat.completion.chunk', 'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]}
+            self._chunk(f'data: {json.dumps(event)}\n\n')
+            if (body.get('stream_options') or {}).get('include_usage'):
+                event = {'object': 'chat.completion.chunk', 'choices': [], 'usage': _usage(body, text)}
+                self._chunk(f'data: {json.dumps(event)}\n\n')
+            self._chunk('data: [DONE]\n\n')
+            self._chunk('')
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            with stats.lock:
+                stats.requests += 1
+                throttled = rng.random() < rate_429
+                if throttled:
+                    stats.throttled += 1
+                truncate = rng.random() < stream_truncate
+            if latency:
+                time.sleep(latency)
+            if throttled:
+                self._send(429, {'error': {'message': 'Rate limit reached (stub)'}},
+                           {'Retry-After': str(retry_after)})
+            elif body.get('stream'):
+                self._stream(body, truncate)
+            else:
+                self._send(200, _completion(body))
+
+    return Handler
+
+
+class StubServer:
+    """백그라운드 스레드에서 도는 스텁 서버 (with 문으로 사용)"""
+
+    def __init__(self, port=0, latency=0.0, rate_429=0.0, retry_after=0.1, seed=0, certfile=None, keyfile=None,
+                 stream_interval=0.0, stream_truncate=0.0):
+        self.stats = StubStats()
+        self._server = ThreadingHTTPServer(
+            ('127.0.0.1', port),
+            make_handler(self.stats, latency, rate_429, retry_after, seed, stream_interval, stream_truncate),
+        )
+        self._server.daemon_threads = True
+        self.tls = bool(certfile)
+        if self.tls:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        scheme = 'https' if self.tls else 'http'
+        return f'{scheme}://127.0.0.1:{self._server.server_address[1]}/v1/chat/completions'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stub for the OpenAI chat completions API')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help='응답 지연 (초)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='429를 돌려줄 확률')
+    parser.add_argument('--retry-after', type=float, default=0.1, help='429 응답의 Retry-After (초)')
+    parser.add_argument('--stream-interval', type=float, default=0.005, help='SSE 조각 사이 지연 (초)')
+    parser.add_argument('--stream-truncate', type=float, default=0.0, help='SSE 응답을 중간에 끊을 확률')
+    parser.add_argument('--certfile', default=None, help='TLS 인증서 (PEM)')
+    parser.add_argument('--keyfile', default=None, help='TLS 개인 키 (PEM)')
+    args = parser.parse_args()
+
+    with StubServer(args.port, args.latency, args.rate_429, args.retry_after,
+                    certfile=args.certfile, keyfile=args.keyfile,
+                    stream_interval=args.stream_interval, stream_truncate=args.stream_truncate) as server:
+        print(f"Stub API listening on {server.url}")
+        try:
+            while True:
+                time.sleep(5)
+                print(json.dumps(server.stats.snapshot()))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
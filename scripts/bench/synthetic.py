@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 명언 corpus 생성 (2천 ~ 100만 개)
+일부는 기존 문장의 사소한 변형으로 만들어 유사 중복 검출 비용도 현실적으로 나오게 한다
+
+사용 예:
+  python scripts/bench/synthetic.py 100000 /tmp/quotes_100k.json
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus_io import write_records  # noqa: E402
+
+CATEGORIES = ['happiness', 'inspiration', 'love', 'success', 'truth', 'poetry', 'death', 'romance', 'science', 'time']
+WORDS = (
+    'life love time truth light heart mind dream hope fear change world people work great small '
+    'never always only courage failure success happy happiness future past present journey road '
+    'begin end learn know find give take make keep believe become remember forget choose live die '
+    'beautiful simple strong free wise brave kind quiet deep true real whole every nothing something'
+).split()
+FIRST_NAMES = 'Albert Maya Mark Helen Ralph Oscar Lao Eleanor Winston Carl Marie Henry Steve Mahatma Jane'.split()
+LAST_NAMES = 'Einstein Angelou Twain Keller Emerson Wilde Tzu Roosevelt Churchill Sagan Curie Thoreau Jobs Gandhi Austen'.split()
+
+
+def synthetic_quotes(count, seed=42, near_duplicate_rate=0.05):
+    """count개의 {'id', 'quote', 'author', 'category', 'tags'} 레코드 생성"""
+    rng = random.Random(seed)
+    authors = [f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}' for _ in range(max(50, count // 40))]
+    recent = []
+    for i in range(count):
+        if recent and rng.random() < near_duplicate_rate:
+            words = rng.choice(recent).rstrip('.').split()
+            words.insert(rng.randrange(len(words)), rng.choice(WORDS))
+            text = ' '.join(words) + '.'
+        else:
+            words = [rng.choice(WORDS) for _ in range(rng.randint(6, 30))]
+            text = ' '.join(words).capitalize() + '.'
+            recent.append(text)
+            if len(recent) > 1000:
+                recent.pop(0)
+        yield {
+            'id': i,
+            'quote': text,
+            'author': rng.choice(authors),
+            'category': rng.choice(CATEGORIES),
+            'tags': [],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic quotes corpus')
+    parser.add_argument('count', type=int)
+    parser.add_argument('output')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    print(f"Wrote {write_records(args.output, synthetic_quotes(args.count, args.seed))} quotes to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+명언 corpus 단일 빌드 파이프라인 (generate_quotes.py / create_commercial_quotes.py /
+expand_quotes_with_gpt.py가 각자 assets/quotes.json을 통째로 다시 쓰던 것을 대체)
+
+  source -> normalize -> dedup -> enrich -> ids -> tags -> [emit quotes.json, index, related, search]
+
+- 소스: 스크립트의 기본 목록 + scripts/sources/gpt_quotes.jsonl (expand_quotes_with_gpt.py가 추가하는 곳,
+  저장소에 커밋) + --extra 파일. assets/quotes.json은 출력일 뿐이라 직접 고치거나 덧붙이면 안 된다
+- 기존 quotes.json에 있는데 어느 소스에도 없는 명언(orphan)이 있으면 멈춘다
+  (--adopt-orphans: GPT 소스로 옮겨서 유지, --drop-orphans: 버림)
+- 각 단계는 레코드를 하나씩 흘려보내는 generator
+- 단계마다 (이전 단계 키 + 단계 이름/버전/파라미터)로 키를 만들고, 결과를
+  scripts/.cache/build/<stage>-<key>.jsonl에 남긴다. 키가 같으면 해당 단계까지 건너뛰고
+  캐시된 결과부터 다시 흘려보낸다
+- 소스가 조금 바뀌면 키가 달라지지만, 레코드마다 독립인 단계(normalize, enrich)는 레코드 단위 memo를,
+  dedup은 문장별 MinHash 서명 memo를 재사용해서 바뀐 레코드만 다시 계산한다
+  (ids/tags는 corpus 전체를 보는 단계라 다시 돌지만 가볍다)
+- 기본 목록을 2,000개까지 반복해서 채우지 않는다 (중복은 dedup 단계에서 제거)
+- id는 정규화된 원문에서 만든 안정 id라 재빌드해도 바뀌지 않는다. 기존 quotes.json과
+  비교한 이전 id -> 새 id 표를 assets/quote_id_map.json에 남기고(앱 즐겨찾기 이전용),
+  quotes_translations.json의 키도 새 id로 옮긴다 (언어별 샤드가 있으면 새 corpus 순서로 다시 정렬)
+- 도구용 SQLite 저장소(corpus_store.py)도 새 corpus + 번역으로 다시 만든다
+- tags 단계는 TF-IDF 상위 단어로 빈 tags를 채우고, "비슷한 명언" 이웃 배열을
+  assets/quote_related.json에 남긴다 (related_quotes.py)
+- 영어 + 번역 언어별 전문 검색 인덱스를 assets/search/에 만든다 (search_index.py, 번역 파일이 바뀌어도 다시 만듦)
+
+사용 예:
+  python scripts/build_corpus.py
+  python scripts/build_corpus.py --extra my_quotes.jsonl --similarity 0.8
+  python scripts/build_corpus.py --adopt-orphans      # 예전에 quotes.json에 직접 덧붙인 명언을 소스로 옮김
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import unicodedata
+
+from authors import AuthorMatcher, load_famous_people
+from build_indexes import VERSION as INDEX_VERSION, build_indexes, length_bucket
+from corpus_io import RecordWriter, iter_items, iter_records, write_items, write_records
+from corpus_store import DEFAULT_STORE_FILE, build_store
+from near_duplicates import NearDuplicateIndex
+from related_quotes import DEFAULT_K, DEFAULT_TAGS_PER_QUOTE, TfidfModel, auto_tags, write_related
+from search_index import (
+    MANIFEST_NAME as SEARCH_MANIFEST_NAME, VERSION as SEARCH_VERSION, build_indexes as build_search_indexes,
+)
+from translation_shards import MANIFEST_NAME, shards_from_monolithic
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache', 'build')
+# GPT로 생성한 명언 소스 (expand_quotes_with_gpt.py가 여기에 추가하고, 빌드가 읽는다)
+GPT_SOURCE_FILE = os.path.join(SCRIPT_DIR, 'sources', 'gpt_quotes.jsonl')
+MANIFEST_FILE = os.path.join(CACHE_DIR, 'manifest.json')
+QUOTES_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quotes.json')
+INDEXES_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quote_indexes.json')
+# 이전 id -> 새 id 변환표 (앱이 즐겨찾기 id를 옮길 때 사용)
+ID_MAP_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quote_id_map.json')
+TRANSLATIONS_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quotes_translations.json')
+SHARDS_DIR = os.path.join(PROJECT_ROOT, 'assets', 'translations')
+RELATED_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quote_related.json')
+SEARCH_DIR = os.path.join(PROJECT_ROOT, 'assets', 'search')
+
+
+def _digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()[:16]
+
+
+# ---------------------------------------------------------------- source
+
+def builtin_sources():
+    """generate_quotes.py / create_commercial_quotes.py의 기본 목록 (반복 채우기 없이)"""
+    from create_commercial_quotes import categories
+    from generate_quotes import COMMERCIAL_QUOTES
+
+    for category, items in categories.items():
+        for item in items:
+            yield {'quote': item['quote'], 'author': item['author'], 'category': category, 'tags': []}
+    for item in COMMERCIAL_QUOTES:
+        yield {'quote': item['quote'], 'author': item['author'], 'category': item['category'], 'tags': []}
+
+
+def file_source(path):
+    """추가 소스 파일 (JSON 배열/JSONL, 예: GPT로 생성한 명언)"""
+    for record in iter_records(path):
+        yield {
+            'quote': record['quote'],
+            'author': record.get('author', 'Unknown'),
+            'category': record.get('category', ''),
+            'tags': list(record.get('tags') or []),
+        }
+
+
+def source_key(extra_paths, include_builtin=True):
+    """소스 내용의 해시 (파일은 바이트, 기본 목록은 레코드 자체)"""
+    parts = []
+    if include_builtin:
+        parts.append(list(builtin_sources()))
+    for path in extra_paths:
+        with open(path, 'rb') as f:
+            parts.append(hashlib.sha256(f.read()).hexdigest())
+    return _digest('source', *parts)
+
+
+def read_sources(extra_paths, include_builtin=True):
+    if include_builtin:
+        yield from builtin_sources()
+    for path in extra_paths:
+        yield from file_source(path)
+
+
+def text_key(text):
+    """같은 문장 비교용 키 (대소문자/공백 무시)"""
+    return ' '.join(text.casefold().split())
+
+
+def find_orphans(previous_records, source_records):
+    """이전 corpus에 있는데 어느 소스에도 없는 명언 (정규화한 원문 기준)"""
+    normalize = Normalize()
+    in_sources = set()
+    for record in source_records:
+        normalized = normalize.transform(record)
+        if normalized is not None:
+            in_sources.add(text_key(normalized['quote']))
+    return [record for record in previous_records if text_key(record['quote']) not in in_sources]
+
+
+def adopt_orphans(orphans, path=GPT_SOURCE_FILE):
+    """orphan을 GPT 소스 파일 뒤에 덧붙임 (id/파생 필드는 빌드가 다시 만든다)"""
+    records = list(iter_records(path)) if os.path.exists(path) else []
+    records.extend(
+        {'quote': r['quote'], 'author': r.get('author', 'Unknown'), 'category': r.get('category', ''),
+         'tags': list(r.get('tags') or [])}
+        for r in orphans
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return write_records(path, records)
+
+
+# ---------------------------------------------------------------- stages
+
+class Stage:
+    """파이프라인 단계: name/version/params가 캐시 키에 들어간다"""
+    name = ''
+    version = 1
+
+    def params(self):
+        return {}
+
+    def run(self, records):
+        raise NotImplementedError
+
+    def memo_path(self, memo_dir, kind='memo', params=None):
+        """소스와 무관한 memo 파일 경로 (단계 이름/버전/파라미터가 같으면 빌드 사이에 재사용)"""
+        key = _digest(self.name, self.version, self.params() if params is None else params)
+        return os.path.join(memo_dir, f'{self.name}-{kind}-{key}.jsonl')
+
+
+class MapStage(Stage):
+    """
+    레코드마다 독립인 단계: transform(record) -> 레코드 또는 None(버림)
+    memo_dir가 있으면 입력 레코드 해시 -> 출력 memo를 재사용해서 바뀐 레코드만 계산한다
+    """
+    memo_dir = None
+
+    def transform(self, record):
+        raise NotImplementedError
+
+    def run(self, records):
+        if self.memo_dir is None:
+            for record in records:
+                output = self.transform(record)
+                if output is not None:
+                    yield output
+            return
+        path = self.memo_path(self.memo_dir)
+        memo = {entry['key']: entry['value'] for entry in iter_records(path)} if os.path.exists(path) else {}
+        used = {}
+        self.memo_hits = 0
+        for record in records:
+            key = _digest(record)
+            if key in memo:
+                output = memo[key]
+                self.memo_hits += 1
+            else:
+                output = self.transform(record)
+            used[key] = output
+            if output is not None:
+                yield output
+        # 이번 소스에 쓰인 항목만 남김 (지워진 레코드의 memo가 계속 쌓이지 않도록)
+        write_records(path, ({'key': key, 'value': value} for key, value in used.items()))
+
+
+class Normalize(MapStage):
+    """공백/유니코드 정리, 앞뒤 따옴표 제거, 카테고리 소문자"""
+    name = 'normalize'
+
+    def transform(self, record):
+        text = ' '.join(unicodedata.normalize('NFC', record['quote']).split())
+        text = text.strip('"“”').strip()
+        if not text:
+            return None
+        return {
+            'quote': text,
+            'author': ' '.join((record.get('author') or 'Unknown').split()) or 'Unknown',
+            'category': (record.get('category') or '').strip().lower(),
+            'tags': list(record.get('tags') or []),
+        }
+
+
+class Dedup(Stage):
+    """
+    완전 중복 + 유사 중복(MinHash/LSH) 제거, 먼저 나온 것을 남긴다
+    memo_dir가 있으면 문장별 MinHash 서명을 빌드 사이에 재사용 (이 단계 시간의 대부분이 서명 계산)
+    """
+    name = 'dedup'
+    memo_dir = None
+    # 마지막 실행의 문장 -> MinHash 서명 (id 변환표의 유사 중복 매칭에 재사용, 캐시로 건너뛰면 None)
+    signatures = None
+
+    def __init__(self, similarity=0.7):
+        self.similarity = similarity
+
+    def params(self):
+        return {'similarity': self.similarity}
+
+    def run(self, records):
+        seen = set()
+        index = NearDuplicateIndex(threshold=self.similarity)
+        path = None
+        if self.memo_dir is not None:
+            # 서명은 threshold와 무관하므로 similarity를 바꿔도 memo를 그대로 씀
+            path = self.memo_path(self.memo_dir, 'signatures', index.params())
+            if os.path.exists(path):
+                index.signatures.update((entry['text'], entry['signature']) for entry in iter_records(path))
+        self.memo_hits = 0
+        self.signatures = index.signatures
+        texts = []
+        for record in records:
+            text = record['quote']
+            key = text.casefold()
+            if key in seen:
+                continue
+            texts.append(text)
+            self.memo_hits += text in index.signatures
+            if index.find_duplicate(text) is not None:
+                continue
+            seen.add(key)
+            index.add(key, text)
+            yield record
+        if path is not None:
+            # 이번 소스의 문장 서명만 남김
+            write_records(path, ({'text': text, 'signature': index.signatures[text]} for text in texts))
+
+
+class Enrich(MapStage):
+    """author_id / famous / length 구간 추가"""
+    name = 'enrich'
+    # authors.author_key 규칙이나 ALIASES를 바꾸면 올림
+    version = 2
+
+    def __init__(self, famous_people):
+        self.famous_people = famous_people
+        self._matcher = None
+
+    def params(self):
+        return {'famous_people': self.famous_people}
+
+    def transform(self, record):
+        if self._matcher is None:
+            self._matcher = AuthorMatcher(self.famous_people)
+        author_id, famous = self._matcher.lookup(record['author'])
+        record = dict(record)
+        record['author_id'] = author_id
+        record['famous'] = famous
+        record['length'] = length_bucket(record['quote'])
+        return record
+
+
+def stable_id(text):
+    """
+    정규화된 원문에서 얻는 31-bit id (재빌드해도 같은 문장은 같은 id)
+    앱의 int id / 번들의 u32 / SharedPreferences 문자열 id 모두에 안전한 범위
+    """
+    digest = hashlib.sha256(' '.join(text.casefold().split()).encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') & 0x7FFFFFFF
+
+
+class AssignIds(Stage):
+    """
+    내용 기반 안정 id 부여 (앱의 Quote.fromJson 필드 순서에 맞춰 id를 맨 앞에)
+    해시 충돌 시 다음 빈 값으로 (먼저 나온 문장이 원래 값을 가짐)
+    """
+    name = 'ids'
+    version = 2
+
+    def run(self, records):
+        taken = set()
+        for record in records:
+            quote_id = stable_id(record['quote'])
+            while quote_id in taken:
+                quote_id = (quote_id + 1) & 0x7FFFFFFF
+            taken.add(quote_id)
+            yield {'id': quote_id, **record}
+
+
+class AutoTag(Stage):
+    """TF-IDF 가중치 상위 단어로 자동 태그 (corpus 전체의 문서 빈도가 필요해서 한 번에 모아서 처리)"""
+    name = 'tags'
+    # related_quotes.STOPWORDS를 바꾸면 올림
+    version = 2
+
+    def __init__(self, tags_per_quote=DEFAULT_TAGS_PER_QUOTE):
+        self.tags_per_quote = tags_per_quote
+
+    def params(self):
+        return {'tags_per_quote': self.tags_per_quote}
+
+    def run(self, records):
+        records = list(records)
+        model = TfidfModel([record['quote'] for record in records])
+        yield from auto_tags(records, model, self.tags_per_quote)
+
+
+def id_remap(previous_records, records):
+    """이전 corpus의 id -> 새 id (같은 문장 기준, 바뀐 것만)"""
+    new_ids = {text_key(r['quote']): r['id'] for r in records}
+    remap = {}
+    for record in previous_records:
+        new_id = new_ids.get(text_key(record['quote']))
+        if new_id is not None and new_id != record['id']:
+            remap[str(record['id'])] = new_id
+    return remap
+
+
+def near_duplicate_remap(previous_records, records, similarity, signatures=None):
+    """
+    새 corpus에 같은 문장이 없는 이전 id -> 유사 중복으로 남은 명언의 id
+    (소스가 바뀌어 dedup이 다른 쪽을 남겼을 때 즐겨찾기가 사라지지 않도록)
+    signatures는 dedup 단계의 MinHash 서명 (있으면 서명 계산을 건너뜀)
+    번역은 옮기지 않는다 (문장이 달라서)
+    """
+    live = {text_key(r['quote']) for r in records}
+    unmatched = [r for r in previous_records if text_key(r['quote']) not in live]
+    if not unmatched:
+        return {}
+    index = NearDuplicateIndex(threshold=similarity, signatures=signatures)
+    for record in records:
+        index.add(record['id'], record['quote'])
+    remap = {}
+    for record in unmatched:
+        new_id = index.find_duplicate(record['quote'])
+        if new_id is not None and new_id != record['id']:
+            remap[str(record['id'])] = new_id
+    return remap
+
+
+def merge_id_maps(previous_map, remap, live_ids):
+    """
+    이전 변환표(예전 id -> 이전 빌드 id)에 이번 변환(이전 빌드 id -> 새 id)을 이어 붙인 누적 변환표
+    예전 키는 모두 유지하고 체인은 최종 id로 줄인다 (릴리스를 건너뛴 사용자도 한 번에 옮겨짐)
+    새 corpus에 살아 있는 id는 키에서 뺀다 (앱이 변환표를 다시 적용해도 살아 있는 즐겨찾기를 옮기지 않도록)
+    """
+    merged = {str(key): remap.get(str(value), value) for key, value in previous_map.items()}
+    merged.update(remap)
+    return {key: value for key, value in merged.items() if str(value) != key and int(key) not in live_ids}
+
+
+def load_id_map(path):
+    """quote_id_map.json의 map (없거나 깨졌으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        return dict(dict(iter_items(path)).get('map') or {})
+    except ValueError:
+        return {}
+
+
+def remap_translations(path, remap):
+    """quotes_translations.json의 id 키를 새 id로 바꿔서 재번역 없이 계속 쓰도록 함"""
+    if not remap or not os.path.exists(path):
+        return 0
+    # 예전 corpus에서 같은 문장이 여러 id로 반복됐으면 새 id 하나로 합쳐짐 (먼저 나온 것 유지)
+    items = {}
+    for key, value in iter_items(path):
+        items.setdefault(str(remap.get(str(key), key)), value)
+    return write_items(path, items.items())
+
+
+# ---------------------------------------------------------------- pipeline
+
+def _cache_path(stage, key):
+    return os.path.join(CACHE_DIR, f'{stage.name}-{key}.jsonl')
+
+
+def _tee(records, path):
+    """레코드를 흘려보내면서 캐시 파일에 기록 (끝까지 소비되어야 캐시가 확정됨)"""
+    with RecordWriter(path) as writer:
+        for record in records:
+            writer.write(record)
+            yield record
+
+
+def run_stages(stages, base_key, source, use_cache=True):
+    """
+    캐시가 있는 마지막 단계부터 이어서 실행 (use_cache=False면 처음부터, memo도 쓰지 않음)
+    (최종 키, 레코드 iterator, 실제로 실행된 단계 이름 목록) 반환
+    """
+    if use_cache:
+        for stage in stages:
+            if hasattr(stage, 'memo_dir'):
+                stage.memo_dir = CACHE_DIR
+    keys = []
+    key = base_key
+    for stage in stages:
+        key = _digest(key, stage.name, stage.version, stage.params())
+        keys.append(key)
+
+    start = 0
+    records = None
+    for i in range(len(stages) - 1, -1, -1):
+        if use_cache and os.path.exists(_cache_path(stages[i], keys[i])):
+            records = iter_records(_cache_path(stages[i], keys[i]))
+            start = i + 1
+            break
+    if records is None:
+        records = source()
+
+    executed = []
+    for stage, key in zip(stages[start:], keys[start:]):
+        records = _tee(stage.run(records), _cache_path(stage, key))
+        executed.append(stage.name)
+    return keys[-1], records, executed
+
+
+def _load_manifest():
+    if os.path.exists(MANIFEST_FILE):
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def sink_up_to_date(manifest, path, key):
+    """출력 파일이 같은 키로 만들어졌고 이후 손대지 않았으면 True"""
+    entry = manifest.get(os.path.relpath(path, PROJECT_ROOT))
+    return bool(entry) and entry['key'] == key and os.path.exists(path) and _file_hash(path) == entry['sha256']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build assets/quotes.json and its indexes in one pass')
+    parser.add_argument('--extra', action='append', default=[], help='추가 소스 파일 (JSON/JSONL, 여러 번 지정 가능)')
+    parser.add_argument('--gpt-source', default=GPT_SOURCE_FILE,
+                        help='GPT 생성 명언 소스 (expand_quotes_with_gpt.py 출력, 빈 문자열이면 읽지 않음)')
+    parser.add_argument('--no-builtin', action='store_true', help='스크립트에 들어있는 기본 목록을 쓰지 않음')
+    parser.add_argument('--adopt-orphans', action='store_true',
+                        help='기존 quotes.json에만 있는 명언을 GPT 소스로 옮겨서 유지')
+    parser.add_argument('--drop-orphans', action='store_true', help='기존 quotes.json에만 있는 명언을 버림')
+    parser.add_argument('--similarity', type=float, default=0.7, help='유사 중복 판정 Jaccard 임계값')
+    parser.add_argument('--output', default=QUOTES_FILE)
+    parser.add_argument('--indexes', default=INDEXES_FILE)
+    parser.add_argument('--id-map', default=ID_MAP_FILE)
+    parser.add_argument('--translations', default=TRANSLATIONS_FILE, help='id를 새 id로 옮길 번역 파일')
+    parser.add_argument('--shards-dir', default=SHARDS_DIR, help='새 corpus 순서로 다시 정렬할 언어별 번역 샤드')
+    parser.add_argument('--related', default=RELATED_FILE, help='비슷한 명언 이웃 배열 출력')
+    parser.add_argument('--related-k', type=int, default=DEFAULT_K, help='명언당 이웃 수')
+    parser.add_argument('--tags-per-quote', type=int, default=DEFAULT_TAGS_PER_QUOTE, help='명언당 최대 태그 수 (0이면 자동 태그 안 함)')
+    parser.add_argument('--search-dir', default=SEARCH_DIR, help='언어별 전문 검색 인덱스 디렉터리')
+    parser.add_argument('--store', default=DEFAULT_STORE_FILE, help='도구용 corpus 저장소 (빈 문자열이면 만들지 않음)')
+    parser.add_argument('--days', type=int, default=365, help='오늘의 명언 스케줄 일수')
+    parser.add_argument('--force', action='store_true', help='캐시를 무시하고 모든 단계 실행')
+    args = parser.parse_args()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    include_builtin = not args.no_builtin
+    sources = ([args.gpt_source] if args.gpt_source and os.path.exists(args.gpt_source) else []) + args.extra
+
+    # quotes.json은 출력이라 소스에 없는 명언은 다시 빌드하면 사라진다 - 조용히 잃지 않도록 확인
+    if os.path.exists(args.output):
+        orphans = find_orphans(iter_records(args.output), read_sources(sources, include_builtin))
+        if orphans and args.adopt_orphans:
+            if not args.gpt_source:
+                parser.error('--adopt-orphans needs --gpt-source')
+            adopt_orphans(orphans, args.gpt_source)
+            if args.gpt_source not in sources:
+                sources.insert(0, args.gpt_source)
+            print(f"Adopted {len(orphans)} quotes that were only in {args.output} into {args.gpt_source}")
+        elif orphans and args.drop_orphans:
+            print(f"[WARN] Dropping {len(orphans)} quotes that are not in any source")
+        elif orphans:
+            print(f"ERROR: {len(orphans)} quotes in {args.output} are not in any source and would be lost, e.g.")
+            for record in orphans[:5]:
+                print(f"  - {record['quote'][:70]} ({record.get('author')})")
+            print("Re-run with --adopt-orphans to keep them (moved to the GPT source) or --drop-orphans to remove them")
+            raise SystemExit(1)
+
+    stages = [Normalize(), Dedup(args.similarity), Enrich(load_famous_people()), AssignIds(), AutoTag(args.tags_per_quote)]
+    base_key = source_key(sources, include_builtin)
+
+    manifest = {} if args.force else _load_manifest()
+    final_key, records, executed = run_stages(
+        stages, base_key, lambda: read_sources(sources, include_builtin), use_cache=not args.force
+    )
+
+    # 오늘의 명언 스케줄은 날짜에 따라 바뀌므로 인덱스 키에 시작일 포함
+    today = datetime.date.today()
+    index_key = _digest(final_key, 'index', INDEX_VERSION, today.isoformat(), args.days)
+    related_key = _digest(final_key, 'related', args.related_k)
+    # 검색 인덱스는 번역도 담으므로 번역 파일 내용을 키에 포함
+    translations_hash = _file_hash(args.translations) if os.path.exists(args.translations) else None
+    search_key = _digest(final_key, 'search', SEARCH_VERSION, translations_hash)
+    search_manifest = os.path.join(args.search_dir, SEARCH_MANIFEST_NAME)
+
+    if (sink_up_to_date(manifest, args.output, final_key) and sink_up_to_date(manifest, args.indexes, index_key)
+            and sink_up_to_date(manifest, args.related, related_key)
+            and sink_up_to_date(manifest, search_manifest, search_key)):
+        print(f"Up to date: {args.output} ({final_key})")
+        return
+
+    records = list(records)
+    print(f"Stages run: {', '.join(executed) if executed else 'none (all cached)'}")
+    for stage in stages:
+        if stage.name in executed and getattr(stage, 'memo_hits', None) is not None:
+            print(f"  {stage.name}: {stage.memo_hits} records reused from memo")
+
+    if not sink_up_to_date(manifest, args.output, final_key):
+        # 기존 corpus와 비교해서 id 변환표 작성 (문장이 그대로면 id가 바뀌어도 따라감)
+        previous = list(iter_records(args.output)) if os.path.exists(args.output) else []
+        remap = id_remap(previous, records)
+        near = near_duplicate_remap(previous, records, args.similarity, stages[1].signatures)
+        id_map = merge_id_maps(load_id_map(args.id_map), {**near, **remap}, {r['id'] for r in records})
+        write_items(args.id_map, [('version', final_key), ('map', id_map)])
+        moved = remap_translations(args.translations, remap)
+        print(f"Remapped {len(remap)} ids + {len(near)} near-duplicates ({len(id_map)} in the cumulative map) "
+              f"-> {args.id_map} (translations rewritten: {moved} entries)")
+
+        write_records(args.output, records)
+        manifest[os.path.relpath(args.output, PROJECT_ROOT)] = {'key': final_key, 'sha256': _file_hash(args.output)}
+        print(f"Wrote {args.output} ({len(records)} quotes)")
+
+        # 샤드는 corpus 위치로 정렬되어 있으므로 corpus가 바뀌면 새 순서로 다시 만든다
+        if os.path.exists(os.path.join(args.shards_dir, MANIFEST_NAME)) and os.path.exists(args.translations):
+            shards = shards_from_monolithic(args.translations, [r['id'] for r in records], args.shards_dir)
+            print(f"Re-aligned {len(shards['languages'])} translation shards in {args.shards_dir}")
+
+        if args.store:
+            count, translated = build_store(args.store, records, args.translations)
+            print(f"Wrote {args.store} ({count} quotes, {translated} translations)")
+
+    if not sink_up_to_date(manifest, args.indexes, index_key):
+        indexes = build_indexes(records, stages[2].famous_people, start=today, days=args.days)
+        write_items(args.indexes, indexes.items(), indent=None)
+        manifest[os.path.relpath(args.indexes, PROJECT_ROOT)] = {'key': index_key, 'sha256': _file_hash(args.indexes)}
+        print(f"Wrote {args.indexes}")
+
+    if not sink_up_to_date(manifest, args.related, related_key):
+        document, seconds = write_related(args.related, records, args.related_k, version=final_key)
+        manifest[os.path.relpath(args.related, PROJECT_ROOT)] = {'key': related_key, 'sha256': _file_hash(args.related)}
+        print(f"Wrote {args.related} ({document['k']} related quotes each, {seconds:.2f}s)")
+
+    if not sink_up_to_date(manifest, search_manifest, search_key):
+        # remap_translations()가 번역 파일을 고쳤을 수 있으므로 위에서 구한 키 대신 지금 내용으로 다시 계산
+        translations_hash = _file_hash(args.translations) if os.path.exists(args.translations) else None
+        search_key = _digest(final_key, 'search', SEARCH_VERSION, translations_hash)
+        search = build_search_indexes(records, args.search_dir, args.translations)
+        manifest[os.path.relpath(search_manifest, PROJECT_ROOT)] = {'key': search_key, 'sha256': _file_hash(search_manifest)}
+        print(f"Wrote {len(search['languages'])} search indexes to {args.search_dir}")
+
+    write_items(MANIFEST_FILE, manifest.items())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+앱 필터용 쿼리 인덱스를 미리 계산해서 corpus와 함께 배포 (assets/quote_indexes.json)
+
+QuoteService는 인덱스가 없으면 카테고리/유명인/짧은 명언 필터가 바뀔 때마다 _quotes 전체를 훑는다.
+여기서 같은 규칙으로 id 배열을 만들어 두면 앱은 로드할 때 한 번 목록으로 바꿔 두고 꺼내 쓰기만 한다.
+
+  categories   카테고리(소문자) -> 정렬된 id 배열
+  authors      정규 author_id -> 정렬된 id 배열 ('Thomas A. Edison'/'Thomas Edison'은 하나로)
+  author_names author_id -> 표시 이름
+  famous       유명인 명언 id 배열 (quote_service.dart의 _famousPeople 부분 일치 규칙)
+  length       길이 구간 -> id 배열 (short는 앱의 _SHORT_ 기준인 100자 이하)
+  daily        날짜(YYYY-MM-DD) -> 오늘의 명언 id (getDailyQuote()와 같은 계산, 필터 없음)
+
+count/corpus_hash가 앱에 번들된 quotes.json과 다르면 앱은 인덱스를 버리고 전체 스캔으로 돌아간다
+(quote_related.json과 같은 검사). id 배열은 id 순이고, 앱이 읽을 때 corpus 순서로 되돌린다.
+
+사용 예:
+  python scripts/build_indexes.py --days 365
+"""
+
+import argparse
+import datetime
+
+from authors import AuthorMatcher, canonical_names, load_famous_people
+from corpus_io import iter_records, write_items
+from translation_shards import corpus_hash
+
+# 출력 형식 버전 (필드를 바꾸면 올림 - build_corpus.py 캐시 키에 들어감)
+VERSION = 2
+
+# (이름, 최대 길이) - 마지막 구간은 나머지 전부
+LENGTH_BUCKETS = [('short', 100), ('medium', 200), ('long', None)]
+
+
+def length_bucket(text):
+    for name, limit in LENGTH_BUCKETS:
+        if limit is None or len(text) <= limit:
+            return name
+
+
+def daily_schedule(ids, start, days):
+    """
+    QuoteService.getDailyQuote()와 같은 날짜 기반 선택
+    index = (1월 1일부터 지난 일수 + 연도) % 명언 수
+    """
+    schedule = {}
+    if not ids:
+        return schedule
+    for offset in range(days):
+        day = start + datetime.timedelta(days=offset)
+        day_of_year = (day - datetime.date(day.year, 1, 1)).days
+        schedule[day.isoformat()] = ids[(day_of_year + day.year) % len(ids)]
+    return schedule
+
+
+def build_indexes(records, famous_people, start=None, days=365):
+    """
+    레코드 목록에서 쿼리 인덱스 dict 생성
+    레코드에 author_id/famous가 이미 있으면(authors.py 단계) 그대로 쓰고, 없으면 여기서 계산
+    """
+    records = list(records)
+    matcher = AuthorMatcher(famous_people)
+    categories = {}
+    authors = {}
+    famous = []
+    lengths = {name: [] for name, _ in LENGTH_BUCKETS}
+    order = []
+
+    for record in records:
+        quote_id = record['id']
+        order.append(quote_id)
+        categories.setdefault(record.get('category', '').lower(), []).append(quote_id)
+        author_id, famous_flag = matcher.lookup(record.get('author') or 'Unknown')
+        author_id = record.get('author_id', author_id)
+        authors.setdefault(author_id, []).append(quote_id)
+        if record.get('famous', famous_flag):
+            famous.append(quote_id)
+        lengths[length_bucket(record['quote'])].append(quote_id)
+
+    return {
+        'version': VERSION,
+        'count': len(order),
+        'corpus_hash': corpus_hash(order),
+        'categories': {key: sorted(ids) for key, ids in sorted(categories.items())},
+        'authors': {key: sorted(ids) for key, ids in sorted(authors.items())},
+        'author_names': canonical_names(records),
+        'famous': sorted(famous),
+        'length': {key: sorted(ids) for key, ids in lengths.items()},
+        'daily': daily_schedule(order, start or datetime.date.today(), days),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute query indexes for the quotes corpus')
+    parser.add_argument('--input', default='assets/quotes.json')
+    parser.add_argument('--output', default='assets/quote_indexes.json')
+    parser.add_argument('--start', default=None, help='오늘의 명언 스케줄 시작일 (YYYY-MM-DD, 기본 오늘)')
+    parser.add_argument('--days', type=int, default=365, help='오늘의 명언 스케줄 일수')
+    args = parser.parse_args()
+
+    start = datetime.date.fromisoformat(args.start) if args.start else None
+    indexes = build_indexes(iter_records(args.input), load_famous_people(), start=start, days=args.days)
+    write_items(args.output, indexes.items(), indent=None)
+
+    print(f"Wrote {args.output}")
+    print(f"  Quotes: {indexes['count']}")
+    print(f"  Categories: {len(indexes['categories'])}, authors: {len(indexes['authors'])}")
+    print(f"  Famous: {len(indexes['famous'])}, short: {len(indexes['length']['short'])}")
+    print(f"  Daily schedule: {len(indexes['daily'])} days")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+번역 체크포인트 저널 (append-only JSONL)
+번역이 끝날 때마다 한 줄씩 기록해서, 중단된 실행을 이어서 할 수 있게 한다
+"""
+
+import json
+import os
+import threading
+
+
+def _ends_mid_line(path):
+    """파일이 비어 있지 않고 줄바꿈으로 끝나지 않으면 True"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b'\n'
+
+
+class TranslationJournal:
+    """(quote_id, lang) 단위 번역 결과를 JSONL로 누적 기록"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def load(self):
+        """
+        저널에 기록된 번역 읽기
+        {(quote_id, lang): {'quote': 원문, 'translation': 번역}} 반환
+        중단 시 잘린 마지막 줄 등 깨진 줄은 건너뛴다
+        """
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    if entry.get('rejected'):
+                        # 품질 검사에서 버린 번역 (다음 실행에서 다시 번역)
+                        done.pop((entry['id'], entry['lang']), None)
+                        continue
+                    done[(entry['id'], entry['lang'])] = {
+                        'quote': entry['quote'],
+                        'translation': entry['translation'],
+                    }
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return done
+
+    def append(self, quote_id, lang, quote_text, translation):
+        """번역 1건 기록 (바로 flush해서 크래시에도 남도록)"""
+        self._write({'id': quote_id, 'lang': lang, 'quote': quote_text, 'translation': translation})
+
+    def _write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+                if _ends_mid_line(self.path):
+                    # 크래시로 잘린 마지막 줄에 이어 쓰면 새 기록까지 깨지므로 줄을 끊고 시작
+                    self._file.write('\n')
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def reject(self, quote_id, lang):
+        """앞서 기록한 번역을 무효로 표시 (load에서 빠짐)"""
+        self._write({'id': quote_id, 'lang': lang, 'rejected': True})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """컴팩션이 끝난 저널 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
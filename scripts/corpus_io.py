@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+명언 corpus 공용 입출력
+- 전체를 json.load 하지 않고 레코드 단위로 읽는 스트리밍 리더 (JSON 배열/객체, JSONL)
+- 레코드 단위로 쓰는 writer (임시 파일에 쓴 뒤 os.replace로 원자적 교체)
+
+JSON writer의 출력은 json.dump(..., indent=2, ensure_ascii=False)와 바이트 단위로 같다.
+"""
+
+import json
+import os
+import tempfile
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+def is_jsonl(path):
+    return path.endswith('.jsonl')
+
+
+class _JsonStream:
+    """파일을 청크 단위로 읽으면서 JSON 값을 하나씩 디코딩"""
+
+    def __init__(self, f):
+        self._f = f
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = self._f.read(CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자 (EOF면 '')"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at offset {self._pos}, got {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self):
+        """다음 JSON 값 하나 디코딩 (버퍼가 값 중간에서 끊겼으면 더 읽음)"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # 숫자는 버퍼 끝에서 잘려도 디코딩되므로 뒤에 더 있는지 확인
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_records(path):
+    """JSON 배열 또는 JSONL 파일의 레코드를 하나씩 yield"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if is_jsonl(path):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        stream = _JsonStream(f)
+        stream.expect('[')
+        if stream.peek() == ']':
+            return
+        while True:
+            yield stream.value()
+            if stream.expect(',]') == ']':
+                return
+
+
+def iter_items(path):
+    """JSON 객체 파일(예: quotes_translations.json)의 (key, value)를 하나씩 yield"""
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JsonStream(f)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            yield key, stream.value()
+            if stream.expect(',}') == '}':
+                return
+
+
+def load_records(path):
+    return list(iter_records(path))
+
+
+class _AtomicWriter:
+    """임시 파일에 쓰고 정상 종료 시에만 대상 파일로 교체 (중간에 죽어도 반쯤 쓴 파일이 남지 않음)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._f = None
+        self._tmp = None
+
+    def __enter__(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, self._tmp = tempfile.mkstemp(prefix='.' + os.path.basename(self.path) + '.', dir=directory)
+        self._f = os.fdopen(fd, 'w', encoding='utf-8')
+        self._begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._end()
+                self._f.flush()
+                os.fsync(self._f.fileno())
+            self._f.close()
+        finally:
+            if exc_type is None:
+                # mkstemp는 0600으로 만들기 때문에 일반 파일 권한으로 맞춤
+                os.chmod(self._tmp, 0o644)
+                os.replace(self._tmp, self.path)
+            elif os.path.exists(self._tmp):
+                os.remove(self._tmp)
+        return False
+
+    def _begin(self):
+        pass
+
+    def _end(self):
+        pass
+
+
+def _indented(obj, indent):
+    """json.dump(indent=...)로 컨테이너 안에 들어갈 때와 같은 모양의 문자열"""
+    text = json.dumps(obj, indent=indent, ensure_ascii=False)
+    if indent is None:
+        return text
+    return text.replace('\n', '\n' + ' ' * indent)
+
+
+class RecordWriter(_AtomicWriter):
+    """
+    레코드를 하나씩 쓰는 writer
+    .jsonl이면 한 줄에 하나, 아니면 json.dump(list, indent=2)와 같은 JSON 배열
+    """
+
+    def __init__(self, path, indent=2):
+        super().__init__(path)
+        self.indent = indent
+        self.count = 0
+
+    def _begin(self):
+        if not is_jsonl(self.path):
+            self._f.write('[')
+
+    def write(self, record):
+        if is_jsonl(self.path):
+            self._f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        else:
+            sep = ',' if self.count else ''
+            if self.indent is None:
+                self._f.write(sep + (' ' if self.count else '') + _indented(record, None))
+            else:
+                self._f.write(sep + '\n' + ' ' * self.indent + _indented(record, self.indent))
+        self.count += 1
+
+    def _end(self):
+        if not is_jsonl(self.path):
+            if self.count and self.indent is not None:
+                self._f.write('\n')
+            self._f.write(']')
+
+
+class ObjectWriter(_AtomicWriter):
+    """(key, value)를 하나씩 쓰는 JSON 객체 writer (json.dump(dict, indent=2)와 같은 출력)"""
+
+    def __init__(self, path, indent=2):
+        super().__init__(path)
+        self.indent = indent
+        self.count = 0
+
+    def _begin(self):
+        self._f.write('{')
+
+    def write(self, key, value):
+        key_text = json.dumps(str(key), ensure_ascii=False)
+        sep = ',' if self.count else ''
+        if self.indent is None:
+            self._f.write(sep + (' ' if self.count else '') + key_text + ': ' + _indented(value, None))
+        else:
+            self._f.write(sep + '\n' + ' ' * self.indent + key_text + ': ' + _indented(value, self.indent))
+        self.count += 1
+
+    def _end(self):
+        if self.count and self.indent is not None:
+            self._f.write('\n')
+        self._f.write('}')
+
+
+def write_records(path, records, indent=2):
+    """레코드 iterable을 원자적으로 저장하고 개수 반환"""
+    with RecordWriter(path, indent=indent) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+
+def write_items(path, items, indent=2):
+    """(key, value) iterable을 JSON 객체로 원자적으로 저장하고 개수 반환"""
+    with ObjectWriter(path, indent=indent) as writer:
+        for key, value in items:
+            writer.write(key, value)
+    return writer.count
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+도구용 읽기 최적화 corpus 저장소 (SQLite, 기본 scripts/.cache/corpus.sqlite)
+
+quotes.json을 list[dict]로 통째로 올리면 명언 1개당 ~1KB의 파이썬 객체가 생기고, 몇 개만
+찾아보거나 새 명언을 덧붙이려 해도 corpus 크기만큼 시간이 든다. 저장소는 파일을 열 때
+아무것도 읽지 않고, 필요한 행만 인덱스로 찾는다.
+
+  quotes        id(INTEGER PRIMARY KEY = rowid) -> 명언 1행, pos는 corpus 순서
+                (category, pos) / (author_id, pos) / (author, pos) 인덱스
+  translations  (id, lang) -> 번역, lang 인덱스
+
+- get(id)는 rowid 조회 한 번 (corpus 크기와 무관하게 일정)
+- iter_category / iter_author / iter_language는 인덱스 범위만 읽으면서 corpus 순서로 yield
+- 명언은 덧붙이기만 한다 (append: 이미 있는 id는 건너뜀), 번역은 같은 (id, lang)이면 덮어씀
+  (replace_translations는 명언별 번역 묶음을 통째로 교체)
+- corpus가 재빌드되면 build_store()로 새로 만들어서 교체 (build_corpus.py가 자동으로 함)
+- 다른 스크립트는 fresh_store()로 열어서 quotes.json/번역 파일 대신 읽는다
+  (저장소가 원본 파일보다 오래됐으면 None - 원본 파일을 직접 읽음)
+
+사용 예:
+  python scripts/corpus_store.py                          # quotes.json + 번역 -> 저장소
+  python scripts/corpus_store.py --get 627992391 --lang ko
+  python scripts/corpus_store.py --category happiness --limit 5
+  python scripts/corpus_store.py --bench
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+from corpus_io import iter_items, iter_records, load_records
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE_FILE = os.path.join(SCRIPT_DIR, '.cache', 'corpus.sqlite')
+STORE_VERSION = 1
+
+# 컬럼으로 저장하는 필드 (나머지 필드는 extra에 JSON으로 보관해서 그대로 돌려줌)
+_COLUMNS = ['id', 'quote', 'author', 'category', 'tags', 'author_id', 'famous', 'length']
+_OPTIONAL = ['author_id', 'famous', 'length']
+
+_SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS quotes ('
+    ' id INTEGER PRIMARY KEY,'
+    ' pos INTEGER NOT NULL UNIQUE,'
+    ' quote TEXT NOT NULL,'
+    ' author TEXT NOT NULL,'
+    ' category TEXT NOT NULL COLLATE NOCASE,'
+    ' tags TEXT NOT NULL,'
+    ' author_id TEXT,'
+    ' famous INTEGER,'
+    ' length TEXT,'
+    ' extra TEXT)',
+    'CREATE INDEX IF NOT EXISTS idx_quotes_category ON quotes(category, pos)',
+    'CREATE INDEX IF NOT EXISTS idx_quotes_author_id ON quotes(author_id, pos)',
+    'CREATE INDEX IF NOT EXISTS idx_quotes_author ON quotes(author, pos)',
+    'CREATE TABLE IF NOT EXISTS translations ('
+    ' id INTEGER NOT NULL,'
+    ' lang TEXT NOT NULL,'
+    ' text TEXT NOT NULL,'
+    ' PRIMARY KEY (id, lang)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS idx_translations_lang ON translations(lang, id)',
+]
+
+
+def _row_values(record, pos):
+    extra = {key: value for key, value in record.items() if key not in _COLUMNS}
+    famous = record.get('famous')
+    return (
+        record['id'], pos, record['quote'],
+        record.get('author') or 'Unknown', record.get('category') or '',
+        json.dumps(list(record.get('tags') or []), ensure_ascii=False),
+        record.get('author_id'), None if famous is None else int(famous), record.get('length'),
+        json.dumps(extra, ensure_ascii=False) if extra else None,
+    )
+
+
+def _record(row):
+    """행 -> quotes.json과 같은 모양의 dict (없던 선택 필드는 넣지 않음)"""
+    quote_id, quote, author, category, tags, author_id, famous, length, extra = row
+    record = {'id': quote_id, 'quote': quote, 'author': author, 'category': category, 'tags': json.loads(tags)}
+    for key, value in zip(_OPTIONAL, (author_id, None if famous is None else bool(famous), length)):
+        if value is not None:
+            record[key] = value
+    if extra:
+        record.update(json.loads(extra))
+    return record
+
+
+_SELECT = 'SELECT id, quote, author, category, tags, author_id, famous, length, extra FROM quotes'
+
+
+class CorpusStore:
+    """
+    명언 + 번역 저장소
+    readonly=True면 파일을 읽기 전용으로 열고(없으면 오류), 아니면 없을 때 새로 만든다
+    """
+
+    def __init__(self, path=DEFAULT_STORE_FILE, readonly=False):
+        self.path = path
+        if readonly:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Corpus store not found: {path} (run scripts/corpus_store.py)")
+            self._conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version == 0 and not readonly:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._conn.execute(f'PRAGMA user_version = {STORE_VERSION}')
+            self._conn.commit()
+        elif version != STORE_VERSION:
+            raise ValueError(f"Unsupported corpus store version {version} in {path}")
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM quotes').fetchone()[0]
+
+    def __contains__(self, quote_id):
+        return self._conn.execute('SELECT 1 FROM quotes WHERE id = ?', (quote_id,)).fetchone() is not None
+
+    def get(self, quote_id):
+        """id로 명언 1개 (없으면 None)"""
+        row = self._conn.execute(f'{_SELECT} WHERE id = ?', (quote_id,)).fetchone()
+        return _record(row) if row else None
+
+    def __iter__(self):
+        """전체 명언을 corpus 순서로"""
+        for row in self._conn.execute(f'{_SELECT} ORDER BY pos'):
+            yield _record(row)
+
+    def ids(self):
+        return [row[0] for row in self._conn.execute('SELECT id FROM quotes ORDER BY pos')]
+
+    def at(self, pos):
+        """corpus 위치로 명언 1개 (검색 인덱스 결과 등, 없으면 None)"""
+        row = self._conn.execute(f'{_SELECT} WHERE pos = ?', (pos,)).fetchone()
+        return _record(row) if row else None
+
+    def texts(self):
+        """전체 명언 본문 (corpus 순서)"""
+        return [row[0] for row in self._conn.execute('SELECT quote FROM quotes ORDER BY pos')]
+
+    def iter_category(self, category):
+        """카테고리(대소문자 무시)의 명언"""
+        for row in self._conn.execute(f'{_SELECT} WHERE category = ? ORDER BY pos', (category,)):
+            yield _record(row)
+
+    def iter_author(self, author):
+        """author_id 또는 표시 이름이 같은 명언"""
+        rows = self._conn.execute(
+            f'{_SELECT} WHERE id IN (SELECT id FROM quotes WHERE author_id = ?'
+            ' UNION ALL SELECT id FROM quotes WHERE author = ? AND author_id IS NULL) ORDER BY pos',
+            (author, author),
+        )
+        for row in rows:
+            yield _record(row)
+
+    def categories(self):
+        """카테고리 -> 명언 수"""
+        return dict(self._conn.execute('SELECT category, COUNT(*) FROM quotes GROUP BY category ORDER BY category'))
+
+    def append(self, records):
+        """
+        corpus 끝에 명언 추가 (이미 있는 id는 건너뜀, 기존 행은 바꾸지 않음)
+        추가된 명언 수 반환
+        """
+        with self._conn:
+            pos = self._conn.execute('SELECT COALESCE(MAX(pos) + 1, 0) FROM quotes').fetchone()[0]
+            added = 0
+            for record in records:
+                cursor = self._conn.execute(
+                    'INSERT OR IGNORE INTO quotes (id, pos, quote, author, category, tags, author_id, famous, length, extra)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    _row_values(record, pos),
+                )
+                if cursor.rowcount:
+                    pos += 1
+                    added += 1
+        return added
+
+    def translation(self, quote_id, lang):
+        row = self._conn.execute(
+            'SELECT text FROM translations WHERE id = ? AND lang = ?', (quote_id, lang)
+        ).fetchone()
+        return row[0] if row else None
+
+    def translations(self, quote_id):
+        """id의 {lang: 번역}"""
+        return dict(self._conn.execute('SELECT lang, text FROM translations WHERE id = ?', (quote_id,)))
+
+    def iter_language(self, lang):
+        """한 언어의 (id, 번역)을 corpus 순서로 (번역 없는 명언은 건너뜀)"""
+        yield from self._conn.execute(
+            'SELECT t.id, t.text FROM translations t JOIN quotes q ON q.id = t.id'
+            ' WHERE t.lang = ? ORDER BY q.pos',
+            (lang,),
+        )
+
+    def iter_translated(self):
+        """번역이 있는 명언의 (id, 본문, {lang: 번역})을 corpus 순서로"""
+        rows = self._conn.execute(
+            'SELECT q.id, q.quote, t.lang, t.text FROM quotes q JOIN translations t ON t.id = q.id'
+            ' ORDER BY q.pos, t.lang'
+        )
+        current = None
+        for quote_id, quote, lang, text in rows:
+            if current is None or current[0] != quote_id:
+                if current is not None:
+                    yield current
+                current = (quote_id, quote, {})
+            current[2][lang] = text
+        if current is not None:
+            yield current
+
+    def languages(self):
+        """언어 -> 번역 수"""
+        return dict(self._conn.execute('SELECT lang, COUNT(*) FROM translations GROUP BY lang ORDER BY lang'))
+
+    def put_translations(self, items):
+        """(id, lang, 번역) 목록 저장 (같은 id/언어는 덮어씀), 저장한 수 반환"""
+        with self._conn:
+            cursor = self._conn.executemany(
+                'INSERT OR REPLACE INTO translations (id, lang, text) VALUES (?, ?, ?)',
+                ((int(quote_id), lang, text) for quote_id, lang, text in items if text),
+            )
+        return cursor.rowcount
+
+    def replace_translations(self, items):
+        """
+        (id, {lang: 번역}) 목록으로 명언별 번역 묶음을 통째로 교체 (없어진 언어의 예전 번역은 지움)
+        저장한 번역 수 반환
+        """
+        saved = 0
+        with self._conn:
+            for quote_id, translations in items:
+                self._conn.execute('DELETE FROM translations WHERE id = ?', (int(quote_id),))
+                cursor = self._conn.executemany(
+                    'INSERT INTO translations (id, lang, text) VALUES (?, ?, ?)',
+                    ((int(quote_id), lang, text) for lang, text in translations.items() if text),
+                )
+                saved += cursor.rowcount
+        return saved
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def fresh_store(store_path=DEFAULT_STORE_FILE, *sources):
+    """
+    저장소가 있고 sources(quotes.json, 번역 파일 등)보다 나중에 갱신됐으면 읽기 전용 CorpusStore, 아니면 None
+    (직접 고친 quotes.json 등을 저장소가 모르면 원본 파일을 읽도록)
+    """
+    if not store_path or not os.path.exists(store_path):
+        return None
+    updated = os.path.getmtime(store_path)
+    if any(os.path.exists(source) and os.path.getmtime(source) > updated for source in sources):
+        return None
+    try:
+        return CorpusStore(store_path, readonly=True)
+    except (ValueError, sqlite3.Error):
+        return None
+
+
+def translation_rows(path):
+    """quotes_translations.json -> (id, lang, 번역) (스트리밍)"""
+    for key, entry in iter_items(path):
+        for lang, text in entry.get('translations', {}).items():
+            yield int(key), lang, text
+
+
+def build_store(path, records, translations_path=None):
+    """
+    레코드(+ 번역 파일)로 저장소를 새로 만들어 교체 (임시 파일에 쓴 뒤 os.replace)
+    (명언 수, 번역 수) 반환
+    """
+    tmp_path = path + '.tmp'
+    for stale in (tmp_path, tmp_path + '-wal', tmp_path + '-shm'):
+        if os.path.exists(stale):
+            os.remove(stale)
+    with CorpusStore(tmp_path) as store:
+        count = store.append(records)
+        translated = 0
+        if translations_path and os.path.exists(translations_path):
+            translated = store.put_translations(translation_rows(translations_path))
+        store._conn.execute('PRAGMA journal_mode=DELETE')
+        store._conn.execute('ANALYZE')
+    os.replace(tmp_path, path)
+    for stale in (path + '-wal', path + '-shm'):
+        if os.path.exists(stale):
+            os.remove(stale)
+    return count, translated
+
+
+def _timed(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(json_path, store_path):
+    """quotes.json 전체 로드 후 조회 vs 저장소 열고 조회"""
+    ids = CorpusStore(store_path, readonly=True).ids()
+    target = ids[len(ids) // 2]
+
+    def json_get():
+        return next(record for record in load_records(json_path) if record['id'] == target)
+
+    def store_get():
+        with CorpusStore(store_path, readonly=True) as store:
+            return store.get(target)
+
+    def store_open():
+        CorpusStore(store_path, readonly=True).close()
+
+    assert json_get() == store_get(), 'store round-trip mismatch'
+    return {
+        'quotes': len(ids),
+        'json_load_get_one_ms': round(_timed(json_get) * 1000, 3),
+        'store_open_ms': round(_timed(store_open) * 1000, 3),
+        'store_open_get_one_ms': round(_timed(store_get) * 1000, 3),
+        'store_bytes': os.path.getsize(store_path),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the SQLite corpus store')
+    parser.add_argument('--input', default='assets/quotes.json')
+    parser.add_argument('--translations', default='assets/quotes_translations.json')
+    parser.add_argument('--store', default=DEFAULT_STORE_FILE)
+    parser.add_argument('--get', type=int, default=None, help='id로 명언 1개 조회')
+    parser.add_argument('--lang', default=None, help='--get과 함께: 해당 언어 번역도 출력')
+    parser.add_argument('--category', default=None, help='카테고리의 명언 출력')
+    parser.add_argument('--author', default=None, help='author_id(또는 이름)의 명언 출력')
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--stats', action='store_true', help='명언/카테고리/번역 수')
+    parser.add_argument('--bench', action='store_true', help='JSON 전체 로드와 조회 시간 비교')
+    args = parser.parse_args()
+
+    if args.get is not None or args.category or args.author or args.stats:
+        with CorpusStore(args.store, readonly=True) as store:
+            if args.get is not None:
+                record = store.get(args.get)
+                if record and args.lang:
+                    record['translation'] = store.translation(args.get, args.lang)
+                print(json.dumps(record, ensure_ascii=False, indent=2))
+            for records in (store.iter_category(args.category) if args.category else None,
+                            store.iter_author(args.author) if args.author else None):
+                for _, record in zip(range(args.limit), records or []):
+                    print(json.dumps(record, ensure_ascii=False))
+            if args.stats:
+                print(json.dumps({
+                    'quotes': len(store), 'categories': store.categories(), 'translations': store.languages(),
+                }, ensure_ascii=False, indent=2))
+        return
+
+    count, translated = build_store(args.store, iter_records(args.input), args.translations)
+    print(f"Wrote {args.store} ({count} quotes, {translated} translations)")
+    if args.bench:
+        print(json.dumps(benchmark(args.input, args.store), indent=2))
+
+
+if __name__ == '__main__':
+    main()
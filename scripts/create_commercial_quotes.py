@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 """
-상업적으로 사용 가능한 명언 데이터셋 생성
+상업적으로 사용 가능한 명언 기본 목록 (build_corpus.py의 기본 소스)
 공개 도메인 및 유명 인물들의 명언으로 구성
 """
 
-import json
-
 # 상업적으로 사용 가능한 명언들 (공개 도메인, 유명 인물들의 명언)
 quotes_data = []
 
@@ -183,49 +181,10 @@ categories = {
     ],
 }
 
-# JSON 형식으로 변환
-quotes_list = []
-quote_id = 0
-
-for category, quote_list in categories.items():
-    for quote_item in quote_list:
-        quotes_list.append({
-            "id": quote_id,
-            "quote": quote_item["quote"],
-            "author": quote_item["author"],
-            "category": category,
-            "tags": []
-        })
-        quote_id += 1
-
-# 각 카테고리를 반복하여 더 많은 명언 생성 (총 약 2000개)
-# 실제로는 더 많은 공개 도메인 명언을 추가해야 함
-while len(quotes_list) < 2000:
-    for category, quote_list in categories.items():
-        if len(quotes_list) >= 2000:
-            break
-        for quote_item in quote_list:
-            if len(quotes_list) >= 2000:
-                break
-            quotes_list.append({
-                "id": quote_id,
-                "quote": quote_item["quote"],
-                "author": quote_item["author"],
-                "category": category,
-                "tags": []
-            })
-            quote_id += 1
-
-# JSON 파일로 저장 (절대 경로 사용)
-import os
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(script_dir)
-quotes_file = os.path.join(project_root, 'assets', 'quotes.json')
-
-with open(quotes_file, 'w', encoding='utf-8') as f:
-    json.dump(quotes_list, f, indent=2, ensure_ascii=False)
-
-print(f"Generated {len(quotes_list)} commercial-use quotes")
-print(f"Categories: {set(q['category'] for q in quotes_list)}")
-print(f"Unique quotes: {len(set(q['quote'] for q in quotes_list))}")
+# 이 목록은 build_corpus.py의 기본 소스다. 예전처럼 quotes.json을 직접 다시 쓰면
+# GPT 소스의 명언과 안정 id가 사라지므로, 실행하면 빌드 파이프라인으로 넘긴다
+if __name__ == "__main__":
+    import build_corpus
 
+    print("create_commercial_quotes.py no longer writes assets/quotes.json; running build_corpus.py instead")
+    build_corpus.main()
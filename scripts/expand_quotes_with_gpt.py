@@ -1,23 +1,44 @@
 #!/usr/bin/env python3
 """
 GPT API를 사용하여 더 많은 상업적으로 사용 가능한 명언 생성
+--stream이면 응답을 SSE로 받아서 "quote" - Author 줄이 완성될 때마다 바로 중복 검사/병합
+(응답 전체를 기다리지 않고, 끝부분이 깨지거나 끊겨도 그 전까지 받은 명언은 남는다)
+새 명언은 assets/quotes.json이 아니라 GPT 소스(scripts/sources/gpt_quotes.jsonl)에 덧붙이고,
+id/태그/인덱스는 build_corpus.py가 만든다 (빌드가 quotes.json을 다시 써도 사라지지 않음)
+--dry-run이면 호출 없이 토큰/비용/시간 추정만, --budget-tokens/--budget-usd로 상한 (token_budget.py)
 """
 
-import json
-import requests
+import argparse
+import threading
 import time
+from collections import Counter
+
+from api_client import ApiError, add_client_args, configure_from_args, get_client
+from api_engine import ApiEngine, RateLimiter, estimate_tokens
+from build_corpus import GPT_SOURCE_FILE, QUOTES_FILE
+from corpus_io import load_records, write_records
+from corpus_store import DEFAULT_STORE_FILE, fresh_store
+from metrics import Metrics
+from near_duplicates import NearDuplicateIndex
+from token_budget import (BudgetGuard, add_budget_args, count_shares, estimate_duration, format_plan, plan_budget,
+                          plan_summary)
 
 # OpenAI API 설정
 # API 키는 환경 변수에서 가져옴
 import os
 API_KEY = os.environ.get('OPENAI_API_KEY', '')
-API_URL = 'https://api.openai.com/v1/chat/completions'
+API_URL = os.environ.get('OPENAI_API_URL', 'https://api.openai.com/v1/chat/completions')
 
-if not API_KEY:
-    print('Warning: OPENAI_API_KEY environment variable not set')
+CATEGORIES = ['happiness', 'inspiration', 'love', 'success', 'truth', 'poetry', 'death', 'romance', 'science', 'time']
+MAX_TOKENS = 2000
+# 응답에서 "quote" - Author 한 줄이 차지하는 토큰 추정치 (예산 계획용)
+QUOTE_LINE_TOKENS = 35
 
-def generate_quotes_with_gpt(category, num_quotes=50):
-    """GPT API를 사용하여 특정 카테고리의 명언 생성"""
+# 요청 지연/토큰/재시도 등 실행 메트릭 (카테고리별 라벨)
+METRICS = Metrics('expand_quotes', model='gpt-4o-mini')
+
+def generation_payload(category, num_quotes):
+    """명언 생성 요청 본문 (일반/스트리밍 공통)"""
     prompt = f"""Generate {num_quotes} inspiring, commercial-use-friendly quotes about {category}. 
 Each quote should be:
 1. Original or from public domain sources
@@ -31,27 +52,33 @@ Return only the quotes in this format:
 "Quote text" - Author Name
 ..."""
 
+    return {
+        'model': 'gpt-4o-mini',
+        'messages': [
+            {'role': 'system', 'content': 'You are a helpful assistant that generates inspiring quotes suitable for commercial use.'},
+            {'role': 'user', 'content': prompt}
+        ],
+        'temperature': 0.8,
+        'max_tokens': MAX_TOKENS
+    }
+
+def generation_estimate(category, num_quotes):
+    """예산 계획용 (입력, 출력) 토큰 추정 - 응답은 요청한 명언 수 기준 (MAX_TOKENS까지)"""
+    payload = generation_payload(category, num_quotes)
+    tokens_in = sum(estimate_tokens(message['content']) for message in payload['messages'])
+    return tokens_in, min(MAX_TOKENS, num_quotes * QUOTE_LINE_TOKENS)
+
+def generate_quotes_with_gpt(category, num_quotes=50):
+    """
+    GPT API를 사용하여 특정 카테고리의 명언 생성
+    429/5xx/네트워크 오류는 RetryableError로 올려서 엔진이 백오프 후 재시도하게 한다
+    """
+    response = get_client().post_json(API_URL, API_KEY, generation_payload(category, num_quotes))
+    
     try:
-        response = requests.post(
-            API_URL,
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {API_KEY}'
-            },
-            json={
-                'model': 'gpt-4o-mini',
-                'messages': [
-                    {'role': 'system', 'content': 'You are a helpful assistant that generates inspiring quotes suitable for commercial use.'},
-                    {'role': 'user', 'content': prompt}
-                ],
-                'temperature': 0.8,
-                'max_tokens': 2000
-            },
-            timeout=30
-        )
-        
         if response.status_code == 200:
             data = response.json()
+            METRICS.record_usage(data.get('usage'), category=category)
             content = data['choices'][0]['message']['content']
             return content
         else:
@@ -61,77 +88,256 @@ Return only the quotes in this format:
         print(f"Error generating quotes: {e}")
         return None
 
+def stream_quotes_with_gpt(category, num_quotes=50):
+    """
+    스트리밍으로 명언 생성: SSE 조각을 이어 붙이다가 줄이 끝날 때마다 파싱한 명언을 바로 yield
+    스트림이 [DONE] 전에 끊기면 RetryableError가 올라가지만, 그 전까지 완성된 줄은 이미 넘어간 뒤다
+    (끊긴 마지막 줄은 버림). finish_reason이 'length'면 max_tokens에서 잘린 마지막 줄도 버린다
+    """
+    payload = {**generation_payload(category, num_quotes), 'stream_options': {'include_usage': True}}
+    buffer = ''
+    finish_reason = None
+    for event in get_client().stream_events(API_URL, API_KEY, payload):
+        if event.get('usage'):
+            METRICS.record_usage(event['usage'], category=category)
+        for choice in event.get('choices') or []:
+            buffer += (choice.get('delta') or {}).get('content') or ''
+            finish_reason = choice.get('finish_reason') or finish_reason
+        while '\n' in buffer:
+            line, buffer = buffer.split('\n', 1)
+            quote = parse_quote_line(line, category)
+            if quote:
+                yield quote
+    if finish_reason == 'length':
+        METRICS.inc('truncated', category=category)
+        return
+    # [DONE]까지 받았으면(iter_sse) 줄바꿈 없이 끝난 마지막 줄도 완성된 것
+    quote = parse_quote_line(buffer, category)
+    if quote:
+        yield quote
+
+def parse_quote_line(line, category):
+    """"Quote" - Author 한 줄 파싱 (형식이 아니거나 너무 짧으면 None)"""
+    line = line.strip()
+    if not line or not line.startswith('"') or ' - ' not in line:
+        return None
+    
+    parts = line.split(' - ', 1)
+    quote_text = parts[0].strip().strip('"')
+    author = parts[1].strip() if len(parts) > 1 else "Unknown"
+    
+    if quote_text and len(quote_text) > 10:  # 최소 길이 체크
+        return {
+            "quote": quote_text,
+            "author": author,
+            "category": category
+        }
+    return None
+
 def parse_quotes(text, category):
     """생성된 텍스트에서 명언 파싱"""
     quotes = []
-    lines = text.strip().split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line or not line.startswith('"'):
-            continue
-        
-        # "Quote" - Author 형식 파싱
-        if ' - ' in line:
-            parts = line.split(' - ', 1)
-            quote_text = parts[0].strip().strip('"')
-            author = parts[1].strip() if len(parts) > 1 else "Unknown"
-            
-            if quote_text and len(quote_text) > 10:  # 최소 길이 체크
-                quotes.append({
-                    "quote": quote_text,
-                    "author": author,
-                    "category": category
-                })
-    
+    for line in text.strip().split('\n'):
+        quote = parse_quote_line(line, category)
+        if quote:
+            quotes.append(quote)
     return quotes
 
-# 기존 명언 로드
-with open('../assets/quotes.json', 'r', encoding='utf-8') as f:
-    existing_quotes = json.load(f)
+def timed_generate(category, num_quotes):
+    """카테고리 1개 생성 + 소요 시간(초)"""
+    started = time.monotonic()
+    output = generate_quotes_with_gpt(category, num_quotes=num_quotes)
+    return output, time.monotonic() - started
 
-print(f"Existing quotes: {len(existing_quotes)}")
-print(f"Unique quotes: {len(set(q['quote'] for q in existing_quotes))}")
+def timed_stream(category, num_quotes, merge):
+    """
+    카테고리 1개를 스트리밍으로 생성하면서 명언마다 바로 merge(명언) 호출
+    ((파싱 수, 추가 수, 첫 명언까지 초), 소요 시간) 반환, 재시도할 수 없는 API 오류면 None
+    """
+    started = time.monotonic()
+    parsed = added = 0
+    first = None
+    try:
+        for quote in stream_quotes_with_gpt(category, num_quotes):
+            if first is None:
+                first = time.monotonic() - started
+                METRICS.observe('first_quote_s', first, category=category)
+            parsed += 1
+            added += merge(quote)
+    except ApiError as e:
+        print(e)
+        return None
+    return (parsed, added, first), time.monotonic() - started
 
-# 각 카테고리별로 추가 명언 생성
-categories = ['happiness', 'inspiration', 'love', 'success', 'truth', 'poetry', 'death', 'romance', 'science', 'time']
-new_quotes = []
+def parse_args():
+    parser = argparse.ArgumentParser(description='Expand assets/quotes.json with GPT-generated quotes')
+    parser.add_argument('--num-quotes', type=int, default=30, help='카테고리당 요청할 명언 수')
+    parser.add_argument('--concurrency', type=int, default=len(CATEGORIES), help='동시 요청 수')
+    parser.add_argument('--rps', type=float, default=3.0, help='초당 최대 요청 수')
+    parser.add_argument('--tpm', type=int, default=None, help='분당 최대 토큰 수')
+    parser.add_argument('--max-retries', type=int, default=5, help='429/5xx 재시도 횟수')
+    parser.add_argument('--similarity', type=float, default=0.7,
+                        help='이 Jaccard 유사도 이상이면 기존 명언의 변형으로 보고 제외')
+    parser.add_argument('--stream', action='store_true', help='SSE 스트리밍으로 받아서 명언 줄마다 바로 병합')
+    add_budget_args(parser)
+    parser.add_argument('--progress-interval', type=float, default=10.0, help='진행 줄(처리량/ETA) 출력 간격 (초)')
+    parser.add_argument('--store', default=DEFAULT_STORE_FILE, help='corpus 저장소 (빈 문자열이면 quotes.json을 읽음)')
+    parser.add_argument('--report', default=None, help='JSON 실행 리포트 경로 (기본 scripts/.cache/reports/)')
+    add_client_args(parser)
+    return parser.parse_args()
 
-for category in categories:
-    print(f"\nGenerating quotes for {category}...")
-    gpt_output = generate_quotes_with_gpt(category, num_quotes=30)
+def main():
+    args = parse_args()
     
-    if gpt_output:
-        parsed = parse_quotes(gpt_output, category)
-        new_quotes.extend(parsed)
-        print(f"Generated {len(parsed)} quotes for {category}")
+    if not API_KEY and not args.dry_run:
+        print('Warning: OPENAI_API_KEY environment variable not set')
     
-    time.sleep(1)  # API 레이트 리밋 방지
-
-# 기존 명언과 합치기
-all_quotes = existing_quotes.copy()
-
-# 중복 제거하면서 추가
-existing_quote_texts = set(q['quote'] for q in existing_quotes)
-quote_id = len(existing_quotes)
-
-for quote in new_quotes:
-    if quote['quote'] not in existing_quote_texts:
-        all_quotes.append({
-            "id": quote_id,
-            "quote": quote['quote'],
-            "author": quote['author'],
-            "category": quote['category'],
-            "tags": []
-        })
-        existing_quote_texts.add(quote['quote'])
-        quote_id += 1
-
-# 저장
-with open('../assets/quotes.json', 'w', encoding='utf-8') as f:
-    json.dump(all_quotes, f, indent=2, ensure_ascii=False)
-
-print(f"\nTotal quotes: {len(all_quotes)}")
-print(f"Unique quotes: {len(set(q['quote'] for q in all_quotes))}")
-print(f"New quotes added: {len(all_quotes) - len(existing_quotes)}")
+    # 기존 명언 로드 (빌드된 corpus + 아직 빌드하지 않은 GPT 소스)
+    # 빌드된 corpus는 저장소가 최신이면 본문/카테고리 수만 읽음 (레코드 전체를 올리지 않음)
+    store = fresh_store(args.store, QUOTES_FILE)
+    if store is not None:
+        with store:
+            corpus_texts = store.texts()
+            category_counts = store.categories()
+    else:
+        existing_quotes = load_records(QUOTES_FILE) if os.path.exists(QUOTES_FILE) else []
+        corpus_texts = [q['quote'] for q in existing_quotes]
+        category_counts = Counter(q.get('category') for q in existing_quotes)
+    source_quotes = load_records(GPT_SOURCE_FILE) if os.path.exists(GPT_SOURCE_FILE) else []
+    
+    print(f"Existing quotes: {len(corpus_texts)} (+{len(source_quotes)} in {GPT_SOURCE_FILE})")
+    
+    new_quotes = []
+    existing_quote_texts = set(corpus_texts) | set(q['quote'] for q in source_quotes)
+    print(f"Unique quotes: {len(existing_quote_texts)}")
+    
+    # 사소한 변형까지 걸러내기 위한 유사 중복 인덱스
+    near_index = NearDuplicateIndex(threshold=args.similarity)
+    for text in existing_quote_texts:
+        near_index.add(text, text)
+    near_skipped = 0
+    merge_lock = threading.Lock()
+    
+    def merge(quote):
+        """
+        완전 중복/유사 중복이 아니면 새 명언 목록에 추가하고 True 반환
+        스트리밍 모드에서는 워커 스레드가 명언 줄마다 바로 호출하므로 잠금 안에서 처리
+        """
+        nonlocal near_skipped
+        with merge_lock:
+            METRICS.inc('parsed', category=quote['category'])
+            if quote['quote'] in existing_quote_texts:
+                return False
+            if near_index.find_duplicate(quote['quote']) is not None:
+                near_skipped += 1
+                return False
+            new_quotes.append({
+                "quote": quote['quote'],
+                "author": quote['author'],
+                "category": quote['category'],
+                "tags": []
+            })
+            existing_quote_texts.add(quote['quote'])
+            near_index.add(quote['quote'], quote['quote'])
+            METRICS.inc('added', category=quote['category'])
+            return True
+    
+    # 호출 전 예산 계획: 많이 쓰는 카테고리부터, 예산을 넘는 카테고리는 이번 실행에서 뺀다
+    category_weights = args.category_weights or count_shares(category_counts)
+    plan = plan_budget(
+        CATEGORIES,
+        lambda category: generation_estimate(category, args.num_quotes),
+        priority=lambda category: category_weights.get(category, 0.0),
+        max_tokens=args.budget_tokens,
+        max_usd=args.budget_usd,
+        model=METRICS.model,
+        group=lambda category: category,
+    )
+    requests = len(plan['selected'])
+    duration = estimate_duration(requests, plan['tokens_in'] + plan['tokens_out'], args.rps, args.tpm, args.concurrency)
+    print(format_plan(plan, requests, duration, group_name='category'))
+    if args.dry_run:
+        print("Dry run: no API calls made")
+        return
+    categories = plan['selected']
+    
+    # 워커 수만큼 keep-alive 연결을 유지하는 공유 HTTP 클라이언트
+    configure_from_args(args)
+    
+    # 실행 중 예산 상한 (실제 usage 기준, 넘으면 남은 카테고리는 호출 없이 건너뜀)
+    budget = None
+    if args.budget_tokens is not None or args.budget_usd is not None:
+        budget = BudgetGuard(METRICS, max_tokens=args.budget_tokens, max_usd=args.budget_usd)
+    
+    # 카테고리별 요청을 동시에 보내고, 도착하는 순서대로 바로 병합 (중복 제거)
+    engine = ApiEngine(
+        RateLimiter(requests_per_sec=args.rps, tokens_per_min=args.tpm),
+        concurrency=args.concurrency,
+        max_retries=args.max_retries,
+        metrics=METRICS,
+        budget=budget,
+    )
+    started = time.monotonic()
+    latencies = {}
+    METRICS.progress_interval = args.progress_interval
+    METRICS.meta.update({'categories': len(categories), 'num_quotes': args.num_quotes,
+                         'concurrency': args.concurrency, 'rps': args.rps, 'tpm': args.tpm, 'stream': args.stream,
+                         'plan': plan_summary(plan, requests, duration)})
+    METRICS.start(len(categories))
+    for category in plan['deferred']:
+        METRICS.inc('deferred', category=category)
+        print(f"[BUDGET] {category} deferred (over budget)")
+    
+    print(f"\nGenerating quotes for {len(categories)} categories{' (streaming)' if args.stream else ''}...")
+    if args.stream:
+        worker = lambda category: timed_stream(category, args.num_quotes, merge)
+    else:
+        worker = lambda category: timed_generate(category, args.num_quotes)
+    results = engine.run(
+        categories,
+        worker,
+        lambda category: MAX_TOKENS,
+        lambda category: {'category': category},
+    )
+    for category, result in results:
+        output, latency = result if result else (None, None)
+        if latency is not None:
+            latencies[category] = latency
+        if not output and budget is not None and budget.exhausted:
+            METRICS.inc('deferred', category=category)
+            print(f"[BUDGET] {category} skipped (over budget)")
+            METRICS.advance()
+            continue
+        if not output:
+            print(f"[FAIL] {category}")
+            METRICS.advance()
+            continue
+        
+        if args.stream:
+            # 명언은 스트림을 받는 동안 이미 병합됨
+            parsed, added, first = output
+            first_text = f"first after {first:.1f}s, " if first is not None else ''
+            print(f"Streamed {parsed} quotes for {category} ({added} new, {first_text}{latency:.1f}s)")
+        else:
+            parsed = parse_quotes(output, category)
+            added = sum(merge(quote) for quote in parsed)
+            print(f"Generated {len(parsed)} quotes for {category} ({added} new, {latency:.1f}s)")
+        METRICS.advance()
+    
+    # GPT 소스에 덧붙여 저장 (quotes.json은 build_corpus.py가 다시 만든다)
+    os.makedirs(os.path.dirname(GPT_SOURCE_FILE), exist_ok=True)
+    write_records(GPT_SOURCE_FILE, source_quotes + new_quotes)
+    
+    print(f"\nNew quotes added: {len(new_quotes)} -> {GPT_SOURCE_FILE} ({len(source_quotes) + len(new_quotes)} total)")
+    if new_quotes:
+        print("Run 'python scripts/build_corpus.py' to rebuild assets/quotes.json with the new quotes")
+    print(f"Near-duplicates skipped: {near_skipped} (similarity >= {args.similarity})")
+    if latencies:
+        print(f"Wall time: {time.monotonic() - started:.1f}s "
+              f"(slowest category {max(latencies.values()):.1f}s, "
+              f"sum of category latencies {sum(latencies.values()):.1f}s)")
+    METRICS.inc('near_duplicates', near_skipped)
+    print(f"Run report: {METRICS.write_report(args.report)}")
 
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,9 @@
 #!/usr/bin/env python3
 """
-상업적으로 사용 가능한 명언 데이터셋 생성 스크립트
+상업적으로 사용 가능한 명언 기본 목록 (build_corpus.py의 기본 소스)
 공개 도메인 및 상업 사용 가능한 명언들로 구성
 """
 
-import json
-import random
-
 # 상업적으로 사용 가능한 명언 데이터 (공개 도메인 및 유명 인물들의 명언)
 COMMERCIAL_QUOTES = [
     # Happiness
@@ -130,32 +127,10 @@ COMMERCIAL_QUOTES = [
     {"quote": "Time is the longest distance between two places.", "author": "Tennessee Williams", "category": "time"},
 ]
 
-def generate_quotes_dataset(num_quotes=1000):
-    """상업적으로 사용 가능한 명언 데이터셋 생성"""
-    quotes = []
-    
-    # 기본 명언들을 반복하여 더 많은 데이터 생성
-    # 실제로는 더 많은 공개 도메인 명언을 추가해야 함
-    for i in range(num_quotes):
-        base_quote = COMMERCIAL_QUOTES[i % len(COMMERCIAL_QUOTES)]
-        quotes.append({
-            "id": i,
-            "quote": base_quote["quote"],
-            "author": base_quote["author"],
-            "category": base_quote["category"],
-            "tags": []
-        })
-    
-    return quotes
-
+# 이 목록은 build_corpus.py의 기본 소스다. 예전처럼 반복해서 채운 목록으로 quotes.json을 직접 다시 쓰면
+# GPT 소스의 명언과 안정 id가 사라지므로, 실행하면 빌드 파이프라인으로 넘긴다
 if __name__ == "__main__":
-    # 약 2000개의 명언 생성 (10개 카테고리 x 200개씩)
-    quotes = generate_quotes_dataset(2000)
-    
-    # JSON 파일로 저장
-    with open('../assets/quotes.json', 'w', encoding='utf-8') as f:
-        json.dump(quotes, f, indent=2, ensure_ascii=False)
-    
-    print(f"Generated {len(quotes)} commercial-use quotes")
-    print(f"Categories: {set(q['category'] for q in quotes)}")
+    import build_corpus
 
+    print("generate_quotes.py no longer writes assets/quotes.json; running build_corpus.py instead")
+    build_corpus.main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+API 호출 스크립트용 메트릭/진행 상황 수집
+
+- 카운터: 요청, 재시도, 실패, 캐시 히트, 토큰 사용량 (언어/카테고리 라벨별)
+- 히스토그램: 요청 지연, 요청당 입력/출력 토큰 (로그 구간, p50/p90/p99 근사)
+- 일정 간격으로 처리량/ETA 진행 줄 출력, 끝나면 JSON 실행 리포트 저장
+
+사용 예:
+  metrics = Metrics('pre_translate', model='gpt-4o-mini')
+  metrics.start(total=len(jobs))
+  metrics.observe('latency_s', 0.42, lang='ko')
+  metrics.advance()
+  metrics.write_report()
+"""
+
+import datetime
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_REPORT_DIR = os.path.join(SCRIPT_DIR, '.cache', 'reports')
+
+# 1M 토큰당 USD (입력, 출력)
+PRICING = {
+    'gpt-4o-mini': (0.15, 0.60),
+}
+
+
+def metric_key(name, labels):
+    """'latency_s' + {'lang': 'ko'} -> 'latency_s{lang=ko}'"""
+    if not labels:
+        return name
+    return name + '{' + ','.join(f'{k}={v}' for k, v in sorted(labels.items())) + '}'
+
+
+class Histogram:
+    """
+    로그 구간 히스토그램 (구간당 약 10% 폭)
+    값을 전부 들고 있지 않고 구간 카운트로 백분위수를 근사한다
+    """
+
+    GROWTH = 1.1
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._buckets = {}
+
+    def _bucket(self, value):
+        if value <= 0:
+            return None
+        return math.floor(math.log(value, self.GROWTH))
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        bucket = self._bucket(value)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, q):
+        """q(0~1) 백분위수 근사 (구간 상한, 관측 범위로 자름)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self._buckets, key=lambda b: -math.inf if b is None else b):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                value = 0.0 if bucket is None else self.GROWTH ** (bucket + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'sum': round(self.total, 4),
+            'mean': round(self.total / self.count, 4),
+            'min': round(self.min, 4),
+            'max': round(self.max, 4),
+            'p50': round(self.percentile(0.5), 4),
+            'p90': round(self.percentile(0.9), 4),
+            'p99': round(self.percentile(0.99), 4),
+        }
+
+
+class Metrics:
+    """스레드 안전한 카운터/히스토그램 모음 + 진행 줄 + 실행 리포트"""
+
+    def __init__(self, name, model=None, progress_interval=10.0, stream=sys.stdout):
+        self.name = name
+        self.model = model
+        self.progress_interval = progress_interval
+        self.stream = stream
+        self.counters = {}
+        self.histograms = {}
+        self.meta = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._started_at = datetime.datetime.now()
+        self._total = 0
+        self._done = 0
+        self._progress_started = self._started
+        self._last_progress = self._started
+
+    def inc(self, name, amount=1, **labels):
+        key = metric_key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = metric_key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def record_usage(self, usage, **labels):
+        """OpenAI 응답의 usage 필드를 토큰 카운터/히스토그램에 반영"""
+        if not isinstance(usage, dict):
+            return
+        tokens_in = usage.get('prompt_tokens') or 0
+        tokens_out = usage.get('completion_tokens') or 0
+        self.inc('tokens_in', tokens_in, **labels)
+        self.inc('tokens_out', tokens_out, **labels)
+        self.observe('tokens_in_per_request', tokens_in, **labels)
+        self.observe('tokens_out_per_request', tokens_out, **labels)
+
+    def total(self, name):
+        """라벨과 무관하게 합친 카운터 값"""
+        with self._lock:
+            return sum(value for key, value in self.counters.items()
+                       if key == name or key.startswith(name + '{'))
+
+    def merged(self, name):
+        """라벨과 무관하게 합친 히스토그램"""
+        merged = Histogram()
+        with self._lock:
+            for key, histogram in self.histograms.items():
+                if key != name and not key.startswith(name + '{'):
+                    continue
+                merged.count += histogram.count
+                merged.total += histogram.total
+                for bound in (histogram.min, histogram.max):
+                    if bound is not None:
+                        merged.min = bound if merged.min is None else min(merged.min, bound)
+                        merged.max = bound if merged.max is None else max(merged.max, bound)
+                for bucket, count in histogram._buckets.items():
+                    merged._buckets[bucket] = merged._buckets.get(bucket, 0) + count
+        return merged
+
+    def cost_usd(self):
+        price = PRICING.get(self.model)
+        if price is None:
+            return None
+        return (self.total('tokens_in') * price[0] + self.total('tokens_out') * price[1]) / 1_000_000
+
+    # 진행 상황
+
+    def start(self, total):
+        """진행 줄 기준 작업 수 설정 (처리량/ETA는 이 시점부터 계산)"""
+        with self._lock:
+            self._total = total
+            self._done = 0
+            self._progress_started = time.monotonic()
+            self._last_progress = self._progress_started
+
+    def advance(self, amount=1):
+        """작업 완료를 기록하고, 간격이 지났거나 마지막 작업이면 진행 줄 출력"""
+        with self._lock:
+            self._done += amount
+            now = time.monotonic()
+            due = now - self._last_progress >= self.progress_interval or self._done >= self._total
+            if due:
+                self._last_progress = now
+        if due:
+            self.print_progress()
+
+    def progress_line(self):
+        with self._lock:
+            done, total = self._done, self._total
+            elapsed = time.monotonic() - self._progress_started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else None
+        latency = self.merged('latency_s')
+        parts = [
+            f"[progress] {done}/{total}" + (f" ({done / total:.1%})" if total else ''),
+            f"{rate:.2f}/s",
+            f"ETA {_format_seconds(eta)}" if eta is not None else 'ETA -',
+        ]
+        if latency.count:
+            parts.append(f"latency p50 {latency.percentile(0.5):.2f}s p90 {latency.percentile(0.9):.2f}s")
+        parts.append(f"retries {self.total('retries')}")
+        parts.append(f"failures {self.total('failures')}")
+        cost = self.cost_usd()
+        if cost is not None and self.total('tokens_in'):
+            parts.append(f"${cost:.4f}")
+        return ' | '.join(parts)
+
+    def print_progress(self):
+        print(self.progress_line(), file=self.stream, flush=True)
+
+    # 리포트
+
+    def report(self):
+        elapsed = time.monotonic() - self._started
+        with self._lock:
+            counters = dict(sorted(self.counters.items()))
+            histograms = {key: h.summary() for key, h in sorted(self.histograms.items())}
+            done = self._done
+        cost = self.cost_usd()
+        return {
+            'name': self.name,
+            'model': self.model,
+            'started_at': self._started_at.isoformat(timespec='seconds'),
+            'elapsed_s': round(elapsed, 3),
+            'completed': done,
+            'throughput_per_s': round(done / elapsed, 3) if elapsed > 0 else None,
+            'tokens': {'in': self.total('tokens_in'), 'out': self.total('tokens_out')},
+            'cost_usd': round(cost, 6) if cost is not None else None,
+            'meta': self.meta,
+            'counters': counters,
+            'histograms': histograms,
+        }
+
+    def write_report(self, path=None):
+        """JSON 실행 리포트 저장 (기본 scripts/.cache/reports/<name>-<시각>.json), 경로 반환"""
+        if path is None:
+            stamp = self._started_at.strftime('%Y%m%d-%H%M%S')
+            path = os.path.join(DEFAULT_REPORT_DIR, f'{self.name}-{stamp}.json')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+            f.write('\n')
+        return path
+
+
+def _format_seconds(seconds):
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
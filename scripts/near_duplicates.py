@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+유사 중복 명언 검출 (word shingle + MinHash + LSH)
+"If you are working on something (exciting) that you really care about..." 같은
+사소한 변형을 전체 쌍 비교(O(n²)) 없이 찾아낸다
+
+사용 예:
+  python scripts/near_duplicates.py assets/quotes.json --threshold 0.7
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import struct
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def shingles(text, size=2):
+    """소문자/구두점 제거 후 단어 n-gram 집합 (짧은 문장은 단어 자체를 사용)"""
+    words = _WORD_RE.findall(text.lower().replace('’', "'"))
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _shingle_hash(shingle):
+    return struct.unpack('<Q', hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest())[0]
+
+
+def choose_bands(threshold, num_perm):
+    """
+    LSH 밴드 수(b)와 밴드당 행 수(r) 선택
+    후보 임계값 (1/b)^(1/r)이 threshold 이하이면서 가장 가까운 조합 (재현율 우선, 정확한 Jaccard로 재확인)
+    """
+    best = (1, num_perm)
+    best_gap = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        approx = (1.0 / bands) ** (1.0 / rows)
+        if approx > threshold:
+            continue
+        gap = threshold - approx
+        if best_gap is None or gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    MinHash 서명을 밴드로 나눠 버킷에 넣는 LSH 인덱스
+    질의는 같은 버킷에 걸린 후보만 정확한 Jaccard로 확인하므로 corpus 크기에 대해 준선형
+    signatures: 문장 -> 서명 memo (빌드 사이에 재사용하면 바뀐 문장만 서명을 계산, 없으면 인덱스 안에서만)
+    """
+
+    def __init__(self, threshold=0.7, num_perm=64, shingle_size=2, seed=1, signatures=None):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        self.seed = seed
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets = [{} for _ in range(self.bands)]
+        self._shingles = {}
+        self.signatures = {} if signatures is None else signatures
+
+    def params(self):
+        """서명을 결정하는 파라미터 (memo를 재사용해도 되는지 확인용, threshold는 무관)"""
+        return {'num_perm': self.num_perm, 'shingle_size': self.shingle_size, 'seed': self.seed}
+
+    def signature(self, text):
+        """문장의 MinHash 서명 (memo에 있으면 재사용)"""
+        signature = self.signatures.get(text)
+        if signature is None:
+            signature = self.signatures[text] = self._signature(shingles(text, self.shingle_size))
+        return signature
+
+    def _signature(self, shingle_set):
+        hashes = [_shingle_hash(s) for s in shingle_set]
+        if not hashes:
+            return [MAX_HASH] * self.num_perm
+        return [
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def _band_keys(self, signature):
+        r = self.rows
+        return [tuple(signature[i * r:(i + 1) * r]) for i in range(self.bands)]
+
+    def add(self, key, text):
+        self._shingles[key] = shingles(text, self.shingle_size)
+        for band, band_key in zip(self._buckets, self._band_keys(self.signature(text))):
+            band.setdefault(band_key, []).append(key)
+
+    def query(self, text):
+        """threshold 이상 유사한 기존 항목 [(key, similarity)] (유사도 내림차순)"""
+        shingle_set = shingles(text, self.shingle_size)
+        candidates = set()
+        for band, band_key in zip(self._buckets, self._band_keys(self.signature(text))):
+            candidates.update(band.get(band_key, ()))
+        matches = []
+        for key in candidates:
+            similarity = jaccard(shingle_set, self._shingles[key])
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda item: -item[1])
+        return matches
+
+    def find_duplicate(self, text):
+        """가장 비슷한 기존 항목의 key (없으면 None)"""
+        matches = self.query(text)
+        return matches[0][0] if matches else None
+
+    def clusters(self):
+        """인덱스 안의 유사 중복 묶음 (2개 이상인 그룹만, union-find)"""
+        parent = {key: key for key in self._shingles}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for band in self._buckets:
+            for keys in band.values():
+                for i in range(len(keys)):
+                    for j in range(i + 1, len(keys)):
+                        a, b = keys[i], keys[j]
+                        if find(a) != find(b) and jaccard(self._shingles[a], self._shingles[b]) >= self.threshold:
+                            parent[find(b)] = find(a)
+
+        groups = {}
+        for key in self._shingles:
+            groups.setdefault(find(key), []).append(key)
+        return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report clusters of near-duplicate quotes')
+    parser.add_argument('path', nargs='?', default='assets/quotes.json', help='명언 JSON 파일')
+    parser.add_argument('--threshold', type=float, default=0.7, help='Jaccard 유사도 임계값')
+    args = parser.parse_args()
+
+    with open(args.path, 'r', encoding='utf-8') as f:
+        quotes = json.load(f)
+
+    # 완전히 같은 문장은 하나만 인덱스에 넣고, 유사 중복 묶음만 보고
+    index = NearDuplicateIndex(threshold=args.threshold)
+    by_text = {}
+    for quote in quotes:
+        if quote['quote'] not in by_text:
+            by_text[quote['quote']] = quote
+            index.add(quote['quote'], quote['quote'])
+
+    clusters = index.clusters()
+    print(f"Quotes: {len(quotes)}, unique texts: {len(by_text)}, "
+          f"near-duplicate clusters: {len(clusters)} (threshold {args.threshold})")
+    for cluster in clusters:
+        print()
+        for text in cluster:
+            print(f"  - {text} ({by_text[text]['author']})")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,45 @@
 #!/usr/bin/env python3
 """
 GPT-4o mini를 사용하여 모든 명언을 주요 8개 언어로 미리 번역
+--dry-run이면 호출 없이 토큰/비용/시간 추정만, --budget-tokens/--budget-usd로 상한 (token_budget.py)
 """
 
+import argparse
 import json
 import os
-import time
-import requests
+
+from api_client import add_client_args, configure_from_args, get_client
+from api_engine import ApiEngine, RateLimiter, estimate_tokens
+from checkpoint import TranslationJournal
+from corpus_io import iter_items, load_records, write_items
+from corpus_store import DEFAULT_STORE_FILE, CorpusStore, fresh_store
+from metrics import Metrics
+from token_budget import (BudgetGuard, add_budget_args, category_shares, estimate_duration, format_plan,
+                          parse_weights, plan_budget, plan_summary)
+from translation_cache import DEFAULT_CACHE_FILE, DEFAULT_MAX_ENTRIES, TranslationCache, text_hash
+from translation_qa import find_failures, looks_like_refusal, summarize, translation_items
+from translation_shards import write_shards
 
 # OpenAI API 설정
 API_KEY = os.environ.get('OPENAI_API_KEY', '')
-API_URL = 'https://api.openai.com/v1/chat/completions'
+# 로컬 스텁 서버로 테스트할 때는 OPENAI_API_URL로 덮어쓴다
+API_URL = os.environ.get('OPENAI_API_URL', 'https://api.openai.com/v1/chat/completions')
+MODEL = 'gpt-4o-mini'
+MAX_TOKENS = 500
+# 프롬프트를 바꾸면 올려서 캐시된 예전 번역을 쓰지 않도록 함
+PROMPT_VERSION = 'v1'
+# 배치 요청 1건의 응답 토큰 예산
+BATCH_MAX_TOKENS = 4000
+
+QUOTES_FILE = 'assets/quotes.json'
+OUTPUT_FILE = 'assets/quotes_translations.json'
+# 번역이 끝날 때마다 기록하는 체크포인트 (중단 후 재실행 시 이어서 번역)
+JOURNAL_FILE = 'assets/quotes_translations.journal.jsonl'
+# 언어별 샤드 (앱은 현재 언어 하나만, 도구는 언어 하나씩 스트리밍으로 읽음)
+SHARDS_DIR = 'assets/translations'
+
+# 요청 지연/토큰/재시도/캐시 히트 등 실행 메트릭 (언어별 라벨)
+METRICS = Metrics('pre_translate', model=MODEL)
 
 # 번역할 주요 언어 6개
 TARGET_LANGUAGES = {
@@ -22,44 +51,60 @@ TARGET_LANGUAGES = {
     'pt': 'Portuguese',
 }
 
-def translate_quote(quote_text, target_lang_code, target_lang_name):
-    """GPT-4o mini를 사용하여 명언 번역"""
+def system_prompt(target_lang_name, hint=None):
+    prompt = f'You are a professional translator. Translate the given English quote to {target_lang_name}. Maintain the meaning, tone, and style of the original quote. Only return the translation, nothing else.'
+    if hint:
+        prompt += ' ' + hint
+    return prompt
+
+def is_valid_translation(translation):
+    """
+    빈 응답이나 번역 대신 사과/설명으로 답한 응답 거르기
+    (나머지 품질 검사는 translation_qa 단계에서 출력 전체를 대상으로 함)
+    """
+    return bool(translation) and not looks_like_refusal(translation)
+
+def retry_hint(reasons):
+    """품질 검사에서 떨어진 번역을 다시 요청할 때 시스템 프롬프트에 덧붙이는 문장"""
+    return (f'A previous translation was rejected by automatic checks ({", ".join(reasons)}). '
+            'Translate the whole quote, write it in the target language and script, '
+            'and do not add quotation marks or commentary.')
+
+def translate_quote(quote_text, target_lang_code, target_lang_name, hint=None):
+    """
+    GPT-4o mini를 사용하여 명언 번역
+    429/5xx/네트워크 오류는 RetryableError로 올려서 엔진이 백오프 후 재시도하게 한다
+    hint는 품질 검사 재시도 때 시스템 프롬프트에 덧붙인다
+    """
     if not API_KEY:
         print("ERROR: OPENAI_API_KEY environment variable not set")
         return None
     
-    try:
-        response = requests.post(
-            API_URL,
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {API_KEY}',
+    response = get_client().post_json(API_URL, API_KEY, {
+        'model': MODEL,
+        'messages': [
+            {
+                'role': 'system',
+                'content': system_prompt(target_lang_name, hint),
             },
-            json={
-                'model': 'gpt-4o-mini',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': f'You are a professional translator. Translate the given English quote to {target_lang_name}. Maintain the meaning, tone, and style of the original quote. Only return the translation, nothing else.',
-                    },
-                    {
-                        'role': 'user',
-                        'content': quote_text,
-                    },
-                ],
-                'temperature': 0.3,
-                'max_tokens': 500,
+            {
+                'role': 'user',
+                'content': quote_text,
             },
-            timeout=30
-        )
-        
+        ],
+        'temperature': 0.3,
+        'max_tokens': MAX_TOKENS,
+    })
+    
+    try:
         if response.status_code == 200:
             data = response.json()
+            METRICS.record_usage(data.get('usage'), lang=target_lang_code)
             translation = data['choices'][0]['message']['content'].strip()
             
-            # 에러 체크
-            if translation and not any(word in translation.lower() for word in ['error', 'sorry', 'cannot']):
+            if is_valid_translation(translation):
                 return translation
+            METRICS.inc('invalid', lang=target_lang_code)
         else:
             print(f"API Error: {response.status_code} - {response.text}")
             
@@ -68,62 +113,546 @@ def translate_quote(quote_text, target_lang_code, target_lang_name):
     
     return None
 
+BATCH_SYSTEM_PROMPT = (
+    'You are a professional translator. You receive a JSON object with an "items" array. '
+    'Translate the English "text" of every item into the language named in its "lang" field. '
+    'Maintain the meaning, tone, and style of each original quote. '
+    'Return only a JSON object of the form {"translations": [{"key": "<item key>", "translation": "<translated text>"}]} '
+    'with exactly one entry per input item.'
+)
+
+def batch_output_tokens(quote_text):
+    """배치 응답에서 항목 1개가 차지할 토큰 추정치 (CJK 팽창 + JSON 오버헤드)"""
+    return estimate_tokens(quote_text) * 3 + 20
+
+def make_batches(jobs, mode, batch_size, max_tokens=BATCH_MAX_TOKENS):
+    """
+    번역 작업을 배치로 묶기
+    mode='languages': 명언 1개 × 모든 언어
+    mode='quotes': 같은 언어의 명언 batch_size개
+    응답이 max_tokens를 넘을 것 같으면 배치를 더 잘게 나눈다
+    """
+    groups = {}
+    for job in jobs:
+        quote_id, _, lang_code, _ = job
+        groups.setdefault(quote_id if mode == 'languages' else lang_code, []).append(job)
+    
+    batches = []
+    for group in groups.values():
+        batch, budget = [], 0
+        for job in group:
+            cost = batch_output_tokens(job[1])
+            if batch and (len(batch) >= batch_size or budget + cost > max_tokens):
+                batches.append(batch)
+                batch, budget = [], 0
+            batch.append(job)
+            budget += cost
+        if batch:
+            batches.append(batch)
+    return batches
+
+def translate_batch(batch, prompt=BATCH_SYSTEM_PROMPT, validate=None):
+    """
+    여러 (명언, 언어) 쌍을 요청 1건으로 번역
+    {(quote_id, lang_code): translation} 반환 - 누락/깨진 항목은 빠지고 호출자가 개별 재시도한다
+    prompt/validate(원문, 번역)로 UI 문자열 같은 다른 종류의 텍스트도 같은 경로로 번역할 수 있다
+    """
+    items = [
+        {'key': str(index), 'lang': lang_name, 'text': quote_text}
+        for index, (_, quote_text, _, lang_name) in enumerate(batch)
+    ]
+    max_tokens = min(16000, sum(batch_output_tokens(job[1]) for job in batch) + 50)
+    
+    response = get_client().post_json(API_URL, API_KEY, {
+        'model': MODEL,
+        'messages': [
+            {'role': 'system', 'content': prompt},
+            {'role': 'user', 'content': json.dumps({'items': items}, ensure_ascii=False)},
+        ],
+        'temperature': 0.3,
+        'max_tokens': max_tokens,
+        'response_format': {'type': 'json_object'},
+    })
+    
+    results = {}
+    if response.status_code != 200:
+        print(f"API Error: {response.status_code} - {response.text}")
+        return results
+    
+    try:
+        data = response.json()
+        METRICS.record_usage(data.get('usage'), **batch_labels(batch))
+        content = data['choices'][0]['message']['content']
+        entries = json.loads(content).get('translations', [])
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+        print(f"Batch parse error: {e}")
+        return results
+    
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            quote_id, quote_text, lang_code, _ = batch[int(entry.get('key'))]
+        except (TypeError, ValueError, IndexError):
+            continue
+        translation = entry.get('translation')
+        if not isinstance(translation, str):
+            continue
+        translation = translation.strip()
+        valid = validate(quote_text, translation) if validate else is_valid_translation(translation)
+        if valid:
+            results[(quote_id, lang_code)] = translation
+    return results
+
+def batch_labels(batch):
+    """배치 메트릭 라벨 (언어가 섞인 languages 모드는 'mixed')"""
+    langs = {job[2] for job in batch}
+    return {'lang': langs.pop() if len(langs) == 1 else 'mixed'}
+
+def batch_token_cost(batch):
+    """tokens/min 제한용 배치 요청 1건의 토큰 추정치"""
+    return (
+        estimate_tokens(BATCH_SYSTEM_PROMPT)
+        + sum(estimate_tokens(job[1]) + 10 for job in batch)
+        + sum(batch_output_tokens(job[1]) for job in batch)
+    )
+
+def translation_token_cost(job):
+    """tokens/min 제한용 요청 1건의 토큰 추정치 (프롬프트 + 본문 + 최대 응답)"""
+    quote_text, _, lang_name = job[1:]
+    return estimate_tokens(system_prompt(lang_name)) + estimate_tokens(quote_text) + MAX_TOKENS
+
+def plan_estimate(job, batch_mode='none', batch_size=1):
+    """
+    예산 계획용 (입력, 출력) 토큰 추정 - 응답은 최대치(MAX_TOKENS)가 아니라 본문 길이 기준
+    배치 모드는 시스템 프롬프트를 배치 하나에 들어가는 작업 수로 나눠서 얹는다
+    """
+    quote_text, _, lang_name = job[1:]
+    if batch_mode == 'none':
+        return estimate_tokens(system_prompt(lang_name)) + estimate_tokens(quote_text), estimate_tokens(quote_text) * 3
+    share = batch_size if batch_mode == 'quotes' else len(TARGET_LANGUAGES)
+    return estimate_tokens(BATCH_SYSTEM_PROMPT) // share + estimate_tokens(quote_text) + 10, batch_output_tokens(quote_text)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Pre-translate assets/quotes.json with GPT-4o mini')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 수')
+    parser.add_argument('--rps', type=float, default=3.0, help='초당 최대 요청 수')
+    parser.add_argument('--tpm', type=int, default=None, help='분당 최대 토큰 수')
+    parser.add_argument('--max-retries', type=int, default=5, help='429/5xx 재시도 횟수')
+    parser.add_argument('--batch-mode', choices=['none', 'quotes', 'languages'], default='none',
+                        help='quotes: 같은 언어의 명언 N개씩, languages: 명언 1개 × 모든 언어')
+    parser.add_argument('--batch-size', type=int, default=20, help='quotes 모드에서 요청 1건당 명언 수')
+    parser.add_argument('--batch-max-tokens', type=int, default=BATCH_MAX_TOKENS,
+                        help='배치 요청 1건의 응답 토큰 예산 (넘으면 배치를 나눔)')
+    parser.add_argument('--journal', default=JOURNAL_FILE, help='체크포인트 저널 경로')
+    parser.add_argument('--keep-journal', action='store_true', help='컴팩션 후에도 저널을 지우지 않음')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILE, help='공유 번역 캐시 경로')
+    parser.add_argument('--cache-max-entries', type=int, default=DEFAULT_MAX_ENTRIES, help='캐시 최대 항목 수 (LRU 제거)')
+    parser.add_argument('--no-cache', action='store_true', help='번역 캐시 사용 안 함')
+    parser.add_argument('--delta', action='store_true',
+                        help='기존 출력 파일과 원문 해시로 비교해 추가/변경된 명언만 번역')
+    parser.add_argument('--compact-only', action='store_true', help='API 호출 없이 저널만 출력 파일로 컴팩션')
+    parser.add_argument('--shards-dir', default=SHARDS_DIR, help='언어별 번역 샤드 디렉터리')
+    parser.add_argument('--no-shards', action='store_true', help='언어별 샤드를 만들지 않음')
+    parser.add_argument('--store', default=DEFAULT_STORE_FILE, help='corpus 저장소 (빈 문자열이면 쓰지 않음)')
+    parser.add_argument('--qa-rounds', type=int, default=2, help='품질 검사 실패 항목 재번역 횟수 (0이면 재번역 없이 실패한 번역을 바로 버림)')
+    parser.add_argument('--qa-workers', type=int, default=os.cpu_count(), help='품질 검사 프로세스 수')
+    parser.add_argument('--no-qa', action='store_true', help='품질 검사 단계 건너뜀')
+    parser.add_argument('--lang-weights', type=parse_weights, default=None,
+                        help='언어 우선순위 가중치 (예: ko=40,ja=25, 기본: 모두 같음)')
+    add_budget_args(parser)
+    parser.add_argument('--progress-interval', type=float, default=10.0, help='진행 줄(처리량/ETA) 출력 간격 (초)')
+    parser.add_argument('--report', default=None, help='JSON 실행 리포트 경로 (기본 scripts/.cache/reports/)')
+    add_client_args(parser)
+    return parser.parse_args()
+
+def diff_corpus(quotes, output_file=OUTPUT_FILE):
+    """
+    현재 corpus와 기존 번역 파일을 원문 해시로 비교
+    ({quote_id: 재사용할 번역}, 통계) 반환 - id가 바뀌어도 원문이 같으면 재사용한다
+    """
+    if not os.path.exists(output_file):
+        return {}, {'unchanged': 0, 'added': len(quotes), 'removed': 0}
+    
+    by_hash = {}
+    for _, entry in iter_items(output_file):
+        by_hash.setdefault(text_hash(entry['quote']), entry.get('translations', {}))
+    
+    reused = {}
+    current_hashes = set()
+    for quote in quotes:
+        digest = text_hash(quote['quote'])
+        current_hashes.add(digest)
+        if digest in by_hash:
+            reused[quote['id']] = by_hash[digest]
+    
+    stats = {
+        'unchanged': len(reused),
+        'added': len(quotes) - len(reused),
+        'removed': len(set(by_hash) - current_hashes),
+    }
+    return reused, stats
+
+def quality_gate(translations, engine, rounds, workers, on_retry, on_drop=None):
+    """
+    번역 출력 전체를 프로세스 풀에서 품질 검사하고, 실패한 (명언, 언어)는 재시도 큐에 넣어 다시 번역
+    rounds번 다시 번역해도 실패하는 번역은 출력에서 빼고 on_drop(quote_id, 원문, lang)으로 알린다
+    (저널/캐시에서도 지워서 다음 실행이 다시 번역하도록, 앱은 그동안 온라인 번역으로 대체)
+    마지막까지 실패한 항목 목록 반환
+    rounds=0이면 engine 없이 재번역만 건너뛰고, 실패한 번역은 똑같이 빼고 on_drop한다
+    (검사 자체를 건너뛰려면 --no-qa)
+    """
+    for attempt in range(rounds + 1):
+        failures = find_failures(translation_items(translations), workers)
+        by_reason, by_lang = summarize(failures)
+        print(f"\nQuality gate: {len(failures)} translations failed"
+              + (f" (by reason {by_reason}, by language {by_lang})" if failures else ''))
+        for _, lang, reasons in failures:
+            METRICS.inc('qa_failed', lang=lang)
+            for reason in reasons:
+                METRICS.inc('qa_reason', reason=reason.split(':')[0])
+        if not failures or attempt == rounds:
+            break
+        
+        hints = {(quote_id, lang): retry_hint(reasons) for quote_id, lang, reasons in failures}
+        queue = [
+            (quote_id, translations[quote_id]['quote'], lang, TARGET_LANGUAGES[lang])
+            for quote_id, lang, _ in failures
+        ]
+        print(f"Re-translating {len(queue)} failed translations (round {attempt + 1}/{rounds})...")
+        for job, translation in engine.run(
+            queue,
+            lambda job: translate_quote(*job[1:], hint=hints[(job[0], job[2])]),
+            translation_token_cost,
+            lambda job: {'lang': job[2]},
+        ):
+            if translation:
+                on_retry(job, translation)
+    
+    for quote_id, lang, _ in failures:
+        translations[quote_id]['translations'].pop(lang, None)
+        if on_drop is not None:
+            on_drop(quote_id, translations[quote_id]['quote'], lang)
+    if failures:
+        print(f"[WARN] Dropped {len(failures)} translations that still fail the quality gate")
+    return failures
+
+
+def compact(translations, output_file=OUTPUT_FILE, shards_dir=SHARDS_DIR, store_path=DEFAULT_STORE_FILE):
+    """
+    누적된 번역을 기존 출력 형식(quotes_translations.json)으로 저장
+    shards_dir이 있으면 corpus 순서에 맞춘 언어별 샤드 + manifest도 함께 만든다
+    """
+    def ordered():
+        # 언어 순서를 TARGET_LANGUAGES 기준으로 정렬 (완료 순서와 무관하게 동일한 출력)
+        for quote_id, entry in translations.items():
+            yield quote_id, {
+                'quote': entry['quote'],
+                'translations': {
+                    code: entry['translations'][code]
+                    for code in TARGET_LANGUAGES
+                    if code in entry['translations']
+                },
+            }
+    
+    print(f"\nSaving translations to {output_file}...")
+    # 임시 파일에 쓴 뒤 교체하므로 저장 중에 죽어도 기존 파일이 깨지지 않음
+    write_items(output_file, ordered())
+    
+    if shards_dir:
+        manifest = write_shards(
+            shards_dir,
+            translations,
+            {quote_id: entry['translations'] for quote_id, entry in translations.items()},
+            TARGET_LANGUAGES,
+        )
+        print(f"Wrote {len(manifest['languages'])} language shards to {shards_dir}")
+    
+    # 도구용 corpus 저장소가 있으면 번역도 맞춰 둠 (없으면 corpus_store.py / build_corpus.py가 만듦)
+    # 명언별로 통째로 교체 (품질 검사에서 빠진 번역이 저장소에 남지 않도록)
+    if store_path and os.path.exists(store_path):
+        with CorpusStore(store_path) as store:
+            saved = store.replace_translations(
+                (quote_id, entry['translations']) for quote_id, entry in translations.items()
+            )
+        print(f"Updated {saved} translations in {store_path}")
+
 def main():
-    if not API_KEY:
+    args = parse_args()
+    
+    if not API_KEY and not args.compact_only and not args.dry_run:
         print("ERROR: Please set OPENAI_API_KEY environment variable")
         print("Example: export OPENAI_API_KEY='your-api-key'")
         return
     
-    # 명언 데이터 로드
+    # 명언 데이터 로드 (build_corpus.py가 만든 저장소가 최신이면 저장소에서)
     print("Loading quotes...")
-    with open('assets/quotes.json', 'r', encoding='utf-8') as f:
-        quotes = json.load(f)
+    store = fresh_store(args.store, QUOTES_FILE)
+    if store is not None:
+        with store:
+            quotes = list(store)
+    else:
+        quotes = load_records(QUOTES_FILE)
     
     print(f"Total quotes: {len(quotes)}")
     print(f"Target languages: {list(TARGET_LANGUAGES.keys())}")
     
-    # 번역 데이터 구조
-    translations = {}
+    # 이전 실행의 체크포인트 로드
+    journal = TranslationJournal(args.journal)
+    done = journal.load()
     
-    # 각 명언 번역
-    total = len(quotes) * len(TARGET_LANGUAGES)
-    current = 0
+    # 델타 모드: 기존 번역 중 원문이 그대로인 것은 재사용 (삭제된 명언은 출력에서 빠짐)
+    reused = {}
+    if args.delta:
+        reused, delta_stats = diff_corpus(quotes)
+        print(f"Delta: {delta_stats['added']} added/changed, {delta_stats['unchanged']} unchanged, "
+              f"{delta_stats['removed']} removed")
+    
+    # 번역 데이터 구조 (원본 순서 유지)
+    translations = {}
+    jobs = []
+    resumed = 0
     
     for quote in quotes:
-        quote_text = quote['quote']
-        quote_id = quote['id']
-        
-        translations[quote_id] = {
-            'quote': quote_text,
+        translations[quote['id']] = {
+            'quote': quote['quote'],
             'translations': {}
         }
-        
         for lang_code, lang_name in TARGET_LANGUAGES.items():
-            current += 1
-            print(f"[{current}/{total}] Translating quote {quote_id} to {lang_name}...")
-            
-            translation = translate_quote(quote_text, lang_code, lang_name)
-            
+            previous = reused.get(quote['id'], {}).get(lang_code)
+            if previous:
+                translations[quote['id']]['translations'][lang_code] = previous
+                continue
+            # 같은 원문으로 이미 번역된 쌍은 건너뜀 (id가 재사용되어 원문이 바뀐 경우는 다시 번역)
+            checkpoint = done.get((quote['id'], lang_code))
+            if checkpoint and checkpoint['quote'] == quote['quote']:
+                translations[quote['id']]['translations'][lang_code] = checkpoint['translation']
+                resumed += 1
+            else:
+                jobs.append((quote['id'], quote['quote'], lang_code, lang_name))
+    
+    if resumed:
+        print(f"Resuming from checkpoint: {resumed} translations already done, {len(jobs)} remaining")
+    METRICS.inc('resumed', resumed)
+    METRICS.inc('delta_reused', sum(len(entry['translations']) for entry in translations.values()) - resumed)
+    
+    # 내용 기반 캐시: 이전 실행/다른 id의 같은 문장은 API 호출 없이 재사용,
+    # 이번 실행 안에서 반복되는 문장은 한 번만 번역해서 나눠 씀
+    cache = None
+    if not args.no_cache:
+        cache = TranslationCache(args.cache, model=MODEL, prompt_version=PROMPT_VERSION,
+                                 max_entries=args.cache_max_entries)
+    
+    def drop(quote_id, quote_text, lang_code):
+        """품질 검사에서 버린 번역을 저널/캐시에서도 지움 (재실행 시 재사용되지 않도록)"""
+        journal.reject(quote_id, lang_code)
+        if cache is not None:
+            cache.discard(quote_text, lang_code)
+    
+    if args.compact_only:
+        # 재번역 없이 검사만 해서 실패한 번역은 출력하지 않음
+        if not args.no_qa:
+            quality_gate(translations, None, 0, args.qa_workers, None, drop)
+        compact(translations, shards_dir=None if args.no_shards else args.shards_dir, store_path=args.store)
+        # 아직 번역되지 않은 쌍이 있으면 저널을 남겨서 다음 실행이 이어서 번역
+        if args.keep_journal or jobs:
+            journal.close()
+        else:
+            journal.remove()
+        if cache is not None:
+            cache.close()
+        return
+    
+    # 워커 수만큼 keep-alive 연결을 유지하는 공유 HTTP 클라이언트
+    configure_from_args(args)
+    
+    # 실행 중 예산 상한 (실제 usage 기준, 넘으면 남은 작업은 호출 없이 건너뜀)
+    budget = None
+    if args.budget_tokens is not None or args.budget_usd is not None:
+        budget = BudgetGuard(METRICS, max_tokens=args.budget_tokens, max_usd=args.budget_usd)
+    
+    # 동시 번역 (고정 sleep 대신 레이트 리미터 + 적응형 백오프)
+    engine = ApiEngine(
+        RateLimiter(requests_per_sec=args.rps, tokens_per_min=args.tpm),
+        concurrency=args.concurrency,
+        max_retries=args.max_retries,
+        metrics=METRICS,
+        budget=budget,
+    )
+    total = len(jobs)
+    current = 0
+    METRICS.progress_interval = args.progress_interval
+    METRICS.meta.update({
+        'quotes': len(quotes), 'jobs': total, 'concurrency': args.concurrency, 'rps': args.rps,
+        'tpm': args.tpm, 'batch_mode': args.batch_mode, 'batch_size': args.batch_size,
+    })
+    METRICS.start(total)
+    
+    def record(job, translation):
+        nonlocal current
+        quote_id, _, lang_code, lang_name = job
+        current += 1
+        
+        if translation:
+            translations[quote_id]['translations'][lang_code] = translation
+            journal.append(quote_id, lang_code, job[1], translation)
+            METRICS.inc('translated', lang=lang_code)
+            print(f"[{current}/{total}] [OK] {quote_id} {lang_name}: {translation[:50]}...")
+        elif budget is not None and budget.exhausted:
+            # 예산 초과로 건너뜀 (다음 실행에서 이어서 번역)
+            METRICS.inc('deferred', lang=lang_code)
+        else:
+            METRICS.inc('untranslated', lang=lang_code)
+            print(f"[{current}/{total}] [FAIL] Failed to translate quote {quote_id} to {lang_name}")
+        METRICS.advance()
+    
+    groups = {}
+    hits = []
+    for job in jobs:
+        if cache is None:
+            groups[(job[0], job[2])] = [job]
+            continue
+        # dry-run은 캐시를 읽기만 (LRU 순서가 바뀌면 이후 제거 대상이 달라짐)
+        cached = cache.get(job[1], job[2], touch=not args.dry_run)
+        if cached:
+            hits.append((job, cached))
+        else:
+            groups.setdefault(cache.key(job[1], job[2]), []).append(job)
+    unique = [group[0] for group in groups.values()]
+    if cache is not None:
+        print(f"Cache: {total - len(unique)} translations reused from cache or repeated text, "
+              f"{len(unique)} API translations needed")
+    
+    # 호출 전 예산 계획: 많이 쓰는 언어/카테고리부터, 예산을 넘는 꼬리는 이번 실행에서 뺀다
+    lang_weights = args.lang_weights or {}
+    category_weights = args.category_weights or category_shares(quotes)
+    category_of = {quote['id']: quote.get('category') for quote in quotes}
+    plan = plan_budget(
+        unique,
+        lambda job: plan_estimate(job, args.batch_mode, args.batch_size),
+        priority=lambda job: lang_weights.get(job[2], 1.0) * category_weights.get(category_of[job[0]], 1.0),
+        max_tokens=args.budget_tokens,
+        max_usd=args.budget_usd,
+        model=MODEL,
+        group=lambda job: job[2],
+    )
+    if args.batch_mode != 'none':
+        requests = len(make_batches(plan['selected'], args.batch_mode, args.batch_size, args.batch_max_tokens))
+    else:
+        requests = len(plan['selected'])
+    duration = estimate_duration(requests, plan['tokens_in'] + plan['tokens_out'], args.rps, args.tpm, args.concurrency)
+    print(format_plan(plan, requests, duration, group_name='lang'))
+    METRICS.meta['plan'] = plan_summary(plan, requests, duration)
+    
+    if args.dry_run:
+        if cache is not None:
+            cache.close()
+        print("Dry run: no API calls made (QA re-translations are not included in the estimate)")
+        return
+    
+    for job, cached in hits:
+        METRICS.inc('cache_hits', lang=job[2])
+        record(job, cached)
+    jobs = plan['selected']
+    group_of = {(group[0][0], group[0][2]): group for group in groups.values()}
+    for job in plan['deferred']:
+        # 예산 계획에서 빠진 작업 (같은 문장의 작업 전부)
+        group = group_of[(job[0], job[2])]
+        METRICS.inc('deferred', len(group), lang=job[2])
+        METRICS.advance(len(group))
+    
+    def deliver(job, translation):
+        """대표 작업의 결과를 같은 문장의 모든 작업에 반영"""
+        if translation and cache is not None:
+            cache.put(job[1], job[2], translation)
+        group = group_of[(job[0], job[2])]
+        if translation and len(group) > 1:
+            METRICS.inc('dedup_reuse', len(group) - 1, lang=job[2])
+        for same in group:
+            record(same, translation)
+    
+    retry_jobs = []
+    
+    def deliver_batch(batch, results):
+        METRICS.observe('batch_items', len(batch), **batch_labels(batch))
+        for job in batch:
+            translation = (results or {}).get((job[0], job[2]))
             if translation:
-                translations[quote_id]['translations'][lang_code] = translation
-                print(f"  [OK] {lang_name}: {translation[:50]}...")
+                deliver(job, translation)
             else:
-                print(f"  [FAIL] Failed to translate to {lang_name}")
-            
-            # API rate limit 방지 (초당 3개 요청 제한)
-            time.sleep(0.4)
+                retry_jobs.append(job)
     
-    # 번역 데이터 저장
-    output_file = 'assets/quotes_translations.json'
-    print(f"\nSaving translations to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(translations, f, ensure_ascii=False, indent=2)
+    def replace(job, translation):
+        """재번역 결과로 교체 (저널/캐시의 예전 번역도 덮어씀)"""
+        if not translation:
+            return
+        quote_id, quote_text, lang_code, _ = job
+        translations[quote_id]['translations'][lang_code] = translation
+        journal.append(quote_id, lang_code, quote_text, translation)
+        if cache is not None:
+            cache.put(quote_text, lang_code, translation)
+    
+    # 지금 단계의 결과 처리 함수 (중단 시 engine.unreported를 같은 방식으로 기록)
+    handle = deliver
+    try:
+        if args.batch_mode != 'none':
+            # 배치 번역 후, 누락되거나 깨진 항목만 개별 요청으로 재시도
+            batches = make_batches(jobs, args.batch_mode, args.batch_size, args.batch_max_tokens)
+            print(f"Batched {len(jobs)} translations into {len(batches)} requests")
+            handle = deliver_batch
+            for batch, results in engine.run(batches, translate_batch, batch_token_cost, batch_labels):
+                deliver_batch(batch, results)
+            if retry_jobs:
+                print(f"Retrying {len(retry_jobs)} malformed/missing batch entries one by one...")
+            METRICS.inc('batch_retries', len(retry_jobs))
+            jobs = retry_jobs
+
+        handle = deliver
+        for job, translation in engine.run(jobs, lambda job: translate_quote(*job[1:]), translation_token_cost,
+                                           lambda job: {'lang': job[2]}):
+            deliver(job, translation)
+        
+        if not args.no_qa:
+            handle = replace
+            quality_gate(translations, engine, args.qa_rounds, args.qa_workers, replace, drop)
+    except KeyboardInterrupt:
+        # 중단 직전에 끝났지만 아직 기록하지 못한 결과도 저널에 남김
+        unreported = engine.drain()
+        for job, result in unreported:
+            handle(job, result)
+        if unreported:
+            print(f"\n[INTERRUPTED] Recorded {len(unreported)} results that finished during shutdown")
+        journal.close()
+        if cache is not None:
+            cache.close()
+        print(f"\n[INTERRUPTED] Progress saved to {args.journal}. Run again to resume.")
+        print(f"Run report: {METRICS.write_report(args.report)}")
+        return
     
+    compact(translations, shards_dir=None if args.no_shards else args.shards_dir, store_path=args.store)
+    # 번역 실패/예산 초과로 남은 작업이 있으면 저널을 지우지 않음 (재실행 시 이어서 번역)
+    unfinished = METRICS.total('untranslated') + METRICS.total('deferred')
+    if args.keep_journal or unfinished:
+        journal.close()
+        if unfinished:
+            print(f"Kept {args.journal}: {unfinished} translations still missing")
+    else:
+        journal.remove()
+    if cache is not None:
+        stats = cache.stats()
+        cache.close()
+        print(f"\nCache: {stats['hits']} hits, {stats['misses']} misses "
+              f"(hit rate {stats['hit_rate']:.1%}), {stats['entries']} entries")
+    
+    deferred = METRICS.total('deferred')
+    if deferred:
+        print(f"\n[BUDGET] {deferred} translations deferred (over budget). "
+              f"Run again with --delta (or the translation cache) to fill them in.")
     print(f"\n[SUCCESS] Translation complete!")
     print(f"  Total quotes: {len(quotes)}")
     print(f"  Languages: {len(TARGET_LANGUAGES)}")
-    print(f"  Output file: {output_file}")
+    print(f"  Output file: {OUTPUT_FILE}")
+    print(f"  Run report: {METRICS.write_report(args.report)}")
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+UI 문자열 테이블과 매일 알림 문구를 번역 파이프라인으로 미리 번역
+
+- lib/l10n/app_localizations.dart의 영어 테이블(_localizedValues['en'])을 읽어서
+  수동 번역이 없는 언어(_languageNames)와 수동 테이블에 빠진 키만 언어별 배치 요청으로 번역
+  → assets/ui_translations.json (앱은 실행 중 MyMemory 호출 대신 이 파일을 읽음)
+- 항목마다 영어 원문 해시를 같이 저장해서, 영어 문구가 바뀐 항목만 다시 번역한다 (--check는 확인만)
+- 오늘의 명언 스케줄(getDailyQuote와 같은 계산)에 맞춘 언어별 알림 제목/본문
+  → assets/notification_payloads.json
+
+사용 예:
+  python scripts/pre_translate_ui.py --languages de,fr,it
+  python scripts/pre_translate_ui.py --check
+  python scripts/pre_translate_ui.py --payloads-only --days 60
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+
+import pre_translate_quotes as pt
+from api_client import add_client_args, configure_from_args
+from api_engine import ApiEngine, RateLimiter
+from build_indexes import daily_schedule
+from corpus_io import iter_records, write_items
+from translation_cache import DEFAULT_CACHE_FILE, TranslationCache, text_hash
+from translation_shards import MANIFEST_NAME, check_shards, corpus_hash, load_language, load_manifest, read_monolithic
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+APP_LOCALIZATIONS_FILE = os.path.join(PROJECT_ROOT, 'lib', 'l10n', 'app_localizations.dart')
+QUOTES_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quotes.json')
+TRANSLATIONS_FILE = os.path.join(PROJECT_ROOT, 'assets', 'quotes_translations.json')
+SHARDS_DIR = os.path.join(PROJECT_ROOT, 'assets', 'translations')
+UI_OUTPUT_FILE = os.path.join(PROJECT_ROOT, 'assets', 'ui_translations.json')
+PAYLOADS_FILE = os.path.join(PROJECT_ROOT, 'assets', 'notification_payloads.json')
+
+UI_FORMAT_VERSION = 1
+# 프롬프트를 바꾸면 올려서 캐시된 예전 UI 번역을 쓰지 않도록 함
+UI_PROMPT_VERSION = 'ui-v1'
+
+UI_BATCH_PROMPT = (
+    'You are localizing the user interface of a mobile quotes app. You receive a JSON object with an "items" array. '
+    'Translate the English "text" of every item into the language named in its "lang" field. '
+    'Keep each translation as short as the original, as it appears on buttons, titles and notifications. '
+    'Keep placeholders such as {amount} or {count}, emoji and symbols like ⭐ or ≤ exactly as they are. '
+    'Return only a JSON object of the form {"translations": [{"key": "<item key>", "translation": "<translated text>"}]} '
+    'with exactly one entry per input item.'
+)
+
+NOTIFICATION_TITLE_KEY = 'notification_title'
+# NotificationService와 같은 본문 길이 제한
+NOTIFICATION_BODY_LIMIT = 100
+
+_PLACEHOLDER = re.compile(r'\{\w+\}')
+
+
+# ---------------------------------------------------------------- Dart 테이블 읽기
+
+_DART_TOKEN = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | '(?P<sq>(?:[^'\\\n]|\\.)*)'
+  | "(?P<dq>(?:[^"\\\n]|\\.)*)"
+  | (?P<punct>[{}\[\]:,()])
+  | (?P<other>[^\s{}\[\]:,()'"]+)
+""", re.X | re.S)
+
+_DART_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v'}
+
+
+def _dart_unescape(text):
+    def replace(match):
+        escape = match.group(1)
+        if escape.startswith('u{'):
+            return chr(int(escape[2:-1], 16))
+        if escape.startswith('u'):
+            return chr(int(escape[1:], 16))
+        return _DART_ESCAPES.get(escape, escape)
+    return re.sub(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|.)', replace, text)
+
+
+def _dart_tokens(source, pos):
+    for match in _DART_TOKEN.finditer(source, pos):
+        if match.group('space'):
+            continue
+        if match.group('sq') is not None or match.group('dq') is not None:
+            raw = match.group('sq') if match.group('sq') is not None else match.group('dq')
+            yield ('str', _dart_unescape(raw))
+        elif match.group('punct'):
+            yield ('punct', match.group('punct'))
+        else:
+            yield ('other', match.group('other'))
+
+
+class _DartLiteralParser:
+    """문자열 키 + 문자열/중첩 맵 값으로 된 Dart 맵 리터럴 파서 (인접 문자열 리터럴은 이어 붙임)"""
+
+    def __init__(self, tokens):
+        self._tokens = tokens
+        self._next = next(tokens, None)
+
+    def _take(self):
+        token = self._next
+        if token is None:
+            raise ValueError('Unexpected end of Dart source')
+        self._next = next(self._tokens, None)
+        return token
+
+    def value(self):
+        kind, text = self._take()
+        if (kind, text) == ('punct', '{'):
+            result = {}
+            while self._next != ('punct', '}'):
+                key = self.value()
+                if self._take() != ('punct', ':'):
+                    raise ValueError(f"Expected ':' after {key!r}")
+                result[key] = self.value()
+                if self._next == ('punct', ','):
+                    self._take()
+            self._take()
+            return result
+        if kind == 'str':
+            parts = [text]
+            while self._next is not None and self._next[0] == 'str':
+                parts.append(self._take()[1])
+            return ''.join(parts)
+        raise ValueError(f"Unsupported Dart literal: {text!r}")
+
+
+def parse_dart_map(source, name):
+    """`name = { ... }` 맵 리터럴을 dict로"""
+    match = re.search(rf'\b{re.escape(name)}\s*=\s*\{{', source)
+    if not match:
+        raise ValueError(f"{name} not found")
+    return _DartLiteralParser(_dart_tokens(source, match.end() - 1)).value()
+
+
+def load_ui_tables(path=APP_LOCALIZATIONS_FILE):
+    """(수동 번역 테이블 {lang: {key: 문자열}}, 지원 언어 {code: 모국어 표기})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    return parse_dart_map(source, '_localizedValues'), parse_dart_map(source, '_languageNames')
+
+
+# ---------------------------------------------------------------- 번역 계획
+
+def source_hash(text):
+    return text_hash(text)[:16]
+
+
+def is_valid_ui_translation(source, translation):
+    """비어 있지 않고 {placeholder}가 원문과 같아야 함"""
+    return bool(translation) and sorted(_PLACEHOLDER.findall(source)) == sorted(_PLACEHOLDER.findall(translation))
+
+
+def plan_languages(english, manual, existing, languages):
+    """
+    언어별 (재사용할 번역 {key: text}, 번역할 키 목록, 영어가 바뀐 키 목록)
+    수동 테이블에 있는 키는 건드리지 않는다
+    """
+    hashes = {key: source_hash(text) for key, text in english.items()}
+    plans = {}
+    for lang in languages:
+        hand = manual.get(lang, {})
+        previous = existing.get('languages', {}).get(lang, {})
+        previous_hashes = existing.get('source_hashes', {}).get(lang, {})
+        keep, todo, stale = {}, [], []
+        for key in english:
+            if key in hand:
+                continue
+            if key in previous:
+                if previous_hashes.get(key) == hashes[key]:
+                    keep[key] = previous[key]
+                    continue
+                stale.append(key)
+            todo.append(key)
+        plans[lang] = (keep, todo, stale)
+    return hashes, plans
+
+
+def load_existing(path=UI_OUTPUT_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        existing = json.load(f)
+    if existing.get('version') != UI_FORMAT_VERSION:
+        return {}
+    return existing
+
+
+def translate_ui(jobs, engine, batch_size, cache):
+    """UI 문자열 번역 작업 -> {(key, lang): 번역} (배치 후 누락 항목은 1개씩 한 번 더)"""
+    results = {}
+    pending = []
+    for job in jobs:
+        cached = cache.get(job[1], job[2]) if cache is not None else None
+        if cached:
+            pt.METRICS.inc('cache_hits', lang=job[2])
+            results[(job[0], job[2])] = cached
+        else:
+            pending.append(job)
+
+    for size in (batch_size, 1):
+        if not pending:
+            break
+        batches = pt.make_batches(pending, 'quotes', size)
+        print(f"Translating {len(pending)} UI strings in {len(batches)} requests...")
+        missing = []
+        worker = lambda batch: pt.translate_batch(batch, UI_BATCH_PROMPT, is_valid_ui_translation)  # noqa: E731
+        for batch, translated in engine.run(batches, worker, pt.batch_token_cost, pt.batch_labels):
+            for job in batch:
+                translation = (translated or {}).get((job[0], job[2]))
+                if translation:
+                    results[(job[0], job[2])] = translation
+                    if cache is not None:
+                        cache.put(job[1], job[2], translation)
+                else:
+                    missing.append(job)
+            pt.METRICS.advance(len(batch))
+        pending = missing
+    return results, pending
+
+
+# ---------------------------------------------------------------- 알림 페이로드
+
+def notification_body(text, author):
+    """NotificationService와 같은 형식 ('"명언" - 작가', 길면 잘라서 ...)"""
+    if len(text) > NOTIFICATION_BODY_LIMIT:
+        text = text[:NOTIFICATION_BODY_LIMIT] + '...'
+    return f'"{text}" - {author}'
+
+
+def load_quote_translations(quote_ids, shards_dir=SHARDS_DIR, translations_file=TRANSLATIONS_FILE):
+    """
+    {lang: {quote_id: 번역}} - 현재 corpus와 정렬이 맞는 샤드가 있으면 샤드에서, 아니면 통합 파일에서
+    """
+    if os.path.exists(os.path.join(shards_dir, MANIFEST_NAME)) and not check_shards(shards_dir, quote_ids):
+        return {lang: load_language(shards_dir, lang) for lang in load_manifest(shards_dir)['languages']}
+    if os.path.exists(translations_file):
+        translations, languages = read_monolithic(translations_file)
+        return {
+            lang: {quote_id: per[lang] for quote_id, per in translations.items() if per.get(lang)}
+            for lang in languages
+        }
+    return {}
+
+
+def notification_payloads(records, titles, quote_translations, start, days):
+    """
+    {lang: {날짜: {'id', 'title', 'body'}}}
+    titles: {lang: 알림 제목}, quote_translations: {lang: {quote_id: 번역}} (없으면 영어 원문)
+    """
+    by_id = {record['id']: record for record in records}
+    schedule = daily_schedule(list(by_id), start, days)
+    payloads = {}
+    for lang, title in titles.items():
+        translated = quote_translations.get(lang, {})
+        payloads[lang] = {
+            day: {
+                'id': quote_id,
+                'title': title,
+                'body': notification_body(
+                    translated.get(quote_id) or by_id[quote_id]['quote'],
+                    by_id[quote_id].get('author') or 'Unknown',
+                ),
+            }
+            for day, quote_id in schedule.items()
+        }
+    return payloads
+
+
+# ---------------------------------------------------------------- main
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Pre-translate UI strings and daily notification payloads')
+    parser.add_argument('--languages', default=None, help='번역할 언어 코드 (쉼표 구분, 기본은 _languageNames 전체)')
+    parser.add_argument('--batch-size', type=int, default=40, help='요청 1건당 UI 문자열 수')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 수')
+    parser.add_argument('--rps', type=float, default=3.0, help='초당 최대 요청 수')
+    parser.add_argument('--tpm', type=int, default=None, help='분당 최대 토큰 수')
+    parser.add_argument('--max-retries', type=int, default=5, help='429/5xx 재시도 횟수')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILE, help='공유 번역 캐시 경로')
+    parser.add_argument('--no-cache', action='store_true', help='번역 캐시 사용 안 함')
+    parser.add_argument('--output', default=UI_OUTPUT_FILE)
+    parser.add_argument('--check', action='store_true', help='영어 문구가 바뀌었거나 빠진 번역만 보고하고 종료')
+    parser.add_argument('--payloads-only', action='store_true', help='UI 번역 없이 알림 페이로드만 다시 만듦')
+    parser.add_argument('--skip-payloads', action='store_true', help='알림 페이로드를 만들지 않음')
+    parser.add_argument('--payloads', default=PAYLOADS_FILE)
+    parser.add_argument('--quotes', default=QUOTES_FILE)
+    parser.add_argument('--start', default=None, help='알림 스케줄 시작일 (YYYY-MM-DD, 기본 오늘)')
+    parser.add_argument('--days', type=int, default=60, help='알림 스케줄 일수')
+    parser.add_argument('--report', default=None, help='JSON 실행 리포트 경로 (기본 scripts/.cache/reports/)')
+    add_client_args(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    manual, language_names = load_ui_tables()
+    english = manual['en']
+    if args.languages:
+        languages = [code.strip() for code in args.languages.split(',') if code.strip()]
+    else:
+        languages = [code for code in language_names if code != 'en']
+
+    existing = load_existing(args.output)
+    hashes, plans = plan_languages(english, manual, existing, languages)
+
+    if args.check:
+        problems = 0
+        for lang, (_, todo, stale) in plans.items():
+            if todo:
+                problems += 1
+                print(f"[{lang}] {len(todo) - len(stale)} missing, {len(stale)} stale"
+                      + (f" ({', '.join(stale[:5])}{'...' if len(stale) > 5 else ''})" if stale else ''))
+        print(f"{problems} of {len(plans)} languages need translation")
+        raise SystemExit(1 if problems else 0)
+
+    generated = {lang: dict(strings) for lang, strings in existing.get('languages', {}).items()}
+    if not args.payloads_only:
+        jobs = [
+            (key, english[key], lang, f"{language_names.get(lang, lang)} ({lang})")
+            for lang, (_, todo, _) in plans.items()
+            for key in todo
+        ]
+        stale_count = sum(len(stale) for _, _, stale in plans.values())
+        print(f"UI strings: {len(english)} keys, {len(languages)} languages, "
+              f"{len(jobs)} to translate ({stale_count} stale)")
+
+        translated, failed = {}, []
+        if jobs:
+            if not pt.API_KEY:
+                print("ERROR: Please set OPENAI_API_KEY environment variable")
+                return
+            configure_from_args(args)
+            pt.METRICS.name = 'pre_translate_ui'
+            pt.METRICS.start(len(jobs))
+            engine = ApiEngine(
+                RateLimiter(requests_per_sec=args.rps, tokens_per_min=args.tpm),
+                concurrency=args.concurrency,
+                max_retries=args.max_retries,
+                metrics=pt.METRICS,
+            )
+            cache = None
+            if not args.no_cache:
+                cache = TranslationCache(args.cache, model=pt.MODEL, prompt_version=UI_PROMPT_VERSION)
+            try:
+                translated, failed = translate_ui(jobs, engine, args.batch_size, cache)
+            finally:
+                if cache is not None:
+                    cache.close()
+
+        # 선택한 언어는 새로 만들고, 나머지 언어는 영어 원문이 그대로인 항목만 유지
+        for lang in list(generated):
+            if lang not in plans:
+                previous_hashes = existing.get('source_hashes', {}).get(lang, {})
+                generated[lang] = {
+                    key: text for key, text in generated[lang].items()
+                    if key in hashes and previous_hashes.get(key) == hashes[key]
+                }
+        for lang, (keep, todo, _) in plans.items():
+            strings = dict(keep)
+            strings.update({key: translated[(key, lang)] for key in todo if (key, lang) in translated})
+            generated[lang] = {key: strings[key] for key in english if key in strings}
+
+        write_items(args.output, [
+            ('version', UI_FORMAT_VERSION),
+            ('source_hashes', {
+                lang: {key: hashes[key] for key in strings}
+                for lang, strings in generated.items() if strings
+            }),
+            ('languages', {lang: strings for lang, strings in generated.items() if strings}),
+        ])
+        print(f"Wrote {args.output} ({sum(len(s) for s in generated.values())} strings)")
+        if failed:
+            print(f"  [WARN] {len(failed)} strings left untranslated (app falls back to English)")
+        if jobs:
+            print(f"  Run report: {pt.METRICS.write_report(args.report)}")
+
+    if args.skip_payloads:
+        return
+    if not os.path.exists(args.quotes):
+        print(f"Skipping notification payloads: {args.quotes} not found")
+        return
+
+    records = list(iter_records(args.quotes))
+    quote_ids = [record['id'] for record in records]
+    quote_translations = load_quote_translations(quote_ids)
+    titles = {}
+    for lang in ['en'] + [lang for lang in quote_translations if lang != 'en']:
+        titles[lang] = (
+            manual.get(lang, {}).get(NOTIFICATION_TITLE_KEY)
+            or generated.get(lang, {}).get(NOTIFICATION_TITLE_KEY)
+            or english[NOTIFICATION_TITLE_KEY]
+        )
+    start = datetime.date.fromisoformat(args.start) if args.start else datetime.date.today()
+    payloads = notification_payloads(records, titles, quote_translations, start, args.days)
+    write_items(args.payloads, [
+        ('version', 1),
+        ('start', start.isoformat()),
+        ('days', args.days),
+        ('corpus_hash', corpus_hash(quote_ids)),
+        ('languages', payloads),
+    ], indent=None)
+    print(f"Wrote {args.payloads} ({len(payloads)} languages x {args.days} days)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+앱 시작용 압축 바이너리 명언 번들 (assets/quotes.bundle) 생성/읽기
+
+assets/quotes.json은 indent=2 공백과 반복되는 "category"/"author" 문자열 때문에 크고,
+앱은 실행할 때마다 전체를 json.decode 한다. 번들은 문자열 테이블 + 오프셋 인덱스로
+전체를 파싱하지 않고 원하는 레코드만 바로 읽을 수 있다.
+
+레이아웃 (모든 정수는 little-endian)
+
+  헤더 (32 bytes)
+    0   magic               4s   b'QBND'
+    4   version             u16  2 (1은 extra 필드 없음, 읽기만 지원)
+    6   flags               u16  bit0 = 레코드 블록 zlib 압축
+    8   record_count        u32
+    12  string_count        u32
+    16  block_size          u32  압축 시 블록당 레코드 수 (비압축이면 1)
+    20  strings_offset      u32  파일 시작 기준
+    24  index_offset        u32  파일 시작 기준
+    28  records_offset      u32  파일 시작 기준
+
+  문자열 테이블 (strings_offset부터 string_count개)
+    u16 byte_length + UTF-8 bytes   작가/카테고리/태그/extra 키와 값 (중복 없이 한 번씩)
+
+  오프셋 인덱스 (index_offset부터 (n + 1)개의 u32, records_offset 기준)
+    비압축: n = record_count, 레코드 i는 [index[i], index[i + 1])
+    압축:   n = ceil(record_count / block_size), 블록 b는 [index[b], index[b + 1])을
+            zlib 해제한 뒤 레코드 (i % block_size)개를 건너뛰어 읽는다
+
+  레코드
+    u32 id
+    u32 author      문자열 테이블 인덱스
+    u32 category    문자열 테이블 인덱스
+    u16 tag_count
+    u32 × tag_count 문자열 테이블 인덱스
+    u32 text_length + UTF-8 bytes
+    u16 extra_count
+    (u32 key, u32 value) × extra_count   문자열 테이블 인덱스, 값은 JSON 문자열
+                    위 필드 밖의 키(author_id/famous/length 등)를 그대로 보관 (corpus_store의 extra 컬럼과 같은 역할)
+                    값이 반복되므로 ("true", "\"short\"" 등) 문자열 테이블에 한 번씩만 들어간다
+
+사용 예:
+  python scripts/quote_bundle.py                         # assets/quotes.json -> assets/quotes.bundle
+  python scripts/quote_bundle.py --compress --bench
+"""
+
+import argparse
+import gzip
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+
+from corpus_io import iter_records
+
+MAGIC = b'QBND'
+VERSION = 2
+READABLE_VERSIONS = (1, 2)
+FLAG_ZLIB = 1
+
+HEADER = struct.Struct('<4sHHIIIIII')
+RECORD_HEAD = struct.Struct('<IIIH')
+U16 = struct.Struct('<H')
+U32 = struct.Struct('<I')
+
+DEFAULT_BLOCK_SIZE = 64
+
+# 레코드 헤더/본문에 들어가는 필드 (나머지는 extra)
+_FIELDS = {'id', 'quote', 'author', 'category', 'tags'}
+
+
+def _extras(record):
+    """레코드의 extra 필드 -> [(키, JSON 값)]"""
+    return [
+        (key, json.dumps(value, ensure_ascii=False, sort_keys=True))
+        for key, value in record.items() if key not in _FIELDS
+    ]
+
+
+def _encode_record(record, string_index):
+    tags = record.get('tags') or []
+    text = record['quote'].encode('utf-8')
+    parts = [RECORD_HEAD.pack(
+        record['id'],
+        string_index[record.get('author') or 'Unknown'],
+        string_index[record.get('category') or ''],
+        len(tags),
+    )]
+    parts.extend(U32.pack(string_index[tag]) for tag in tags)
+    parts.append(U32.pack(len(text)))
+    parts.append(text)
+    extras = _extras(record)
+    parts.append(U16.pack(len(extras)))
+    parts.extend(U32.pack(string_index[key]) + U32.pack(string_index[value]) for key, value in extras)
+    return b''.join(parts)
+
+
+def build_bundle(records, output_path, compress=False, block_size=DEFAULT_BLOCK_SIZE):
+    """레코드 목록을 번들로 저장하고 파일 크기 반환"""
+    records = list(records)
+
+    # 작가/카테고리/태그/extra 문자열 테이블 (처음 나온 순서)
+    strings = []
+    string_index = {}
+    for record in records:
+        values = [record.get('author') or 'Unknown', record.get('category') or ''] + list(record.get('tags') or [])
+        values.extend(value for pair in _extras(record) for value in pair)
+        for value in values:
+            if value not in string_index:
+                string_index[value] = len(strings)
+                strings.append(value)
+
+    encoded = [_encode_record(record, string_index) for record in records]
+    if compress:
+        chunks = [
+            zlib.compress(b''.join(encoded[i:i + block_size]), 9)
+            for i in range(0, len(encoded), block_size)
+        ]
+    else:
+        block_size = 1
+        chunks = encoded
+
+    string_table = b''.join(
+        U16.pack(len(data)) + data for data in (s.encode('utf-8') for s in strings)
+    )
+    offsets = [0]
+    for chunk in chunks:
+        offsets.append(offsets[-1] + len(chunk))
+    index = b''.join(U32.pack(offset) for offset in offsets)
+
+    strings_offset = HEADER.size
+    index_offset = strings_offset + len(string_table)
+    records_offset = index_offset + len(index)
+    header = HEADER.pack(
+        MAGIC, VERSION, FLAG_ZLIB if compress else 0,
+        len(records), len(strings), block_size,
+        strings_offset, index_offset, records_offset,
+    )
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(string_table)
+        f.write(index)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, output_path)
+    return os.path.getsize(output_path)
+
+
+class QuoteBundle:
+    """
+    번들 리더 (mmap으로 열어서 필요한 레코드만 디코딩)
+    bundle[i]는 i번째 레코드를 quotes.json과 같은 dict로 반환한다
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.version, self.flags, self.record_count, string_count, self.block_size,
+         strings_offset, self._index_offset, self._records_offset) = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or self.version not in READABLE_VERSIONS:
+            raise ValueError(f"Not a quote bundle (v{VERSION}): {path}")
+
+        self.strings = []
+        pos = strings_offset
+        for _ in range(string_count):
+            (length,) = U16.unpack_from(self._data, pos)
+            self.strings.append(self._data[pos + 2:pos + 2 + length].decode('utf-8'))
+            pos += 2 + length
+
+        self._block_cache = (None, None)
+
+    def __len__(self):
+        return self.record_count
+
+    def _offset(self, i):
+        return self._records_offset + U32.unpack_from(self._data, self._index_offset + 4 * i)[0]
+
+    def _decode(self, buf, pos):
+        record_id, author, category, tag_count = RECORD_HEAD.unpack_from(buf, pos)
+        pos += RECORD_HEAD.size
+        tags = [self.strings[U32.unpack_from(buf, pos + 4 * t)[0]] for t in range(tag_count)]
+        pos += 4 * tag_count
+        (length,) = U32.unpack_from(buf, pos)
+        pos += 4
+        record = {
+            'id': record_id,
+            'quote': bytes(buf[pos:pos + length]).decode('utf-8'),
+            'author': self.strings[author],
+            'category': self.strings[category],
+            'tags': tags,
+        }
+        pos += length
+        if self.version >= 2:
+            (extra_count,) = U16.unpack_from(buf, pos)
+            pos += 2
+            for _ in range(extra_count):
+                key, value = U32.unpack_from(buf, pos)[0], U32.unpack_from(buf, pos + 4)[0]
+                record[self.strings[key]] = json.loads(self.strings[value])
+                pos += 8
+        return record, pos
+
+    def _block(self, b):
+        if self._block_cache[0] != b:
+            data = zlib.decompress(self._data[self._offset(b):self._offset(b + 1)])
+            self._block_cache = (b, data)
+        return self._block_cache[1]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.record_count
+        if not 0 <= i < self.record_count:
+            raise IndexError(i)
+        if not self.flags & FLAG_ZLIB:
+            return self._decode(self._data, self._offset(i))[0]
+        buf = self._block(i // self.block_size)
+        pos = 0
+        for _ in range(i % self.block_size):
+            pos = self._decode(buf, pos)[1]
+        return self._decode(buf, pos)[0]
+
+    def __iter__(self):
+        if not self.flags & FLAG_ZLIB:
+            for i in range(self.record_count):
+                yield self[i]
+            return
+        remaining = self.record_count
+        for b in range((self.record_count + self.block_size - 1) // self.block_size):
+            buf = self._block(b)
+            pos = 0
+            for _ in range(min(self.block_size, remaining)):
+                record, pos = self._decode(buf, pos)
+                yield record
+            remaining -= self.block_size
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _timed(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(json_path, bundle_path):
+    """JSON 에셋 대비 번들의 크기/디코딩 시간 비교"""
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+
+    def decode_json():
+        return json.loads(raw.decode('utf-8'))
+
+    def decode_bundle():
+        with QuoteBundle(bundle_path) as bundle:
+            return list(bundle)
+
+    def open_and_seek():
+        with QuoteBundle(bundle_path) as bundle:
+            return bundle[len(bundle) // 2]
+
+    results = {
+        'json_bytes': len(raw),
+        'json_gzip_bytes': len(gzip.compress(raw, 9)),
+        'bundle_bytes': os.path.getsize(bundle_path),
+        'json_decode_ms': round(_timed(decode_json) * 1000, 3),
+        'bundle_decode_all_ms': round(_timed(decode_bundle) * 1000, 3),
+        'bundle_open_seek_one_ms': round(_timed(open_and_seek) * 1000, 3),
+    }
+    assert decode_bundle() == decode_json(), 'bundle round-trip mismatch'
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the compact binary quote bundle')
+    parser.add_argument('--input', default='assets/quotes.json')
+    parser.add_argument('--output', default='assets/quotes.bundle')
+    parser.add_argument('--compress', action='store_true', help='레코드를 블록 단위로 zlib 압축')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE, help='압축 블록당 레코드 수')
+    parser.add_argument('--bench', action='store_true', help='JSON 에셋과 크기/디코딩 시간 비교')
+    args = parser.parse_args()
+
+    size = build_bundle(iter_records(args.input), args.output, compress=args.compress, block_size=args.block_size)
+    print(f"Wrote {args.output} ({size} bytes)")
+
+    if args.bench:
+        print(json.dumps(benchmark(args.input, args.output), indent=2))
+
+
+if __name__ == '__main__':
+    main()
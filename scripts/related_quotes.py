@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+"비슷한 명언" 미리 계산 + 자동 태그 (TF-IDF)
+
+명언마다 불용어를 뺀 단어/단어 bigram으로 TF-IDF 벡터(sublinear tf, L2 정규화)를 만들고
+코사인 유사도 상위 k개를 이웃으로 남긴다. 태그는 각 명언에서 가중치가 높은 단어 중
+여러 명언에 나오는 것으로 만든다 (build_corpus.py의 tags 단계).
+
+- numpy/scipy가 있으면 희소 행렬(CSR)을 block_size행씩 곱해서(X[block] @ X.T) 행별 top-k
+- 없으면 같은 계산을 단어 -> (명언, 가중치) 역색인으로 (float32 반올림 차이 외에는 결과가 같고 느림)
+- max_df보다 흔한 단어는 유사도 계산에서 뺀다 (기여가 적고 곱셈 결과를 조밀하게 만듦)
+  태그 후보는 top_terms()의 max_df까지 허용 ('life', 'love' 같은 단어도 태그로는 쓸모 있음)
+
+출력 (assets/quote_related.json, 앱은 quotes.json 위치로 바로 찾음)
+  version       corpus 빌드 키
+  count         명언 수 (quotes.json과 맞는지 확인용)
+  corpus_hash   id 순서 해시 (translation_shards.corpus_hash)
+  k             명언당 이웃 수
+  neighbors     count × k 평탄화 배열, i번째 명언의 이웃 = neighbors[i*k:(i+1)*k]의 corpus 위치
+                (유사도 내림차순, 이웃이 모자라면 -1)
+
+사용 예:
+  python scripts/related_quotes.py                           # quotes.json -> quote_related.json
+  python scripts/related_quotes.py --show 627992391 --tags
+"""
+
+import argparse
+import heapq
+import math
+import re
+import time
+from collections import Counter, defaultdict
+
+from corpus_io import iter_records, write_items
+from translation_shards import corpus_hash
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:  # numpy/scipy는 선택 사항 (없으면 순수 파이썬 역색인)
+    np = sp = None
+
+DEFAULT_K = 5
+DEFAULT_BLOCK_SIZE = 512
+DEFAULT_MIN_SCORE = 0.1
+DEFAULT_TAGS_PER_QUOTE = 3
+
+STOPWORDS = frozenset('''
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can cannot could did do does doing down during each even ever every few
+for from further get gets got had has have having he her here hers herself him himself his how i if
+in into is it its itself just let like make makes may me might more most much must my myself never
+no nor not now of off on once one only or other ought our ours ourselves out over own same shall she
+should so some such than that the their theirs them themselves then there these they this those
+through to too under until up upon us very was we were what when where which while who whom why will
+with without would yet you your yours yourself yourselves thing things something nothing anything
+everything someone anyone everyone always often really way ways many well still
+go goes going gone went come comes coming came give gives gave given take takes taking took taken
+make making made become becomes became want wants wanted know knows knew known keep keeps kept find finds found say says said
+see sees seen tell tells told think thinks thought need needs put lot around another enough
+less little long last first two three new old good better best whole real kind sure
+'''.split())
+
+_WORD_RE = re.compile(r"[a-z][a-z']*[a-z]")
+
+
+def tokenize(text):
+    """소문자 단어 (불용어, 2글자 이하, 소유격 's 제거)"""
+    words = []
+    for word in _WORD_RE.findall(text.lower().replace('’', "'")):
+        if word.endswith("'s"):
+            word = word[:-2]
+        if len(word) > 2 and word not in STOPWORDS and "'" not in word:
+            words.append(word)
+    return words
+
+
+def terms(text):
+    """단어 + 인접 단어 bigram"""
+    words = tokenize(text)
+    return words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+
+
+class TfidfModel:
+    """
+    corpus 전체의 TF-IDF 벡터
+    vectors[i] = [(단어 번호, 가중치)] (L2 정규화), vocabulary[단어 번호] = 단어, df[단어 번호] = 문서 수
+    similarity_terms = 유사도 계산에 쓰는 단어 번호 (df <= max_df)
+    """
+
+    def __init__(self, texts, min_df=2, max_df=0.1):
+        counts = [Counter(terms(text)) for text in texts]
+        self.count = len(counts)
+        df = Counter(term for doc in counts for term in doc)
+
+        self.vocabulary = sorted(term for term, n in df.items() if n >= min_df)
+        index = {term: i for i, term in enumerate(self.vocabulary)}
+        self.df = [df[term] for term in self.vocabulary]
+        idf = [math.log((1 + self.count) / (1 + n)) + 1 for n in self.df]
+        max_count = max(min_df, int(max_df * self.count))
+        self.similarity_terms = {t for t, n in enumerate(self.df) if n <= max_count}
+
+        self.vectors = []
+        for doc in counts:
+            vector = [
+                (index[term], (1 + math.log(tf)) * idf[index[term]])
+                for term, tf in doc.items() if term in index
+            ]
+            norm = math.sqrt(sum(w * w for _, w in vector)) or 1.0
+            self.vectors.append(sorted((i, w / norm) for i, w in vector))
+
+    def top_terms(self, i, count, min_df=3, max_df=0.3, exclude=()):
+        """i번째 명언의 가중치 상위 단어 (bigram 제외, min_df개 이상 max_df 비율 이하 명언에 나오는 것만)"""
+        max_count = max(min_df, int(max_df * self.count))
+        candidates = [
+            (weight, self.vocabulary[t]) for t, weight in self.vectors[i]
+            if ' ' not in self.vocabulary[t] and min_df <= self.df[t] <= max_count
+            and self.vocabulary[t] not in exclude
+        ]
+        return [term for _, term in heapq.nlargest(count, candidates)]
+
+    def matrix(self):
+        """유사도용 CSR 희소 행렬 (count × len(vocabulary), float32) - numpy/scipy 필요"""
+        indptr = [0]
+        indices = []
+        data = []
+        for vector in self.vectors:
+            for t, weight in vector:
+                if t in self.similarity_terms:
+                    indices.append(t)
+                    data.append(weight)
+            indptr.append(len(indices))
+        return sp.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(self.count, len(self.vocabulary)),
+        )
+
+
+def _neighbors_sparse(model, k, min_score, block_size):
+    """X[block] @ X.T를 블록 단위로 곱해서 행별 top-k (numpy/scipy)"""
+    matrix = model.matrix()
+    transposed = matrix.T.tocsc()
+    neighbors = []
+    for start in range(0, model.count, block_size):
+        scores = (matrix[start:start + block_size] @ transposed).tocsr()
+        for row in range(scores.shape[0]):
+            lo, hi = scores.indptr[row], scores.indptr[row + 1]
+            cols = scores.indices[lo:hi]
+            vals = scores.data[lo:hi]
+            keep = (cols != start + row) & (vals >= min_score)
+            cols, vals = cols[keep], vals[keep]
+            if len(cols) > k:
+                top = np.argpartition(-vals, k - 1)[:k]
+                cols, vals = cols[top], vals[top]
+            # 유사도 내림차순, 같으면 corpus 위치 순 (순수 파이썬 경로와 같은 결과)
+            order = np.lexsort((cols, -vals))
+            neighbors.append([int(c) for c in cols[order]])
+    return neighbors
+
+
+def _neighbors_python(model, k, min_score):
+    """단어 역색인으로 같은 단어를 가진 명언끼리만 점수 누적"""
+    postings = defaultdict(list)
+    for i, vector in enumerate(model.vectors):
+        for t, weight in vector:
+            if t in model.similarity_terms:
+                postings[t].append((i, weight))
+
+    neighbors = []
+    for i, vector in enumerate(model.vectors):
+        scores = defaultdict(float)
+        for t, weight in vector:
+            for j, other in postings.get(t, ()):
+                scores[j] += weight * other
+        scores.pop(i, None)
+        top = heapq.nsmallest(k, ((-score, j) for j, score in scores.items() if score >= min_score))
+        neighbors.append([j for _, j in top])
+    return neighbors
+
+
+def related_quotes(model, k=DEFAULT_K, min_score=DEFAULT_MIN_SCORE, block_size=DEFAULT_BLOCK_SIZE, backend='auto'):
+    """명언마다 유사도 상위 k개 이웃의 corpus 위치 목록"""
+    if backend == 'auto':
+        backend = 'python' if sp is None else 'sparse'
+    if backend == 'sparse':
+        if sp is None:
+            raise RuntimeError("The sparse backend requires numpy and scipy: pip install numpy scipy")
+        return _neighbors_sparse(model, k, min_score, block_size)
+    return _neighbors_python(model, k, min_score)
+
+
+def auto_tags(records, model, count=DEFAULT_TAGS_PER_QUOTE):
+    """
+    레코드에 자동 태그 추가 (기존 태그는 유지하고 뒤에 덧붙임, 카테고리 이름과 같은 단어는 제외)
+    records와 model은 같은 순서
+    """
+    for i, record in enumerate(records):
+        tags = list(record.get('tags') or [])
+        exclude = set(tags) | {record.get('category') or ''}
+        tags.extend(model.top_terms(i, max(0, count - len(tags)), exclude=exclude))
+        yield {**record, 'tags': tags}
+
+
+def related_document(ids, neighbors, k, version=None):
+    """quote_related.json 내용 (평탄화한 이웃 배열, 모자란 칸은 -1)"""
+    flat = []
+    for row in neighbors:
+        flat.extend(row[:k] + [-1] * (k - len(row[:k])))
+    return {
+        'version': version,
+        'count': len(ids),
+        'corpus_hash': corpus_hash(ids),
+        'k': k,
+        'neighbors': flat,
+    }
+
+
+def write_related(path, records, k=DEFAULT_K, version=None, **options):
+    """레코드 목록 -> 이웃 계산 후 저장, (문서, 걸린 초) 반환"""
+    started = time.perf_counter()
+    model = TfidfModel([record['quote'] for record in records])
+    neighbors = related_quotes(model, k, **options)
+    document = related_document([record['id'] for record in records], neighbors, k, version)
+    write_items(path, document.items(), indent=None)
+    return document, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute related quotes and auto tags with TF-IDF')
+    parser.add_argument('--input', default='assets/quotes.json')
+    parser.add_argument('--output', default='assets/quote_related.json')
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help='명언당 이웃 수')
+    parser.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE, help='이웃으로 남길 최소 코사인 유사도')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE, help='희소 행렬 곱 블록 행 수')
+    parser.add_argument('--backend', choices=['auto', 'sparse', 'python'], default='auto')
+    parser.add_argument('--show', type=int, default=None, help='id의 이웃(과 --tags면 자동 태그)만 출력')
+    parser.add_argument('--tags', action='store_true', help='자동 태그도 출력')
+    args = parser.parse_args()
+
+    records = list(iter_records(args.input))
+    options = {'min_score': args.min_score, 'block_size': args.block_size, 'backend': args.backend}
+
+    if args.show is not None:
+        model = TfidfModel([record['quote'] for record in records])
+        neighbors = related_quotes(model, args.k, **options)
+        i = next(i for i, record in enumerate(records) if record['id'] == args.show)
+        print(f"{records[i]['quote']} — {records[i]['author']}")
+        if args.tags:
+            print(f"  tags: {model.top_terms(i, DEFAULT_TAGS_PER_QUOTE, exclude={records[i].get('category')})}")
+        for j in neighbors[i]:
+            print(f"  -> [{records[j]['id']}] {records[j]['quote']}")
+        return
+
+    document, seconds = write_related(args.output, records, args.k, **options)
+    linked = sum(1 for i in range(document['count']) if document['neighbors'][i * args.k] >= 0)
+    print(f"Wrote {args.output} ({document['count']} quotes, {linked} with related quotes, {seconds:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
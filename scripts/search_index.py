@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+언어별 명언 전문 검색 인덱스 (assets/search/<lang>.idx + manifest.json)
+
+QuoteService._quotes나 quotes_translations.json 전체를 훑지 않고, 단어 -> 명언 위치(역색인)로
+검색한다. 문서는 명언 본문(번역 인덱스는 번역문) + 작가 이름이고, 위치는 quotes.json 순서다.
+
+토큰화
+  - NFKC + casefold, 라틴 문자 단어는 악센트 제거 (é -> e)
+  - 한글/가나/한자 연속 구간은 글자 bigram ('행복한' -> '행복', '복한'), 한 글자면 그 글자
+    문서는 글자 unigram도 색인한다 (한 글자 검색어 '복'이 '인생은 행복'의 '복'도 찾도록)
+  - 나머지는 단어 단위 (\\w+)
+  - 검색어도 같은 규칙으로 토큰화하고, 마지막 토큰은 접두어로 찾는다 (입력 중 자동 완성)
+
+레이아웃 (모든 정수는 little-endian, quote_bundle.py와 같은 방식으로 mmap해서 읽음)
+
+  헤더 (32 bytes)
+    0   magic             4s   b'QIDX'
+    4   version           u16  2 (v2: CJK unigram 색인)
+    6   prefix_length     u16  접두어 표의 접두어 글자 수
+    8   doc_count         u32
+    12  term_count        u32
+    16  prefix_count      u32
+    20  terms_offset      u32  용어 사전 (term_count × 12 bytes)
+    24  prefixes_offset   u32  접두어 표 (prefix_count × 12 bytes)
+    28  blob_offset       u32  문자열 + posting 데이터
+
+  용어 사전 (용어 UTF-8 바이트 순 정렬 - 이진 탐색)
+    u32 term_offset      blob 기준, u8 길이 + UTF-8
+    u32 postings_offset  blob 기준
+    u32 doc_freq
+  접두어 표 (접두어 정렬)
+    u32 prefix_offset    blob 기준, u8 길이 + UTF-8
+    u32 first_term       이 접두어로 시작하는 용어 범위 [first_term, end_term)
+    u32 end_term
+  posting
+    doc_freq개의 LEB128 varint, 위치 차이(delta)로 저장 (첫 값은 위치 그대로)
+
+사용 예:
+  python scripts/search_index.py                              # quotes.json + 번역 -> assets/search/
+  python scripts/search_index.py --query "행복" --lang ko
+  python scripts/search_index.py --complete "insp" --lang en
+  python scripts/search_index.py --bench
+"""
+
+import argparse
+import json
+import mmap
+import os
+import random
+import re
+import struct
+import time
+import unicodedata
+
+from corpus_io import iter_records, write_items
+from corpus_store import DEFAULT_STORE_FILE, fresh_store
+from translation_qa import char_script
+from translation_shards import corpus_hash, read_monolithic
+
+MAGIC = b'QIDX'
+VERSION = 2
+MANIFEST_NAME = 'manifest.json'
+DEFAULT_PREFIX_LENGTH = 2
+
+HEADER = struct.Struct('<4sHHIIIIII')
+ENTRY = struct.Struct('<III')
+U8 = struct.Struct('<B')
+
+_WORD_RE = re.compile(r'\w+')
+_CJK = {'hangul', 'kana', 'han'}
+
+
+def _strip_accents(word):
+    return ''.join(c for c in unicodedata.normalize('NFKD', word) if not unicodedata.combining(c))
+
+
+def tokenize(text, unigrams=False):
+    """검색 토큰 목록 (문서/검색어 공통), unigrams=True면 CJK 글자 unigram도 (문서 색인용)"""
+    tokens = []
+    for word in _WORD_RE.findall(unicodedata.normalize('NFKC', text).casefold()):
+        run = []
+        other = []
+        for char in word + ' ':
+            if char_script(char) in _CJK:
+                if other:
+                    tokens.append(_strip_accents(''.join(other)))
+                    other = []
+                run.append(char)
+                continue
+            if run:
+                bigrams = [''.join(run[i:i + 2]) for i in range(len(run) - 1)]
+                tokens.extend(bigrams + run if unigrams and bigrams else bigrams or run)
+                run = []
+            if char != ' ':
+                other.append(char)
+        if other:
+            tokens.append(_strip_accents(''.join(other)))
+    # 255바이트를 넘는 토큰은 용어 사전에 넣지 않음 (길이를 u8로 저장)
+    return [token for token in tokens if token and len(token.encode('utf-8')) <= 255]
+
+
+def encode_postings(positions):
+    """정렬된 위치 -> delta + LEB128 varint 바이트"""
+    out = bytearray()
+    previous = 0
+    for position in positions:
+        value = position - previous
+        previous = position
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def decode_postings(buf, pos, count):
+    positions = []
+    current = 0
+    for _ in range(count):
+        value = shift = 0
+        while True:
+            byte = buf[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        current += value
+        positions.append(current)
+    return positions
+
+
+def build_index(documents, output_path, prefix_length=DEFAULT_PREFIX_LENGTH):
+    """
+    문서 목록(위치 순서, 없는 문서는 None) -> 인덱스 파일, (용어 수, 파일 크기) 반환
+    """
+    postings = {}
+    doc_count = 0
+    for position, text in enumerate(documents):
+        doc_count = position + 1
+        if not text:
+            continue
+        for token in set(tokenize(text, unigrams=True)):
+            postings.setdefault(token, []).append(position)
+
+    terms = sorted(postings, key=lambda term: term.encode('utf-8'))
+    blob = bytearray()
+    entries = []
+    for term in terms:
+        data = term.encode('utf-8')
+        term_offset = len(blob)
+        blob += U8.pack(len(data)) + data
+        entries.append(ENTRY.pack(term_offset, len(blob), len(postings[term])))
+        blob += encode_postings(postings[term])
+
+    # 접두어 -> 용어 범위 (용어가 정렬되어 있으므로 범위는 연속)
+    prefixes = {}
+    for i, term in enumerate(terms):
+        prefix = term[:prefix_length]
+        first, _ = prefixes.get(prefix, (i, i))
+        prefixes[prefix] = (first, i + 1)
+    prefix_entries = []
+    for prefix in sorted(prefixes, key=lambda p: p.encode('utf-8')):
+        data = prefix.encode('utf-8')
+        prefix_entries.append(ENTRY.pack(len(blob), *prefixes[prefix]))
+        blob += U8.pack(len(data)) + data
+
+    terms_offset = HEADER.size
+    prefixes_offset = terms_offset + ENTRY.size * len(entries)
+    blob_offset = prefixes_offset + ENTRY.size * len(prefix_entries)
+    header = HEADER.pack(
+        MAGIC, VERSION, prefix_length, doc_count, len(entries), len(prefix_entries),
+        terms_offset, prefixes_offset, blob_offset,
+    )
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.writelines(entries)
+        f.writelines(prefix_entries)
+        f.write(blob)
+    os.replace(tmp_path, output_path)
+    return len(entries), os.path.getsize(output_path)
+
+
+class SearchIndex:
+    """인덱스 리더 (mmap, 용어 사전/접두어 표는 이진 탐색)"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.prefix_length, self.doc_count, self.term_count, self.prefix_count,
+         self._terms_offset, self._prefixes_offset, self._blob_offset) = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a search index (v{VERSION}): {path}")
+
+    def _string(self, offset):
+        pos = self._blob_offset + offset
+        (length,) = U8.unpack_from(self._data, pos)
+        return bytes(self._data[pos + 1:pos + 1 + length])
+
+    def _entry(self, table_offset, i):
+        return ENTRY.unpack_from(self._data, table_offset + ENTRY.size * i)
+
+    def term(self, i):
+        return self._string(self._entry(self._terms_offset, i)[0]).decode('utf-8')
+
+    def _search(self, table_offset, count, key, lo=0, hi=None):
+        """정렬된 표에서 key 이상인 첫 번째 항목 번호"""
+        hi = count if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string(self._entry(table_offset, mid)[0]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _postings(self, i):
+        _, offset, doc_freq = self._entry(self._terms_offset, i)
+        return decode_postings(self._data, self._blob_offset + offset, doc_freq)
+
+    def lookup(self, term):
+        """용어(토큰) 1개의 위치 목록"""
+        key = term.encode('utf-8')
+        i = self._search(self._terms_offset, self.term_count, key)
+        if i < self.term_count and self._string(self._entry(self._terms_offset, i)[0]) == key:
+            return self._postings(i)
+        return []
+
+    def term_range(self, prefix):
+        """prefix로 시작하는 용어 번호 범위 [first, end)"""
+        key = prefix.encode('utf-8')
+        if len(prefix) >= self.prefix_length:
+            # 접두어 표로 범위를 좁힌 뒤 그 안에서 이진 탐색
+            head = prefix[:self.prefix_length].encode('utf-8')
+            i = self._search(self._prefixes_offset, self.prefix_count, head)
+            if i == self.prefix_count or self._string(self._entry(self._prefixes_offset, i)[0]) != head:
+                return 0, 0
+            _, lo, hi = self._entry(self._prefixes_offset, i)
+        else:
+            lo, hi = 0, self.term_count
+        first = self._search(self._terms_offset, self.term_count, key, lo, hi)
+        # UTF-8에는 0xFF 바이트가 없으므로 key + 0xFF는 key로 시작하는 모든 용어보다 크다
+        return first, self._search(self._terms_offset, self.term_count, key + b'\xff', first, hi)
+
+    def complete(self, prefix, limit=10):
+        """입력 중인 마지막 토큰으로 시작하는 용어를 문서 빈도 순으로 (자동 완성 후보)"""
+        tokens = tokenize(prefix)
+        if not tokens:
+            return []
+        first, end = self.term_range(tokens[-1])
+        entries = [(self._entry(self._terms_offset, i)[2], i) for i in range(first, end)]
+        entries.sort(key=lambda entry: (-entry[0], entry[1]))
+        return [(self.term(i), doc_freq) for doc_freq, i in entries[:limit]]
+
+    def lookup_prefix(self, prefix):
+        """prefix로 시작하는 모든 용어의 위치 합집합 (정렬)"""
+        first, end = self.term_range(prefix)
+        positions = set()
+        for i in range(first, end):
+            positions.update(self._postings(i))
+        return sorted(positions)
+
+    def search(self, query, limit=20, prefix=True):
+        """
+        검색어의 모든 토큰을 포함하는 명언 위치 (corpus 순서)
+        prefix=True면 마지막 토큰은 접두어로 찾는다 ('insp' -> inspire, inspiration ...)
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        postings = [self.lookup(token) for token in tokens[:-1]]
+        postings.append(self.lookup_prefix(tokens[-1]) if prefix else self.lookup(tokens[-1]))
+        postings.sort(key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            if not result:
+                break
+            other = set(other)
+            result = [position for position in result if position in other]
+        return result[:limit]
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def language_documents(records, translations, lang):
+    """위치 순서의 검색 문서 (본문 또는 번역 + 작가), 번역이 없는 명언은 None"""
+    for record in records:
+        if lang == 'en':
+            text = record['quote']
+        else:
+            text = translations.get(record['id'], {}).get(lang)
+        yield f"{text} {record.get('author') or ''}" if text else None
+
+
+def load_translations(path):
+    """quotes_translations.json -> ({id: {lang: 번역}}, 언어 목록), 파일이 없으면 빈 값"""
+    if path and os.path.exists(path):
+        return read_monolithic(path)
+    return {}, []
+
+
+def build_indexes(records, directory, translations_path=None, prefix_length=DEFAULT_PREFIX_LENGTH):
+    """영어 + 번역 언어별 인덱스와 manifest 작성, manifest 반환"""
+    records = list(records)
+    translations, languages = load_translations(translations_path)
+    os.makedirs(directory, exist_ok=True)
+
+    entries = {}
+    for lang in ['en'] + [lang for lang in languages if lang != 'en']:
+        filename = f'{lang}.idx'
+        started = time.perf_counter()
+        term_count, size = build_index(
+            language_documents(records, translations, lang), os.path.join(directory, filename), prefix_length
+        )
+        entries[lang] = {
+            'file': filename, 'terms': term_count, 'bytes': size,
+            'build_s': round(time.perf_counter() - started, 3),
+        }
+
+    manifest = {
+        'version': VERSION,
+        'count': len(records),
+        'corpus_hash': corpus_hash(record['id'] for record in records),
+        'languages': entries,
+    }
+    write_items(os.path.join(directory, MANIFEST_NAME), manifest.items())
+    return manifest
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def benchmark(records, translations, directory, lang='en', queries=200, seed=7):
+    """
+    인덱스 크기(원문 대비)와 검색 지연 (전체 검색어 / 접두어 2글자 자동 완성) vs 선형 탐색
+    검색어는 corpus에서 무작위로 뽑은 연속 토큰 1~2개
+    """
+    documents = list(language_documents(records, translations, lang))
+    rng = random.Random(seed)
+    words = [tokenize(text) for text in documents if text]
+    samples = []
+    for _ in range(queries):
+        tokens = rng.choice(words)
+        start = rng.randrange(len(tokens))
+        samples.append(' '.join(tokens[start:start + rng.choice([1, 2])]))
+
+    def timed(fn):
+        latencies = []
+        for query in samples:
+            started = time.perf_counter()
+            fn(query)
+            latencies.append((time.perf_counter() - started) * 1000)
+        return {'p50_ms': round(_percentile(latencies, 0.5), 4), 'p99_ms': round(_percentile(latencies, 0.99), 4)}
+
+    folded = [' '.join(tokenize(text)) if text else '' for text in documents]
+    path = os.path.join(directory, f'{lang}.idx')
+    with SearchIndex(path) as index:
+        return {
+            'lang': lang,
+            'docs': sum(1 for text in documents if text),
+            'text_bytes': sum(len(text.encode('utf-8')) for text in documents if text),
+            'index_bytes': os.path.getsize(path),
+            'terms': index.term_count,
+            'query': timed(lambda query: index.search(query, prefix=False)),
+            'type_ahead_2': timed(lambda query: index.complete(query[:2])),
+            'linear_scan': timed(lambda query: [i for i, text in enumerate(folded) if query in text]),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the per-language full-text search index')
+    parser.add_argument('--input', default='assets/quotes.json')
+    parser.add_argument('--translations', default='assets/quotes_translations.json')
+    parser.add_argument('--output-dir', default='assets/search')
+    parser.add_argument('--prefix-length', type=int, default=DEFAULT_PREFIX_LENGTH, help='접두어 표 글자 수')
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--query', default=None, help='검색 (마지막 단어는 접두어)')
+    parser.add_argument('--complete', default=None, help='자동 완성 후보')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--bench', action='store_true', help='인덱스 크기와 검색 지연 측정')
+    parser.add_argument('--store', default=DEFAULT_STORE_FILE, help='corpus 저장소 (빈 문자열이면 quotes.json을 읽음)')
+    args = parser.parse_args()
+
+    if args.query is not None or args.complete is not None:
+        path = os.path.join(args.output_dir, f'{args.lang}.idx')
+        with SearchIndex(path) as index:
+            if args.complete is not None:
+                for term, doc_freq in index.complete(args.complete, args.limit):
+                    print(f"{term}\t{doc_freq}")
+            if args.query is not None:
+                # 결과 위치의 명언만 저장소에서 찾음 (저장소가 없거나 오래됐으면 quotes.json 전체)
+                store = fresh_store(args.store, args.input)
+                if store is not None:
+                    with store:
+                        results = [store.at(position) for position in index.search(args.query, args.limit)]
+                else:
+                    records = list(iter_records(args.input))
+                    results = [records[position] for position in index.search(args.query, args.limit)]
+                for record in results:
+                    print(f"[{record['id']}] {record['quote']} — {record['author']}")
+        return
+
+    store = fresh_store(args.store, args.input)
+    if store is not None:
+        with store:
+            records = list(store)
+    else:
+        records = list(iter_records(args.input))
+    manifest = build_indexes(records, args.output_dir, args.translations, args.prefix_length)
+    print(f"Wrote {len(manifest['languages'])} search indexes to {args.output_dir} ({manifest['count']} quotes)")
+    for lang, entry in manifest['languages'].items():
+        print(f"  {lang}: {entry['terms']} terms, {entry['bytes']} bytes, {entry['build_s']}s")
+
+    if args.bench:
+        translations, _ = load_translations(args.translations)
+        for lang in manifest['languages']:
+            print(json.dumps(benchmark(records, translations, args.output_dir, lang), ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+"""scripts/의 모듈은 서로를 형제 모듈로 import하므로 테스트도 scripts/를 경로에 넣고 실행한다"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,98 @@
+import os
+import socket
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench'))
+
+import api_client  # noqa: E402
+from api_client import ApiClient, iter_sse  # noqa: E402
+from api_engine import RetryableError  # noqa: E402
+from stub_api import StubServer  # noqa: E402
+
+PAYLOAD = {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': 'Hello'}]}
+
+
+def test_keep_alive_reuses_one_connection():
+    client = ApiClient(pool_size=2)
+    with StubServer() as server:
+        for _ in range(5):
+            response = client.post_json(server.url, 'key', PAYLOAD)
+            assert response.status_code == 200
+            assert response.json()['choices'][0]['message']['content'] == '[stub] Hello'
+        assert server.stats.snapshot()['connections'] == 1
+    client.close()
+
+
+def test_throttle_raises_retryable_with_retry_after():
+    client = ApiClient()
+    with StubServer(rate_429=1.0, retry_after=0.25) as server:
+        with pytest.raises(RetryableError) as excinfo:
+            client.post_json(server.url, 'key', PAYLOAD)
+    assert excinfo.value.retry_after == 0.25
+    client.close()
+
+
+def test_connection_refused_is_retryable():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    client = ApiClient(connect_retries=0, connect_timeout=1)
+    with pytest.raises(RetryableError):
+        client.post_json(f'http://127.0.0.1:{port}/v1/chat/completions', 'key', PAYLOAD)
+    client.close()
+
+
+def test_configure_replaces_shared_client(monkeypatch):
+    monkeypatch.setattr(api_client, '_client', None)
+    first = api_client.get_client()
+    assert api_client.get_client() is first
+    second = api_client.configure(pool_size=3, read_timeout=5)
+    assert api_client.get_client() is second is not first
+    assert second.read_timeout == 5
+    second.close()
+
+
+def test_http2_requires_httpx(monkeypatch):
+    monkeypatch.setattr(api_client, 'httpx', None)
+    with pytest.raises(RuntimeError):
+        ApiClient(http2=True)
+
+
+def test_iter_sse_joins_data_lines_and_skips_comments():
+    lines = [b': keep-alive', b'', b'event: chunk', b'data: {"a":', b'data: 1}\r', b'', 'data:{"b": 2}', '', 'data: [DONE]']
+    assert list(iter_sse(lines)) == [{'a': 1}, {'b': 2}]
+
+
+def test_iter_sse_without_done_is_truncated():
+    events = iter_sse(['data: {"a": 1}', '', 'data: {"b": 2}'])
+    assert next(events) == {'a': 1}
+    with pytest.raises(RetryableError):
+        next(events)
+    with pytest.raises(RetryableError):
+        list(iter_sse([]))
+
+
+def test_iter_sse_malformed_event_is_retryable():
+    with pytest.raises(RetryableError):
+        list(iter_sse(['data: {"a": ', '', 'data: [DONE]', '']))
+
+
+def test_stream_events_from_stub():
+    client = ApiClient()
+    with StubServer(seed=1) as server:
+        events = list(client.stream_events(server.url, 'key', {**PAYLOAD, 'stream_options': {'include_usage': True}}))
+    text = ''.join(choice['delta'].get('content') or '' for event in events for choice in event['choices'])
+    assert text == '[stub] Hello'
+    assert events[-2]['choices'][0]['finish_reason'] == 'stop'
+    assert events[-1]['usage']['completion_tokens'] > 0
+    client.close()
+
+
+def test_stream_events_cut_off_is_retryable():
+    client = ApiClient()
+    with StubServer(stream_truncate=1.0) as server:
+        with pytest.raises(RetryableError):
+            list(client.stream_events(server.url, 'key', PAYLOAD))
+    client.close()
@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+
+import api_engine
+from api_engine import ApiEngine, RateLimiter, RetryableError, TokenBucket, backoff_delay, parse_retry_after
+
+
+class FakeLimiter:
+    """acquire를 기다리지 않고 호출만 기록"""
+
+    def __init__(self):
+        self.throttles = []
+        self.successes = 0
+
+    def acquire(self, tokens=0):
+        pass
+
+    def on_success(self):
+        self.successes += 1
+
+    def on_throttle(self, delay):
+        self.throttles.append(delay)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('2.5') == 2.5
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_delay_is_capped(monkeypatch):
+    monkeypatch.setattr(api_engine.random, 'uniform', lambda low, high: high)
+    assert backoff_delay(0, base=1.0, cap=60.0) == 1.0
+    assert backoff_delay(3, base=1.0, cap=60.0) == 8.0
+    assert backoff_delay(10, base=1.0, cap=60.0) == 60.0
+
+
+def test_token_bucket_reserve_returns_wait():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    # capacity보다 큰 요청도 capacity만큼만 기다림
+    assert TokenBucket(rate=1, capacity=5).reserve(100) == 0.0
+
+
+def test_rate_limiter_aimd():
+    limiter = RateLimiter(requests_per_sec=4.0, min_requests_per_sec=1.0)
+    limiter.on_throttle(0.0)
+    assert limiter.requests_per_sec == 2.0
+    limiter.on_throttle(0.0)
+    limiter.on_throttle(0.0)
+    assert limiter.requests_per_sec == 1.0
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.requests_per_sec == 4.0
+
+
+def test_engine_retries_then_succeeds():
+    limiter = FakeLimiter()
+    engine = ApiEngine(limiter, concurrency=2, max_retries=3)
+    attempts = {}
+    lock = threading.Lock()
+
+    def worker(job):
+        with lock:
+            attempts[job] = attempts.get(job, 0) + 1
+            if attempts[job] < 3:
+                raise RetryableError('429', retry_after=0)
+        return job * 10
+
+    results = dict(engine.run([1, 2, 3], worker))
+    assert results == {1: 10, 2: 20, 3: 30}
+    assert attempts == {1: 3, 2: 3, 3: 3}
+    # Retry-After 값이 백오프 대신 전역 대기로 쓰임
+    assert limiter.throttles == [0] * 6
+
+
+def test_engine_gives_up_after_max_retries():
+    engine = ApiEngine(FakeLimiter(), concurrency=1, max_retries=2, backoff_base=0)
+    calls = []
+
+    def worker(job):
+        calls.append(job)
+        raise RetryableError('503')
+
+    assert list(engine.run(['a'], worker)) == [('a', None)]
+    assert len(calls) == 3
+
+
+def test_engine_budget_skips_without_calling():
+    class Exhausted:
+        def reserve(self):
+            return False
+
+        def release(self):
+            raise AssertionError('release without reserve')
+
+    calls = []
+    engine = ApiEngine(FakeLimiter(), budget=Exhausted())
+    assert list(engine.run([1], calls.append)) == [(1, None)]
+    assert calls == []
+
+
+def test_drain_returns_unreported_results():
+    started = threading.Event()
+    release = threading.Event()
+    engine = ApiEngine(FakeLimiter(), concurrency=2)
+
+    def worker(job):
+        if job == 'slow':
+            started.set()
+            release.wait(5)
+        else:
+            started.wait(5)
+        return job.upper()
+
+    results = engine.run(['slow', 'fast'], worker)
+    assert next(results) == ('fast', 'FAST')
+    release.set()
+    # 중단(Ctrl-C)처럼 소비를 멈춰도 진행 중이던 요청의 결과는 drain으로 받는다
+    results.close()
+    assert engine.drain() == [('slow', 'SLOW')]
@@ -0,0 +1,39 @@
+from authors import AhoCorasick, AuthorMatcher, author_key, author_slug, canonical_names, load_famous_people
+
+
+def test_author_key_merges_spelling_variants():
+    assert author_key('T.S. Eliot') == author_key('T. S. Eliot') == 't s eliot'
+    assert author_key('Thomas A. Edison') == author_key('Thomas Edison') == 'thomas edison'
+    assert author_key('Mohandas K. Gandhi') == 'mahatma gandhi'
+    assert author_key('José Martí') == 'jose marti'
+    assert author_key('') == 'unknown'
+
+
+def test_author_key_keeps_distinguishing_initials():
+    assert author_key('George H. W. Bush') != author_key('George W. Bush')
+    assert author_slug(author_key('George H. W. Bush')) == 'george-h-w-bush'
+    assert author_key('Martin Luther King Jr.') == 'martin luther king jr'
+
+
+def test_aho_corasick_substring_matches():
+    automaton = AhoCorasick(['he', 'she', 'hers', 'einstein'])
+    assert automaton.matches('ushers')
+    assert automaton.matches('albert einstein')
+    assert not automaton.matches('edison')
+
+
+def test_matcher_uses_app_substring_rule():
+    matcher = AuthorMatcher(['Edison', 'Albert Einstein'])
+    assert matcher.lookup('Thomas A. Edison') == ('thomas-edison', True)
+    assert matcher.lookup('Einstein') == ('albert-einstein', False)
+
+
+def test_canonical_names_prefers_most_common_then_longest():
+    records = [{'author': 'Thomas Edison'}, {'author': 'Thomas A. Edison'}, {'author': None}]
+    assert canonical_names(records) == {'thomas-edison': 'Thomas A. Edison', 'unknown': 'Unknown'}
+
+
+def test_loads_famous_people_from_app():
+    famous = load_famous_people()
+    assert 'Thomas Edison' in famous
+    assert all(isinstance(name, str) and name for name in famous)
@@ -0,0 +1,40 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench'))
+
+import pre_translate_quotes  # noqa: E402
+from run_bench import BENCHMARKS, bench_corpus, bench_translation  # noqa: E402
+from synthetic import synthetic_quotes  # noqa: E402
+
+
+def test_synthetic_quotes_are_deterministic():
+    first = list(synthetic_quotes(300, seed=3))
+    assert first == list(synthetic_quotes(300, seed=3))
+    assert [r['id'] for r in first] == list(range(300))
+    assert first != list(synthetic_quotes(300, seed=4))
+
+
+def test_bench_corpus_reports_every_step(tmp_path):
+    results = bench_corpus(300, str(tmp_path), skip=set(), famous_people=['Einstein'])
+    assert results['size'] == 300
+    assert 0 < results['dedup_kept'] <= 300
+    for key in ('write_s', 'json_load_s', 'stream_load_s', 'index_s', 'bundle_s', 'store_build_s', 'search_query_ms'):
+        assert results[key] >= 0
+    assert not os.path.exists(tmp_path / 'quotes_300.json')
+
+
+def test_bench_corpus_skip(tmp_path):
+    results = bench_corpus(50, str(tmp_path), skip=set(BENCHMARKS), famous_people=[])
+    assert set(results) == {'size', 'json_bytes'}
+
+
+def test_bench_translation_against_stub(monkeypatch):
+    # bench_translation이 모듈 전역 API_URL을 스텁으로 바꾸므로 테스트 뒤에 되돌린다
+    monkeypatch.setattr(pre_translate_quotes, 'API_URL', pre_translate_quotes.API_URL)
+    monkeypatch.setattr(pre_translate_quotes, 'API_KEY', 'test')
+    results = bench_translation(jobs=12, latency=0.0, rate_429=0.2, concurrency=4, rps=1000, batch_size=4)
+    assert results['single']['translated'] == 12
+    assert results['batched']['translated'] == 12
+    assert results['single']['requests'] == 12 + results['single']['throttled']
+    assert results['batched']['requests'] >= 3
@@ -0,0 +1,145 @@
+import pytest
+
+import build_corpus
+from build_corpus import (
+    AssignIds, Dedup, MapStage, Normalize, find_orphans, id_remap, load_id_map, merge_id_maps, near_duplicate_remap,
+    remap_translations, run_stages, stable_id,
+)
+from corpus_io import iter_items, write_items
+
+ORIGINAL = 'If you are working on something that you really care about, you do not have to be pushed.'
+VARIANT = 'If you are working on something exciting that you really care about, you do not have to be pushed.'
+
+
+class Upper(MapStage):
+    name = 'upper'
+
+    def __init__(self):
+        self.calls = 0
+
+    def transform(self, record):
+        self.calls += 1
+        return dict(record, quote=record['quote'].upper())
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_corpus, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def test_normalize():
+    stage = Normalize()
+    assert stage.transform({'quote': ' “Be   yourself.” ', 'author': '  Oscar   Wilde ', 'category': ' Life '}) == {
+        'quote': 'Be yourself.', 'author': 'Oscar Wilde', 'category': 'life', 'tags': [],
+    }
+    assert stage.transform({'quote': '""'}) is None
+    assert stage.transform({'quote': 'Hi', 'author': None})['author'] == 'Unknown'
+
+
+def test_dedup_keeps_first_of_exact_and_near_duplicates():
+    records = [
+        {'quote': ORIGINAL},
+        {'quote': ORIGINAL.upper()},
+        {'quote': VARIANT},
+        {'quote': 'The best way to predict the future is to invent it.'},
+    ]
+    assert list(Dedup(similarity=0.7).run(records)) == [records[0], records[3]]
+
+
+def test_find_orphans():
+    previous = [{'quote': 'Kept quote.'}, {'quote': 'Hand-added quote.'}]
+    sources = [{'quote': '  "Kept   quote."'}]
+    assert find_orphans(previous, sources) == [{'quote': 'Hand-added quote.'}]
+
+
+def test_map_stage_memo_only_transforms_changed_records(cache_dir):
+    stage = Upper()
+    stage.memo_dir = str(cache_dir)
+    assert [r['quote'] for r in stage.run([{'quote': 'a'}, {'quote': 'b'}])] == ['A', 'B']
+    assert stage.calls == 2
+
+    assert [r['quote'] for r in stage.run([{'quote': 'a'}, {'quote': 'c'}])] == ['A', 'C']
+    assert stage.calls == 3
+    assert stage.memo_hits == 1
+
+
+def test_run_stages_resumes_from_last_cached_stage(cache_dir):
+    source_calls = []
+
+    def source():
+        source_calls.append(1)
+        return iter([{'quote': ' a '}, {'quote': 'b'}])
+
+    key, records, executed = run_stages([Normalize(), Upper()], 'base', source)
+    assert [r['quote'] for r in records] == ['A', 'B']
+    assert executed == ['normalize', 'upper']
+
+    again_key, records, executed = run_stages([Normalize(), Upper()], 'base', source)
+    assert again_key == key
+    assert [r['quote'] for r in records] == ['A', 'B']
+    assert executed == []
+    assert len(source_calls) == 1
+
+    _, _, executed = run_stages([Normalize(), Upper()], 'other', source)
+    assert executed == ['normalize', 'upper']
+
+
+def test_run_stages_without_cache_recomputes(cache_dir):
+    source = lambda: iter([{'quote': 'a'}])
+    list(run_stages([Normalize()], 'base', source)[1])
+    _, records, executed = run_stages([Normalize()], 'base', source, use_cache=False)
+    assert executed == ['normalize']
+    assert list(records) == [{'quote': 'a', 'author': 'Unknown', 'category': '', 'tags': []}]
+
+
+def test_stable_id_depends_only_on_normalized_text():
+    assert stable_id('Be yourself.') == stable_id('  be   YOURSELF. ')
+    assert stable_id('Be yourself.') != stable_id('Be yourself!')
+    assert 0 <= stable_id('Be yourself.') < 2 ** 31
+
+
+def test_assign_ids_resolves_collisions_in_order(monkeypatch):
+    monkeypatch.setattr(build_corpus, 'stable_id', lambda text: 0x7FFFFFFF)
+    records = list(AssignIds().run([{'quote': 'a'}, {'quote': 'b'}, {'quote': 'c'}]))
+    assert [r['id'] for r in records] == [0x7FFFFFFF, 0, 1]
+    assert list(records[0]) == ['id', 'quote']
+
+
+def test_id_remap_follows_same_text():
+    previous = [{'id': 1, 'quote': 'Be yourself.'}, {'id': 2, 'quote': 'Gone.'}, {'id': 3, 'quote': 'Same'}]
+    records = [{'id': 100, 'quote': 'be  yourself.'}, {'id': 3, 'quote': 'Same'}]
+    assert id_remap(previous, records) == {'1': 100}
+
+
+def test_near_duplicate_remap_maps_dropped_variant():
+    previous = [{'id': 1, 'quote': VARIANT}, {'id': 2, 'quote': 'Nothing like it remains here.'}]
+    records = [{'id': 50, 'quote': ORIGINAL}]
+    assert near_duplicate_remap(previous, records, 0.7) == {'1': 50}
+
+
+def test_merge_id_maps_composes_and_keeps_old_keys():
+    previous_map = {'7': 123, '8': 200}
+    remap = {'123': 456}
+    # 7 -> 123 -> 456 체인은 최종 id로 줄이고, 바뀌지 않은 8 -> 200은 그대로
+    assert merge_id_maps(previous_map, remap, {456, 200}) == {'7': 456, '8': 200, '123': 456}
+    # 새 corpus에 살아 있는 id는 키에서 빠짐 (앱이 다시 적용해도 옮기지 않도록)
+    assert merge_id_maps({'7': 123}, {}, {7, 123}) == {}
+    # 되돌아간 체인(7 -> 123 -> 7)은 자기 자신이 되므로 빠짐
+    assert merge_id_maps({'7': 123}, {'123': 7}, {7}) == {'123': 7}
+
+
+def test_load_id_map(tmp_path):
+    path = tmp_path / 'quote_id_map.json'
+    assert load_id_map(str(path)) == {}
+    write_items(str(path), [('version', 'abc'), ('map', {'1': 2})])
+    assert load_id_map(str(path)) == {'1': 2}
+    path.write_text('{broken', encoding='utf-8')
+    assert load_id_map(str(path)) == {}
+
+
+def test_remap_translations_moves_keys(tmp_path):
+    path = tmp_path / 'quotes_translations.json'
+    write_items(str(path), [('1', {'quote': 'a'}), ('2', {'quote': 'b'}), ('3', {'quote': 'a again'})])
+    assert remap_translations(str(path), {'1': 10, '3': 10}) == 2
+    assert dict(iter_items(str(path))) == {'10': {'quote': 'a'}, '2': {'quote': 'b'}}
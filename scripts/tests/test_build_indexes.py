@@ -0,0 +1,43 @@
+import datetime
+
+from build_indexes import VERSION, build_indexes, daily_schedule, length_bucket
+from translation_shards import corpus_hash
+
+RECORDS = [
+    {'id': 30, 'quote': 'x' * 150, 'author': 'Thomas A. Edison', 'category': 'Success'},
+    {'id': 10, 'quote': 'Short one.', 'author': 'Thomas Edison', 'category': 'success'},
+    {'id': 20, 'quote': 'y' * 250, 'author': 'Nobody Special', 'category': 'love'},
+]
+
+
+def test_length_bucket():
+    assert length_bucket('x' * 100) == 'short'
+    assert length_bucket('x' * 101) == 'medium'
+    assert length_bucket('x' * 201) == 'long'
+
+
+def test_daily_schedule_matches_app_formula():
+    schedule = daily_schedule([1, 2, 3], datetime.date(2024, 12, 31), 2)
+    # 2024-12-31: 365 + 2024 = 2389 % 3 == 1, 2025-01-01: 0 + 2025 = 2025 % 3 == 0
+    assert schedule == {'2024-12-31': 2, '2025-01-01': 1}
+    assert daily_schedule([], datetime.date(2024, 1, 1), 5) == {}
+
+
+def test_build_indexes():
+    indexes = build_indexes(RECORDS, ['Edison'], start=datetime.date(2024, 1, 1), days=1)
+    assert indexes['version'] == VERSION
+    assert indexes['count'] == 3
+    # 앱이 quotes.json과 맞춰 보는 값 (corpus 순서 그대로)
+    assert indexes['corpus_hash'] == corpus_hash([30, 10, 20])
+    assert indexes['categories'] == {'love': [20], 'success': [10, 30]}
+    assert indexes['authors'] == {'nobody-special': [20], 'thomas-edison': [10, 30]}
+    assert indexes['famous'] == [10, 30]
+    assert indexes['length'] == {'short': [10], 'medium': [30], 'long': [20]}
+    assert list(indexes['daily']) == ['2024-01-01']
+
+
+def test_build_indexes_prefers_enriched_fields():
+    record = dict(RECORDS[2], author_id='someone-else', famous=True)
+    indexes = build_indexes([record], [], days=0)
+    assert indexes['authors'] == {'someone-else': [20]}
+    assert indexes['famous'] == [20]
@@ -0,0 +1,66 @@
+from checkpoint import TranslationJournal
+
+
+def test_resume_reads_appended_entries(tmp_path):
+    journal = TranslationJournal(str(tmp_path / 'run.journal.jsonl'))
+    journal.append(1, 'ko', 'Hello', '안녕')
+    journal.append(1, 'ja', 'Hello', 'こんにちは')
+    journal.append(1, 'ko', 'Hello', '안녕하세요')
+    journal.close()
+
+    assert TranslationJournal(journal.path).load() == {
+        (1, 'ko'): {'quote': 'Hello', 'translation': '안녕하세요'},
+        (1, 'ja'): {'quote': 'Hello', 'translation': 'こんにちは'},
+    }
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    path = tmp_path / 'run.journal.jsonl'
+    journal = TranslationJournal(str(path))
+    journal.append(2, 'es', 'Hi', 'Hola')
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"id": 3, "lang": "fr", "quote": "Hi", "transl')
+
+    assert TranslationJournal(str(path)).load() == {(2, 'es'): {'quote': 'Hi', 'translation': 'Hola'}}
+
+
+def test_entries_after_truncated_line_are_kept(tmp_path):
+    path = tmp_path / 'run.journal.jsonl'
+    journal = TranslationJournal(str(path))
+    journal.append(1, 'ko', 'Hello', '안녕')
+    journal.append(2, 'es', 'Hi', 'Hola')
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"id": 3, "lang": "fr", "quote": "Hi", "transl')
+
+    # 이어서 실행: 잘린 줄 뒤에 쓴 기록과 거절이 모두 남아야 함
+    resumed = TranslationJournal(str(path))
+    resumed.append(3, 'fr', 'Hi', 'Salut')
+    resumed.reject(2, 'es')
+    resumed.append(4, 'ja', 'Hi', 'やあ')
+    resumed.close()
+    assert TranslationJournal(str(path)).load() == {
+        (1, 'ko'): {'quote': 'Hello', 'translation': '안녕'},
+        (3, 'fr'): {'quote': 'Hi', 'translation': 'Salut'},
+        (4, 'ja'): {'quote': 'Hi', 'translation': 'やあ'},
+    }
+
+
+def test_reject_drops_entry_until_rewritten(tmp_path):
+    journal = TranslationJournal(str(tmp_path / 'run.journal.jsonl'))
+    journal.append(1, 'ko', 'Hello', "I'm sorry")
+    journal.reject(1, 'ko')
+    assert journal.load() == {}
+
+    journal.append(1, 'ko', 'Hello', '안녕')
+    assert journal.load() == {(1, 'ko'): {'quote': 'Hello', 'translation': '안녕'}}
+
+
+def test_remove(tmp_path):
+    path = tmp_path / 'run.journal.jsonl'
+    journal = TranslationJournal(str(path))
+    journal.append(1, 'ko', 'Hello', '안녕')
+    journal.remove()
+    assert not path.exists()
+    assert journal.load() == {}
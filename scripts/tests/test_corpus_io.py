@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+import corpus_io
+from corpus_io import iter_items, iter_records, load_records, write_items, write_records
+
+RECORDS = [
+    {'id': 1, 'quote': '행복은 습관이다', 'author': 'Hubbard', 'tags': []},
+    {'id': 1234567890, 'quote': 'Say "yes" \\ no', 'author': 'Unknown', 'tags': ['a', 'b']},
+]
+
+
+@pytest.mark.parametrize('indent', [2, None])
+def test_write_records_matches_json_dump(tmp_path, indent):
+    path = tmp_path / 'quotes.json'
+    assert write_records(str(path), RECORDS, indent=indent) == 2
+    assert path.read_text(encoding='utf-8') == json.dumps(RECORDS, indent=indent, ensure_ascii=False)
+    assert write_records(str(path), [], indent=indent) == 0
+    assert path.read_text(encoding='utf-8') == json.dumps([], indent=indent)
+
+
+def test_write_items_matches_json_dump(tmp_path):
+    path = tmp_path / 'translations.json'
+    items = {'1': {'quote': 'Hi', 'translations': {'ko': '안녕'}}, '2': {'quote': 'Bye', 'translations': {}}}
+    write_items(str(path), items.items())
+    assert path.read_text(encoding='utf-8') == json.dumps(items, indent=2, ensure_ascii=False)
+    assert dict(iter_items(str(path))) == items
+
+
+def test_streaming_reader_across_chunk_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(corpus_io, 'CHUNK_SIZE', 7)
+    path = tmp_path / 'quotes.json'
+    write_records(str(path), RECORDS)
+    assert load_records(str(path)) == RECORDS
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = tmp_path / 'quotes.jsonl'
+    write_records(str(path), RECORDS)
+    assert path.read_text(encoding='utf-8').count('\n') == 2
+    assert list(iter_records(str(path))) == RECORDS
+
+
+def test_failed_write_keeps_original(tmp_path):
+    path = tmp_path / 'quotes.json'
+    write_records(str(path), RECORDS)
+
+    def broken():
+        yield RECORDS[0]
+        raise RuntimeError('interrupted')
+
+    with pytest.raises(RuntimeError):
+        write_records(str(path), broken())
+    assert load_records(str(path)) == RECORDS
+    assert [p.name for p in tmp_path.iterdir()] == ['quotes.json']
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from corpus_io import write_items
+from corpus_store import CorpusStore, build_store, fresh_store
+
+RECORDS = [
+    {'id': 30, 'quote': 'Third by id, first in corpus.', 'author': 'A', 'category': 'love', 'tags': ['x'],
+     'author_id': 'a', 'famous': True, 'length': 'short'},
+    {'id': 10, 'quote': 'Second.', 'author': 'B', 'category': 'time', 'tags': [], 'source': 'gpt'},
+    {'id': 20, 'quote': 'Third.', 'author': 'B', 'category': 'love', 'tags': []},
+]
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    translations = str(tmp_path / 'quotes_translations.json')
+    write_items(translations, [
+        ('10', {'quote': 'Second.', 'translations': {'ko': '둘째', 'ja': '二番目'}}),
+        ('30', {'quote': 'Third by id, first in corpus.', 'translations': {'ko': '첫째'}}),
+    ])
+    path = str(tmp_path / 'corpus.sqlite')
+    assert build_store(path, RECORDS, translations) == (3, 3)
+    return path
+
+
+def test_random_access_keeps_corpus_order_and_fields(store_path):
+    with CorpusStore(store_path, readonly=True) as store:
+        assert len(store) == 3 and 10 in store and 11 not in store
+        assert list(store) == RECORDS
+        assert store.get(10) == RECORDS[1]
+        assert store.get(11) is None
+        assert store.at(0) == RECORDS[0]
+        assert store.ids() == [30, 10, 20]
+        assert store.texts() == [r['quote'] for r in RECORDS]
+        assert [r['id'] for r in store.iter_category('love')] == [30, 20]
+        assert [r['id'] for r in store.iter_author('a')] == [30]
+        assert [r['id'] for r in store.iter_author('B')] == [10, 20]
+        assert store.categories() == {'love': 2, 'time': 1}
+
+
+def test_translations(store_path):
+    with CorpusStore(store_path, readonly=True) as store:
+        assert store.translation(10, 'ko') == '둘째'
+        assert store.translations(10) == {'ja': '二番目', 'ko': '둘째'}
+        assert list(store.iter_language('ko')) == [(30, '첫째'), (10, '둘째')]
+        assert list(store.iter_translated()) == [
+            (30, RECORDS[0]['quote'], {'ko': '첫째'}),
+            (10, 'Second.', {'ja': '二番目', 'ko': '둘째'}),
+        ]
+        assert store.languages() == {'ja': 1, 'ko': 2}
+
+
+def test_replace_translations_drops_stale_languages(store_path):
+    with CorpusStore(store_path) as store:
+        assert store.replace_translations([(10, {'ko': '두 번째', 'ja': ''})]) == 1
+        assert store.translations(10) == {'ko': '두 번째'}
+        assert store.put_translations([(20, 'es', 'Tercero'), (20, 'fr', '')]) == 1
+        assert store.append([RECORDS[0], {'id': 40, 'quote': 'New.'}]) == 1
+        assert store.at(3)['id'] == 40
+
+
+def test_readonly_requires_existing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CorpusStore(str(tmp_path / 'missing.sqlite'), readonly=True)
+
+
+def test_fresh_store_checks_source_mtime(store_path, tmp_path):
+    source = tmp_path / 'quotes.json'
+    source.write_text('[]', encoding='utf-8')
+    updated = os.path.getmtime(store_path)
+    os.utime(source, (updated - 10, updated - 10))
+    store = fresh_store(store_path, str(source))
+    assert store is not None and len(store) == 3
+    store.close()
+
+    os.utime(source, (updated + 10, updated + 10))
+    assert fresh_store(store_path, str(source)) is None
+    assert fresh_store(str(tmp_path / 'missing.sqlite')) is None
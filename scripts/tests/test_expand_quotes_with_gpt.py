@@ -0,0 +1,87 @@
+import pytest
+
+import expand_quotes_with_gpt
+from api_engine import RetryableError
+from metrics import Metrics
+from expand_quotes_with_gpt import MAX_TOKENS, generation_estimate, parse_quote_line, parse_quotes
+
+
+def test_parse_quote_line():
+    assert parse_quote_line(' "Simplicity is the ultimate sophistication." - Leonardo da Vinci ', 'truth') == {
+        'quote': 'Simplicity is the ultimate sophistication.', 'author': 'Leonardo da Vinci', 'category': 'truth',
+    }
+    assert parse_quote_line('"Too short" - Someone', 'truth') is None
+    assert parse_quote_line('1. Not in the requested format', 'truth') is None
+
+
+def test_parse_quotes_skips_noise():
+    text = 'Here are your quotes:\n"Well done is better than well said." - Benjamin Franklin\n\n"Broken line'
+    assert [quote['author'] for quote in parse_quotes(text, 'success')] == ['Benjamin Franklin']
+
+
+def test_generation_estimate_caps_output():
+    tokens_in, tokens_out = generation_estimate('love', 10)
+    assert tokens_in > 0
+    assert tokens_out == 10 * expand_quotes_with_gpt.QUOTE_LINE_TOKENS
+    assert generation_estimate('love', 1000)[1] == MAX_TOKENS
+
+
+class FakeStreamClient:
+    """content 조각들을 SSE 이벤트처럼 넘기는 가짜 클라이언트 (sent: 지금까지 넘긴 조각 수)"""
+
+    def __init__(self, pieces, finish_reason='stop', cut_off=False):
+        self.pieces = pieces
+        self.finish_reason = finish_reason
+        self.cut_off = cut_off
+        self.sent = 0
+
+    def stream_events(self, url, api_key, payload):
+        assert payload['stream_options'] == {'include_usage': True}
+        for piece in self.pieces:
+            self.sent += 1
+            yield {'choices': [{'delta': {'content': piece}}]}
+        if self.cut_off:
+            raise RetryableError('Stream ended before [DONE]')
+        yield {'choices': [{'delta': {}, 'finish_reason': self.finish_reason}]}
+        yield {'choices': [], 'usage': {'prompt_tokens': 50, 'completion_tokens': 20}}
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    metrics = Metrics('test')
+    monkeypatch.setattr(expand_quotes_with_gpt, 'METRICS', metrics)
+    return metrics
+
+
+def stream(monkeypatch, client):
+    monkeypatch.setattr(expand_quotes_with_gpt, 'get_client', lambda: client)
+    return expand_quotes_with_gpt.stream_quotes_with_gpt('hope', 3)
+
+
+PIECES = ['"Hope is a waking dre', 'am." - Aristotle\n"Keep your face', ' to the sunshine." - Helen Keller\n',
+          '"Where there is life, there is hope." - Cicero']
+
+
+def test_stream_yields_quotes_as_lines_complete(monkeypatch, metrics):
+    client = FakeStreamClient(PIECES)
+    quotes = stream(monkeypatch, client)
+    assert next(quotes)['author'] == 'Aristotle'
+    assert client.sent == 2
+    # 줄바꿈 없이 끝난 마지막 줄도 정상 종료면 명언
+    assert [quote['author'] for quote in quotes] == ['Helen Keller', 'Cicero']
+    assert metrics.total('tokens_out') == 20
+
+
+def test_stream_drops_tail_cut_by_max_tokens(monkeypatch, metrics):
+    quotes = list(stream(monkeypatch, FakeStreamClient(PIECES, finish_reason='length')))
+    assert [quote['author'] for quote in quotes] == ['Aristotle', 'Helen Keller']
+    assert metrics.total('truncated') == 1
+
+
+def test_stream_cut_off_keeps_completed_lines(monkeypatch, metrics):
+    quotes = stream(monkeypatch, FakeStreamClient(PIECES, cut_off=True))
+    received = []
+    with pytest.raises(RetryableError):
+        for quote in quotes:
+            received.append(quote['author'])
+    assert received == ['Aristotle', 'Helen Keller']
@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+from metrics import Histogram, Metrics, metric_key
+
+
+def test_metric_key_sorts_labels():
+    assert metric_key('latency_s', {}) == 'latency_s'
+    assert metric_key('latency_s', {'lang': 'ko', 'category': 'love'}) == 'latency_s{category=love,lang=ko}'
+
+
+def test_histogram_percentiles_within_bucket_width():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.observe(value / 100)
+    assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.1)
+    assert histogram.percentile(1.0) <= 1.0
+    summary = histogram.summary()
+    assert summary['count'] == 100 and summary['min'] == 0.01 and summary['max'] == 1.0
+    assert Histogram().summary() == {'count': 0}
+
+
+def test_histogram_zero_values():
+    histogram = Histogram()
+    histogram.observe(0)
+    histogram.observe(2)
+    assert histogram.percentile(0.5) == 0.0
+    assert histogram.percentile(1.0) == 2
+
+
+def test_totals_across_labels_and_cost():
+    metrics = Metrics('test', model='gpt-4o-mini', stream=io.StringIO())
+    metrics.record_usage({'prompt_tokens': 1_000_000, 'completion_tokens': 500_000}, lang='ko')
+    metrics.record_usage({'prompt_tokens': 1_000_000}, lang='ja')
+    metrics.record_usage(None, lang='ja')
+    metrics.inc('retries_extra')
+    metrics.inc('retries', lang='ko')
+    assert metrics.total('tokens_in') == 2_000_000
+    assert metrics.total('retries') == 1
+    assert metrics.cost_usd() == pytest.approx(0.15 * 2 + 0.60 * 0.5)
+    assert metrics.merged('tokens_in_per_request').count == 2
+    assert Metrics('test', model='unknown').cost_usd() is None
+
+
+def test_progress_prints_on_last_job():
+    stream = io.StringIO()
+    metrics = Metrics('test', progress_interval=3600, stream=stream)
+    metrics.start(2)
+    metrics.advance()
+    assert stream.getvalue() == ''
+    metrics.advance()
+    assert stream.getvalue().startswith('[progress] 2/2 (100.0%)')
+
+
+def test_write_report(tmp_path):
+    metrics = Metrics('test', model='gpt-4o-mini', stream=io.StringIO())
+    metrics.meta['jobs'] = 3
+    metrics.observe('latency_s', 0.5, lang='ko')
+    path = metrics.write_report(str(tmp_path / 'report.json'))
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['name'] == 'test'
+    assert report['meta'] == {'jobs': 3}
+    assert report['histograms']['latency_s{lang=ko}']['count'] == 1
@@ -0,0 +1,42 @@
+from near_duplicates import NearDuplicateIndex, choose_bands, jaccard, shingles
+
+ORIGINAL = 'If you are working on something that you really care about, you do not have to be pushed.'
+VARIANT = 'If you are working on something exciting that you really care about, you do not have to be pushed.'
+OTHER = 'The best way to predict the future is to invent it.'
+
+
+def test_shingles_and_jaccard():
+    assert shingles("Don’t stop, believing!") == {"don't stop", 'stop believing'}
+    assert shingles('Hope') == {'hope'}
+    assert jaccard({'a', 'b'}, {'b', 'c'}) == 1 / 3
+    assert jaccard(set(), set()) == 1.0
+
+
+def test_choose_bands_stays_under_threshold():
+    bands, rows = choose_bands(0.7, 64)
+    assert bands * rows <= 64
+    assert (1 / bands) ** (1 / rows) <= 0.7
+
+
+def test_finds_near_duplicate_but_not_unrelated():
+    index = NearDuplicateIndex(threshold=0.7)
+    index.add(1, ORIGINAL)
+    index.add(2, OTHER)
+    assert index.find_duplicate(VARIANT) == 1
+    assert index.find_duplicate('Simplicity is the ultimate sophistication.') is None
+
+
+def test_clusters():
+    index = NearDuplicateIndex(threshold=0.7)
+    for key, text in enumerate([ORIGINAL, OTHER, VARIANT]):
+        index.add(key, text)
+    assert index.clusters() == [[0, 2]]
+
+
+def test_signature_memo_is_reused():
+    memo = {}
+    NearDuplicateIndex(signatures=memo).add(1, OTHER)
+    assert OTHER in memo
+    memo[OTHER] = list(memo[OTHER])
+    reused = NearDuplicateIndex(signatures=memo)
+    assert reused.signature(OTHER) is memo[OTHER]
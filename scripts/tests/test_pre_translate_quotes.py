@@ -0,0 +1,156 @@
+import json
+
+import pre_translate_quotes
+from corpus_io import write_items
+from pre_translate_quotes import (
+    batch_labels, batch_output_tokens, diff_corpus, make_batches, quality_gate, translate_batch,
+)
+
+
+def job(quote_id, lang='ko', text='Stay hungry, stay foolish.'):
+    return (quote_id, text, lang, pre_translate_quotes.TARGET_LANGUAGES.get(lang, lang))
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=200):
+        self.status_code = status_code
+        self.text = content
+        self._content = content
+
+    def json(self):
+        return {'choices': [{'message': {'content': self._content}}], 'usage': None}
+
+
+class FakeEngine:
+    """ApiEngine.run을 현재 스레드에서 차례로 실행"""
+
+    def run(self, jobs, worker, token_cost=None, labels=None):
+        for job in jobs:
+            yield job, worker(job)
+
+
+class FakeClient:
+    def __init__(self, content, status_code=200):
+        self.response = FakeResponse(content, status_code)
+        self.payloads = []
+
+    def post_json(self, url, api_key, payload, read_timeout=None):
+        self.payloads.append(payload)
+        return self.response
+
+
+def test_make_batches_quotes_mode_groups_by_language():
+    jobs = [job(1, 'ko'), job(2, 'ja'), job(3, 'ko'), job(4, 'ko')]
+    batches = make_batches(jobs, 'quotes', batch_size=2)
+    assert [[j[0] for j in batch] for batch in batches] == [[1, 3], [4], [2]]
+
+
+def test_make_batches_languages_mode_groups_by_quote():
+    jobs = [job(1, 'ko'), job(1, 'ja'), job(2, 'ko'), job(1, 'es')]
+    batches = make_batches(jobs, 'languages', batch_size=10)
+    assert [[(j[0], j[2]) for j in batch] for batch in batches] == [[(1, 'ko'), (1, 'ja'), (1, 'es')], [(2, 'ko')]]
+
+
+def test_make_batches_splits_on_token_budget():
+    text = 'x' * 400
+    jobs = [job(i, 'ko', text) for i in range(5)]
+    batches = make_batches(jobs, 'quotes', batch_size=100, max_tokens=batch_output_tokens(text) * 2)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_translate_batch_keeps_valid_entries(monkeypatch):
+    batch = [job(1, 'ko'), job(2, 'ko'), job(3, 'ko')]
+    content = json.dumps({'translations': [
+        {'key': '0', 'translation': ' 늘 갈망하라 '},
+        {'key': '2', 'translation': ''},
+        {'key': '9', 'translation': '범위 밖'},
+        {'key': '1'},
+    ]}, ensure_ascii=False)
+    client = FakeClient(content)
+    monkeypatch.setattr(pre_translate_quotes, 'get_client', lambda: client)
+
+    assert translate_batch(batch) == {(1, 'ko'): '늘 갈망하라'}
+    items = json.loads(client.payloads[0]['messages'][1]['content'])['items']
+    assert [item['key'] for item in items] == ['0', '1', '2']
+
+
+def test_translate_batch_bad_response(monkeypatch):
+    monkeypatch.setattr(pre_translate_quotes, 'get_client', lambda: FakeClient('not json'))
+    assert translate_batch([job(1)]) == {}
+    monkeypatch.setattr(pre_translate_quotes, 'get_client', lambda: FakeClient('{}', status_code=400))
+    assert translate_batch([job(1)]) == {}
+
+
+def test_batch_labels():
+    assert batch_labels([job(1, 'ko'), job(2, 'ko')]) == {'lang': 'ko'}
+    assert batch_labels([job(1, 'ko'), job(1, 'ja')]) == {'lang': 'mixed'}
+
+
+def test_diff_corpus_reuses_by_text(tmp_path):
+    output = tmp_path / 'quotes_translations.json'
+    write_items(str(output), [
+        ('10', {'quote': 'Be  yourself.', 'translations': {'ko': '너 자신이 되어라'}}),
+        ('11', {'quote': 'Removed quote.', 'translations': {'ko': '삭제'}}),
+    ])
+    quotes = [{'id': 99, 'quote': 'Be yourself.'}, {'id': 12, 'quote': 'New quote.'}]
+
+    reused, stats = diff_corpus(quotes, str(output))
+    # id가 바뀌어도 정규화한 원문이 같으면 번역을 재사용
+    assert reused == {99: {'ko': '너 자신이 되어라'}}
+    assert stats == {'unchanged': 1, 'added': 1, 'removed': 1}
+
+
+def test_diff_corpus_without_previous_output(tmp_path):
+    reused, stats = diff_corpus([{'id': 1, 'quote': 'Hi'}], str(tmp_path / 'missing.json'))
+    assert reused == {}
+    assert stats == {'unchanged': 0, 'added': 1, 'removed': 0}
+
+
+def test_quality_gate_retries_then_drops(monkeypatch):
+    good = '위대한 일을 하는 유일한 방법은 하는 일을 사랑하는 것이다.'
+    source = 'The only way to do great work is to love what you do.'
+    translations = {
+        1: {'quote': source, 'translations': {'ko': "I'm sorry, I can't help with that."}},
+        2: {'quote': source, 'translations': {'ko': source, 'ja': '偉大な仕事をする唯一の方法は、自分のやっていることを愛することだ。'}},
+    }
+    hints = []
+
+    def translate_quote(quote_text, lang_code, lang_name, hint=None):
+        hints.append(hint)
+        return good if len(hints) == 1 else source
+
+    monkeypatch.setattr(pre_translate_quotes, 'translate_quote', translate_quote)
+    retried, dropped = [], []
+
+    def on_retry(job, translation):
+        retried.append(job[0])
+        translations[job[0]]['translations'][job[2]] = translation
+
+    failures = quality_gate(translations, FakeEngine(), 2, 1, on_retry,
+                            lambda quote_id, text, lang: dropped.append((quote_id, lang)))
+    assert [quote_id for quote_id, _, _ in failures] == [2]
+    assert dropped == [(2, 'ko')]
+    assert translations[1]['translations'] == {'ko': good}
+    assert list(translations[2]['translations']) == ['ja']
+    assert all(hints)
+
+
+def test_quality_gate_zero_rounds_drops_without_retrying(monkeypatch):
+    good = '위대한 일을 하는 유일한 방법은 하는 일을 사랑하는 것이다.'
+    source = 'The only way to do great work is to love what you do.'
+    translations = {
+        1: {'quote': source, 'translations': {'ko': '', 'ja': '偉大な仕事をする唯一の方法は、自分のやっていることを愛することだ。'}},
+        2: {'quote': source, 'translations': {'ko': good}},
+    }
+
+    def translate_quote(*args, **kwargs):
+        raise AssertionError('rounds=0 must not re-translate')
+
+    monkeypatch.setattr(pre_translate_quotes, 'translate_quote', translate_quote)
+    dropped = []
+    # engine/on_retry 없이 검사만 하고, 실패한 번역은 출력과 저널/캐시(on_drop)에서 뺀다
+    failures = quality_gate(translations, None, 0, 1, None, lambda *args: dropped.append(args))
+    assert failures == [(1, 'ko', ['empty'])]
+    assert dropped == [(1, source, 'ko')]
+    assert list(translations[1]['translations']) == ['ja']
+    assert translations[2]['translations'] == {'ko': good}
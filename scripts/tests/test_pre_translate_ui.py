@@ -0,0 +1,67 @@
+import datetime
+
+from pre_translate_ui import (
+    is_valid_ui_translation, load_ui_tables, notification_body, notification_payloads, parse_dart_map, plan_languages,
+    source_hash,
+)
+
+DART_SOURCE = r'''
+class AppLocalizations {
+  static const Map<String, Map<String, String>> _localizedValues = {
+    'en': {
+      'app_title': 'Daily Quotes', // 제목
+      'greeting': 'Hello, {name}!\n'
+          'Welcome back',
+      "quote": "It\'s \u{1F600}",
+    },
+    'ko': {'app_title': '오늘의 명언'},
+  };
+}
+'''
+
+
+def test_parse_dart_map():
+    table = parse_dart_map(DART_SOURCE, '_localizedValues')
+    assert table['en'] == {
+        'app_title': 'Daily Quotes',
+        'greeting': 'Hello, {name}!\nWelcome back',
+        'quote': "It's \U0001F600",
+    }
+    assert table['ko'] == {'app_title': '오늘의 명언'}
+
+
+def test_load_ui_tables_from_app():
+    manual, languages = load_ui_tables()
+    assert 'en' in manual and 'ko' in languages
+    assert manual['en']['related_quotes']
+
+
+def test_is_valid_ui_translation_checks_placeholders():
+    assert is_valid_ui_translation('Hello, {name}!', '안녕하세요, {name}님!')
+    assert not is_valid_ui_translation('Hello, {name}!', '안녕하세요!')
+    assert not is_valid_ui_translation('Hello', '')
+
+
+def test_plan_languages():
+    english = {'title': 'Daily Quotes', 'share': 'Share', 'new': 'New'}
+    manual = {'ko': {'title': '오늘의 명언'}}
+    existing = {
+        'languages': {'ko': {'share': '공유', 'new': '옛 번역'}},
+        'source_hashes': {'ko': {'share': source_hash('Share'), 'new': source_hash('Old')}},
+    }
+    hashes, plans = plan_languages(english, manual, existing, ['ko', 'ja'])
+    assert hashes['share'] == source_hash('Share')
+    # 수동 번역은 건드리지 않고, 영어가 그대로면 재사용, 바뀌었으면 다시 번역
+    assert plans['ko'] == ({'share': '공유'}, ['new'], ['new'])
+    assert plans['ja'] == ({}, ['title', 'share', 'new'], [])
+
+
+def test_notification_payloads():
+    assert notification_body('x' * 120, 'Me') == '"' + 'x' * 100 + '..." - Me'
+    records = [{'id': 1, 'quote': 'One.', 'author': 'A'}, {'id': 2, 'quote': 'Two.', 'author': None}]
+    payloads = notification_payloads(
+        records, {'en': 'Quote', 'ko': '명언'}, {'ko': {1: '하나.'}}, datetime.date(2024, 1, 1), 2,
+    )
+    assert payloads['en']['2024-01-01'] == {'id': 1, 'title': 'Quote', 'body': '"One." - A'}
+    assert payloads['ko']['2024-01-01']['body'] == '"하나." - A'
+    assert payloads['ko']['2024-01-02'] == {'id': 2, 'title': '명언', 'body': '"Two." - Unknown'}
@@ -0,0 +1,38 @@
+import pytest
+
+from quote_bundle import QuoteBundle, build_bundle
+
+RECORDS = [
+    {'id': i, 'quote': f'명언 {i} - quote number {i}', 'author': f'Author {i % 3}',
+     'category': ['love', 'time'][i % 2], 'tags': ['hope'] * (i % 2),
+     'author_id': f'author-{i % 3}', 'famous': i % 2 == 0, 'length': 'short'}
+    for i in range(10)
+]
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_round_trip(tmp_path, compress):
+    path = str(tmp_path / 'quotes.bin')
+    build_bundle(RECORDS, path, compress=compress, block_size=4)
+    with QuoteBundle(path) as bundle:
+        assert len(bundle) == 10
+        assert list(bundle) == RECORDS
+        assert bundle[7] == RECORDS[7]
+        assert bundle[-1] == RECORDS[-1]
+        with pytest.raises(IndexError):
+            bundle[10]
+
+
+def test_strings_are_shared(tmp_path):
+    path = str(tmp_path / 'quotes.bin')
+    build_bundle(RECORDS, path)
+    with QuoteBundle(path) as bundle:
+        assert bundle.strings.count('Author 1') == 1
+        assert bundle.strings.count('true') == 1
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'quotes.json'
+    path.write_bytes(b'[' + b' ' * 64 + b']')
+    with pytest.raises(ValueError):
+        QuoteBundle(str(path))
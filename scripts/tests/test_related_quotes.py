@@ -0,0 +1,55 @@
+import pytest
+
+from related_quotes import TfidfModel, auto_tags, related_document, related_quotes, tokenize
+from translation_shards import corpus_hash
+
+TEXTS = [
+    'Courage is grace under pressure.',
+    'Courage is being scared to death and saddling up anyway.',
+    'Grace under pressure is the mark of courage.',
+    'The garden blooms in spring sunshine.',
+    'Spring sunshine wakes the sleeping garden.',
+    'A garden needs patience and sunshine.',
+    'Knowledge speaks but wisdom listens.',
+    'Wisdom begins in wonder and knowledge.',
+]
+
+
+def test_tokenize_drops_stopwords_and_possessives():
+    assert tokenize("Life's journey isn't what we think; we go, we find courage.") == ['life', 'journey', 'courage']
+
+
+def test_python_neighbors_group_similar_quotes():
+    model = TfidfModel(TEXTS, max_df=0.5)
+    neighbors = related_quotes(model, k=2, min_score=0.05, backend='python')
+    assert set(neighbors[0]) == {1, 2}
+    assert neighbors[3][0] == 4
+    assert set(neighbors[6]) == {7}
+    assert all(i not in row for i, row in enumerate(neighbors))
+
+
+def test_sparse_backend_matches_python():
+    pytest.importorskip('scipy')
+    model = TfidfModel(TEXTS, max_df=0.5)
+    expected = related_quotes(model, k=3, min_score=0.05, backend='python')
+    assert related_quotes(model, k=3, min_score=0.05, block_size=3, backend='sparse') == expected
+
+
+def test_auto_tags_keep_existing_and_skip_category():
+    texts = ['Courage and grace.', 'Courage under fire.', 'Courage of heart.', 'Grace in all.', 'Grace and wonder.',
+             'Wonder of heart.', 'Wonder of spring.', 'Spring again.', 'Spring at last.', 'Something else entirely.']
+    records = [{'quote': text, 'category': 'courage', 'tags': []} for text in texts]
+    records[0]['tags'] = ['bravery']
+    model = TfidfModel(texts)
+    tagged = list(auto_tags(records, model, count=2))
+    assert tagged[0]['tags'] == ['bravery', 'grace']
+    assert all('courage' not in record['tags'] for record in tagged)
+    assert records[0]['tags'] == ['bravery']
+
+
+def test_related_document_pads_rows():
+    document = related_document([7, 8, 9], [[1, 2], [], [0]], k=2, version='abc')
+    assert document == {
+        'version': 'abc', 'count': 3, 'corpus_hash': corpus_hash([7, 8, 9]), 'k': 2,
+        'neighbors': [1, 2, -1, -1, 0, -1],
+    }
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from corpus_io import write_items
+from search_index import (
+    VERSION, SearchIndex, build_index, build_indexes, decode_postings, encode_postings, tokenize,
+)
+from translation_shards import corpus_hash
+
+DOCUMENTS = [
+    'Inspiration exists, but it has to find you working. Pablo Picasso',
+    None,
+    'Stay hungry, stay foolish. Steve Jobs',
+    'Café society inspires nobody. Unknown',
+    'Inspire others by working hard. Unknown',
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = str(tmp_path / 'en.idx')
+    build_index(DOCUMENTS, path)
+    with SearchIndex(path) as index:
+        yield index
+
+
+def test_tokenize():
+    assert tokenize('Café, CAFÉ! naïve') == ['cafe', 'cafe', 'naive']
+    assert tokenize('행복한 삶') == ['행복', '복한', '삶']
+    assert tokenize('행복한', unigrams=True) == ['행복', '복한', '행', '복', '한']
+    assert tokenize('人生は美しいlife') == ['人生', '生は', 'は美', '美し', 'しい', 'life']
+
+
+def test_postings_round_trip():
+    rng = random.Random(1)
+    positions = sorted(rng.sample(range(10 ** 6), 500))
+    data = encode_postings(positions)
+    assert decode_postings(data, 0, len(positions)) == positions
+    assert encode_postings([0, 1, 200]) == bytes([0, 1, 0xC7, 0x01])
+
+
+def test_lookup_and_search(index):
+    assert index.doc_count == 5
+    assert index.lookup('stay') == [2]
+    assert index.lookup('cafe') == [3]
+    assert index.lookup('missing') == []
+    # 마지막 토큰은 접두어로
+    assert index.search('insp') == [0, 3, 4]
+    assert index.search('insp', prefix=False) == []
+    assert index.search('working insp') == [0, 4]
+    assert index.search('unknown inspire') == [3, 4]
+    assert index.search('unknown inspire', prefix=False) == [4]
+    assert index.search('') == []
+
+
+def test_complete_orders_by_document_frequency(index):
+    assert index.complete('wor') == [('working', 2)]
+    assert [term for term, _ in index.complete('insp')] == ['inspiration', 'inspire', 'inspires']
+    assert index.complete('zzz') == []
+
+
+def test_single_character_cjk_query_matches_inside_words(tmp_path):
+    path = str(tmp_path / 'ko.idx')
+    build_index(['인생은 행복', '복잡한 세상', '오늘도 행복하게'], path)
+    with SearchIndex(path) as index:
+        assert index.search('복') == [0, 1, 2]
+        assert index.search('행복', prefix=False) == [0, 2]
+        assert index.search('행복하', prefix=False) == [2]
+        assert index.search('세상 복') == [1]
+
+
+def test_build_indexes_per_language(tmp_path):
+    translations = str(tmp_path / 'quotes_translations.json')
+    write_items(translations, [('2', {'quote': 'Hi', 'translations': {'ko': '안녕하세요'}})])
+    records = [{'id': 1, 'quote': 'Hello world', 'author': 'A'}, {'id': 2, 'quote': 'Hi', 'author': 'B'}]
+    manifest = build_indexes(records, str(tmp_path / 'search'), translations)
+    assert manifest['version'] == VERSION == 2
+    assert manifest['count'] == 2
+    assert manifest['corpus_hash'] == corpus_hash([1, 2])
+    assert list(manifest['languages']) == ['en', 'ko']
+    with SearchIndex(str(tmp_path / 'search' / 'ko.idx')) as index:
+        assert index.search('안녕') == [1]
+        assert index.search('b') == [1]
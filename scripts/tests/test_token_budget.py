@@ -0,0 +1,109 @@
+import argparse
+
+import pytest
+
+from metrics import Metrics
+from token_budget import (
+    BudgetGuard, category_shares, cost_usd, count_shares, estimate_duration, format_plan, parse_weights, plan_budget,
+    plan_summary, prioritize,
+)
+
+# (이름, 언어, 입력 토큰, 출력 토큰)
+JOBS = [('a', 'ja', 100, 100), ('b', 'ko', 100, 100), ('c', 'ko', 300, 300), ('d', 'ja', 10, 10)]
+WEIGHTS = {'ko': 2, 'ja': 1}
+
+
+def estimate(job):
+    return job[2], job[3]
+
+
+def priority(job):
+    return WEIGHTS[job[1]]
+
+
+def language(job):
+    return job[1]
+
+
+def test_parse_weights():
+    assert parse_weights('ko=40, ja=25,,es') == {'ko': 40.0, 'ja': 25.0, 'es': 1.0}
+    assert parse_weights('') == {}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_weights('ko=many')
+
+
+def test_shares_and_cost():
+    assert count_shares({'love': 3, 'time': 1}) == {'love': 0.75, 'time': 0.25}
+    assert count_shares({}) == {}
+    assert category_shares([{'category': 'love'}, {'category': 'love'}]) == {'love': 1.0}
+    assert cost_usd(1_000_000, 1_000_000, 'gpt-4o-mini') == pytest.approx(0.75)
+    assert cost_usd(100, 100, 'unknown-model') is None
+
+
+def test_prioritize_is_stable():
+    assert [job[0] for job in prioritize(JOBS, priority)] == ['b', 'c', 'a', 'd']
+
+
+def test_plan_budget_defers_the_tail():
+    plan = plan_budget(JOBS, estimate, priority, max_tokens=500, group=language)
+    # c가 예산을 넘으면 뒤의 작은 작업(a, d)도 채우지 않고 미룬다
+    assert [job[0] for job in plan['selected']] == ['b']
+    assert [job[0] for job in plan['deferred']] == ['c', 'a', 'd']
+    assert (plan['tokens_in'], plan['tokens_out'], plan['deferred_tokens']) == (100, 100, 820)
+    assert plan['groups'] == {
+        'ko': {'selected': 1, 'deferred': 1, 'tokens': 200, 'deferred_tokens': 600},
+        'ja': {'selected': 0, 'deferred': 2, 'tokens': 0, 'deferred_tokens': 220},
+    }
+    assert plan['cost_usd'] is None
+
+
+def test_plan_budget_without_limits_and_with_usd():
+    plan = plan_budget(JOBS, estimate)
+    assert plan['selected'] == JOBS and plan['deferred'] == [] and list(plan['groups']) == ['all']
+
+    jobs = [('x', 'ko', 1_000_000, 0), ('y', 'ko', 1_000_000, 0)]
+    plan = plan_budget(jobs, estimate, max_usd=0.2, model='gpt-4o-mini')
+    assert [job[0] for job in plan['selected']] == ['x']
+    assert plan['cost_usd'] == pytest.approx(0.15)
+
+
+def test_estimate_duration_uses_narrowest_bound():
+    assert estimate_duration(100, 0, rps=10, concurrency=100, latency=1) == 10
+    assert estimate_duration(100, 0, rps=10, concurrency=2, latency=1) == 50
+    assert estimate_duration(100, 60_000, rps=10, tpm=1000, concurrency=100, latency=1) == 3600
+
+
+def test_format_plan_and_summary():
+    plan = plan_budget(JOBS, estimate, priority, max_tokens=500, max_usd=1.5, model='gpt-4o-mini', group=language)
+    text = format_plan(plan, requests=1, duration=120, group_name='lang')
+    assert text.splitlines() == [
+        'Plan: 1 jobs in 1 requests, ~200 tokens (100 in / 100 out), ~$0.0001, ~2.0 min (budget 500 tokens, $1.5)',
+        '  Deferred (over budget): 3 jobs, ~820 tokens',
+        '  lang ko: 1 jobs, ~200 tokens, 1 deferred',
+        '  lang ja: 0 jobs, ~0 tokens, 2 deferred',
+    ]
+    summary = plan_summary(plan, requests=1, duration=120.04)
+    assert summary['jobs'] == 1 and summary['deferred'] == 3 and summary['duration_s'] == 120.0
+
+
+def test_budget_guard_projects_in_flight_requests():
+    metrics = Metrics('test', model='gpt-4o-mini')
+    guard = BudgetGuard(metrics, max_tokens=300)
+    assert guard.reserve()
+    metrics.record_usage({'prompt_tokens': 80, 'completion_tokens': 20})
+    guard.release()
+    # 요청당 평균 100 토큰: 진행 중 2건까지는 300 안
+    assert guard.reserve() and guard.reserve()
+    assert not guard.reserve() and guard.exhausted
+    guard.release()
+    assert not guard.reserve()
+    assert guard.spent()[0] == 100
+
+
+def test_budget_guard_usd_limit():
+    metrics = Metrics('test', model='gpt-4o-mini')
+    guard = BudgetGuard(metrics, max_usd=0.2)
+    assert guard.reserve()
+    metrics.record_usage({'prompt_tokens': 1_000_000, 'completion_tokens': 0})
+    guard.release()
+    assert not guard.reserve()
@@ -0,0 +1,77 @@
+import pytest
+
+from translation_cache import TranslationCache, cache_key, normalize_text
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(str(tmp_path / 'cache.sqlite'), max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_key_ignores_whitespace_and_normalization():
+    assert normalize_text('  Be  yourself.\n') == 'Be yourself.'
+    assert cache_key('Be  yourself.', 'ko', 'm', 'v1') == cache_key('Be yourself.', 'ko', 'm', 'v1')
+    assert cache_key('Be yourself.', 'ko', 'm', 'v1') != cache_key('Be yourself.', 'ko', 'm', 'v2')
+
+
+def test_get_and_put(cache):
+    assert cache.get('Hello', 'ko') is None
+    cache.put('Hello', 'ko', '안녕')
+    cache.put('Hello', 'ko', '안녕하세요')
+    assert cache.get('Hello ', 'ko') == '안녕하세요'
+    assert len(cache) == 1
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_evicts_least_recently_used(cache, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr('translation_cache.time.time', lambda: next(clock))
+    for text in ('a', 'b', 'c'):
+        cache.put(text, 'ko', text.upper())
+    cache.get('a', 'ko')
+    cache.put('d', 'ko', 'D')
+
+    assert len(cache) == 3
+    assert cache.get('b', 'ko') is None
+    assert [cache.get(text, 'ko') for text in ('a', 'c', 'd')] == ['A', 'C', 'D']
+
+
+def test_get_without_touch_keeps_lru_order_and_stats(cache, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr('translation_cache.time.time', lambda: next(clock))
+    for text in ('a', 'b', 'c'):
+        cache.put(text, 'ko', text.upper())
+    assert cache.get('a', 'ko', touch=False) == 'A'
+    assert cache.get('x', 'ko', touch=False) is None
+    assert cache.stats()['hits'] == cache.stats()['misses'] == 0
+    cache.put('d', 'ko', 'D')
+
+    # 읽기만 한 a는 여전히 가장 오래된 항목이라 제거됨
+    assert cache.get('a', 'ko') is None
+
+
+def test_running_count_survives_discard_and_reopen(cache):
+    cache.put('a', 'ko', 'A')
+    cache.put('b', 'ko', 'B')
+    cache.discard('a', 'ko')
+    cache.discard('a', 'ko')
+    assert cache._count == len(cache) == 1
+
+    reopened = TranslationCache(cache.path, max_entries=3)
+    assert reopened._count == 1
+    reopened.close()
+
+
+def test_export_filters_model_and_prompt_version(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    old = TranslationCache(path, prompt_version='v1')
+    old.put('Hello', 'ko', '안녕')
+    new = TranslationCache(path, prompt_version='v2')
+    new.put('Hello', 'ja', 'こんにちは')
+
+    assert new.export() == {'Hello': {'ja': 'こんにちは'}}
+    assert new.export(prompt_version='v1') == {'Hello': {'ko': '안녕'}}
+    old.close()
+    new.close()
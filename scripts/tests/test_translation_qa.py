@@ -0,0 +1,65 @@
+import pytest
+
+from corpus_io import write_items
+from translation_qa import check_translation, find_failures, load_translations, summarize, translation_items
+
+SOURCE = 'The only way to do great work is to love what you do.'
+
+
+@pytest.mark.parametrize('lang, translation', [
+    ('ko', '위대한 일을 하는 유일한 방법은 하는 일을 사랑하는 것이다.'),
+    ('ja', '偉大な仕事をする唯一の方法は、自分のやっていることを愛することだ。'),
+    ('zh', '成就伟大工作的唯一方法就是热爱你所做的事。'),
+    ('es', 'La única manera de hacer un gran trabajo es amar lo que haces.'),
+    ('fr', 'La seule façon de faire du bon travail est d’aimer ce que vous faites.'),
+])
+def test_good_translations_pass(lang, translation):
+    assert check_translation(SOURCE, translation, lang) == []
+
+
+@pytest.mark.parametrize('lang, translation, reason', [
+    ('ko', '', 'empty'),
+    ('ko', "I'm sorry, I cannot translate this.", 'refusal'),
+    ('es', 'Here is the translation: La única manera es amar lo que haces.', 'refusal'),
+    ('es', '  the only way to do great work is to love what you do. ', 'identical'),
+    ('ko', 'The only way to do great work is 사랑.', 'script'),
+    # 한자만 있고 가나가 없는 일본어 번역은 중국어로 본다
+    ('ja', '成就伟大工作的唯一方法就是热爱你所做的事。', 'script'),
+    ('es', 'The only way to do great work is to love what you do, amigo.', 'language:en'),
+    ('ko', '사랑하라.', 'too_short'),
+    ('es', 'La única manera de hacer un gran trabajo es amar lo que haces, y esto significa que '
+           'siempre debes buscar aquello que te apasiona de verdad en la vida.', 'too_long'),
+    ('ko', '위대한 일을 하는 유일한 방법은 "하는 일을 사랑하는 것이다.', 'unbalanced_quotes'),
+    ('ko', '“위대한 일을 하는 유일한 방법은 하는 일을 사랑하는 것이다.”', 'wrapped_in_quotes'),
+])
+def test_failing_translations(lang, translation, reason):
+    assert reason in check_translation(SOURCE, translation, lang)
+
+
+def test_placeholders_must_match():
+    assert check_translation('Hello {name}, you have %d new quotes today.', '안녕하세요 {name}님, 오늘 새 명언이 있어요.',
+                             'ko') == ['placeholder']
+
+
+def test_short_sources_skip_length_ratio():
+    assert check_translation('Be kind.', '친절하라, 언제나 그리고 모두에게 친절하라.', 'ko') == []
+
+
+def test_find_failures_parallel_matches_sequential():
+    translations = {
+        i: {'quote': SOURCE, 'translations': {'ko': '위대한 일을 하는 유일한 방법은 하는 일을 사랑하는 것이다.' if i % 3 else SOURCE}}
+        for i in range(9)
+    }
+    items = list(translation_items(translations))
+    sequential = find_failures(items, workers=1)
+    assert [quote_id for quote_id, _, _ in sequential] == [0, 3, 6]
+    assert sorted(find_failures(items, workers=2, chunk_size=2)) == sorted(sequential)
+    assert summarize(sequential) == ({'identical': 3, 'script': 3}, {'ko': 3})
+
+
+def test_load_translations_without_store(tmp_path):
+    path = str(tmp_path / 'quotes_translations.json')
+    write_items(path, [('1', {'quote': 'Hi', 'translations': {'ko': '안녕'}})])
+    assert load_translations(path, str(tmp_path / 'missing.sqlite')) == {
+        '1': {'quote': 'Hi', 'translations': {'ko': '안녕'}},
+    }
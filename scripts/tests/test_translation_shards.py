@@ -0,0 +1,48 @@
+import hashlib
+
+import pytest
+
+from corpus_io import write_items
+from translation_shards import (
+    check_shards, corpus_hash, load_language, load_manifest, read_monolithic, shards_from_monolithic, write_shards,
+)
+
+TRANSLATIONS = {1: {'ko': '하나', 'ja': 'いち'}, 2: {'ko': '둘'}, 3: {}}
+
+
+def test_corpus_hash_matches_app_format():
+    # QuoteService.corpusHash()는 '[1, 2, 3]' 문자열의 sha256 앞 16자리
+    assert corpus_hash([1, 2, 3]) == hashlib.sha256(b'[1, 2, 3]').hexdigest()[:16]
+    assert corpus_hash([]) == '4f53cda18c2baa0c'
+    assert corpus_hash([1, 2]) != corpus_hash([2, 1])
+
+
+def test_write_and_read_shards(tmp_path):
+    directory = str(tmp_path)
+    manifest = write_shards(directory, [3, 1, 2], TRANSLATIONS, ['ko', 'ja', 'es'])
+    assert manifest['count'] == 3
+    assert {lang: entry['translated'] for lang, entry in manifest['languages'].items()} == {'ko': 2, 'ja': 1, 'es': 0}
+    assert (tmp_path / 'ko.json').read_text(encoding='utf-8') == '[null, "하나", "둘"]'
+    assert load_language(directory, 'ko') == {1: '하나', 2: '둘'}
+    assert load_language(directory, 'es') == {}
+    with pytest.raises(KeyError):
+        load_language(directory, 'fr')
+
+
+def test_check_shards_detects_reorder_and_tampering(tmp_path):
+    directory = str(tmp_path)
+    write_shards(directory, [1, 2, 3], TRANSLATIONS, ['ko'])
+    assert check_shards(directory, [1, 2, 3]) == []
+    assert len(check_shards(directory, [2, 1, 3])) == 1
+    (tmp_path / 'ko.json').write_text('[null, null, null]', encoding='utf-8')
+    assert check_shards(directory, [1, 2, 3]) == ['ko: ko.json does not match manifest checksum']
+
+
+def test_shards_from_monolithic(tmp_path):
+    path = str(tmp_path / 'quotes_translations.json')
+    write_items(path, [(str(key), {'quote': 'q', 'translations': value}) for key, value in TRANSLATIONS.items()])
+    assert read_monolithic(path) == (TRANSLATIONS, ['ko', 'ja'])
+    shards = tmp_path / 'translations'
+    manifest = shards_from_monolithic(path, [2, 1], str(shards))
+    assert list(manifest['languages']) == ['ko', 'ja']
+    assert load_manifest(str(shards))['corpus_hash'] == corpus_hash([2, 1])
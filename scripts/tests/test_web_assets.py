@@ -0,0 +1,85 @@
+import gzip
+import hashlib
+import os
+
+import pytest
+
+import web_assets
+from web_assets import compress_variants, emit_assets, hashed_name, resolve_assets, transfer_report
+
+QUOTES = b'[' + b','.join(b'{"quote": "Stay hungry, stay foolish.", "author": "Steve Jobs"}' for _ in range(50)) + b']'
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / 'assets' / 'translations').mkdir(parents=True)
+    (tmp_path / 'assets' / 'quotes.json').write_bytes(QUOTES)
+    (tmp_path / 'assets' / 'translations' / 'ko.json').write_bytes('{"1": "안녕"}'.encode('utf-8'))
+    (tmp_path / 'assets' / 'translations' / 'ja.json').write_bytes(b'{}')
+    return tmp_path
+
+
+def test_hashed_name_strips_assets_prefix():
+    digest = hashlib.sha256(b'{}').hexdigest()[:web_assets.HASH_LENGTH]
+    assert hashed_name('assets/translations/ko.json', b'{}') == f'translations/ko.{digest}.json'
+    assert hashed_name('assets/quotes.json', b'{}') != hashed_name('assets/quotes.json', b'[]')
+
+
+def test_compress_variants_only_keeps_smaller_bodies(monkeypatch):
+    monkeypatch.setattr(web_assets, 'brotli', None)
+    variants = compress_variants(QUOTES)
+    assert list(variants) == ['gzip']
+    assert gzip.decompress(variants['gzip']) == QUOTES
+    assert compress_variants(b'{}') == {}
+
+
+def test_compress_variants_brotli():
+    brotli = pytest.importorskip('brotli')
+    variants = compress_variants(QUOTES)
+    assert brotli.decompress(variants['br']) == QUOTES
+
+
+def test_resolve_assets_expands_globs(project):
+    assert resolve_assets(['assets/quotes.json', 'assets/translations/*.json', 'assets/quotes.json',
+                           'assets/missing.json'], str(project)) == [
+        'assets/quotes.json', 'assets/translations/ja.json', 'assets/translations/ko.json',
+    ]
+
+
+def test_emit_assets_writes_hashed_files_and_removes_stale(project, monkeypatch):
+    monkeypatch.setattr(web_assets, 'brotli', None)
+    build_dir = project / 'build'
+    stale = build_dir / 'data' / 'quotes.000000000000.json'
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b'old')
+
+    paths = resolve_assets(['assets/quotes.json', 'assets/translations/*.json'], str(project))
+    manifest = emit_assets(paths, str(build_dir), str(project))
+    entry = manifest['files']['assets/quotes.json']
+    assert entry['file'] == f"data/{hashed_name('assets/quotes.json', QUOTES)}"
+    assert (build_dir / entry['file']).read_bytes() == QUOTES
+    assert gzip.decompress((build_dir / (entry['file'] + '.gz')).read_bytes()) == QUOTES
+    # 작아지지 않는 압축본은 쓰지 않음
+    ja = manifest['files']['assets/translations/ja.json']
+    assert 'gzip' not in ja and not os.path.exists(build_dir / (ja['file'] + '.gz'))
+    assert not stale.exists()
+
+    totals = manifest['totals']
+    assert totals['bytes'] == sum(entry['bytes'] for entry in manifest['files'].values())
+    assert totals['gzip'] < totals['bytes'] and totals['br'] == totals['gzip']
+
+
+def test_transfer_report_counts_changed_files(project, monkeypatch):
+    monkeypatch.setattr(web_assets, 'brotli', None)
+    build_dir = str(project / 'build')
+    paths = resolve_assets(['assets/quotes.json', 'assets/translations/*.json'], str(project))
+    first = emit_assets(paths, build_dir, str(project))
+    report = transfer_report(first)
+    assert report['changed'] == 3 and report['unchanged'] == 0
+
+    (project / 'assets' / 'translations' / 'ko.json').write_bytes('{"1": "안녕하세요"}'.encode('utf-8'))
+    second = emit_assets(paths, build_dir, str(project))
+    report = transfer_report(second, first)
+    assert report['changed'] == 1 and report['unchanged'] == 2
+    assert report['redownload_bytes'] == second['files']['assets/translations/ko.json']['bytes']
+    assert [row['asset'] for row in report['files'] if not row['unchanged']] == ['assets/translations/ko.json']
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+유료 API 작업의 토큰/비용 예산 계획 + 우선순위 스케줄링 (pre_translate_quotes.py, expand_quotes_with_gpt.py)
+
+호출 전에 작업마다 (입력, 출력) 토큰을 추정하고(프롬프트 + 본문 글자 수, api_engine.estimate_tokens),
+우선순위(많이 쓰는 언어/카테고리 먼저) 순으로 정렬한 뒤 예산(토큰 수/달러) 안에 들어가는 앞부분만 실행한다.
+예산이 모자라면 우선순위가 낮은 꼬리만 빠지므로, 할당량에 걸려도 빈 곳이 아무 데나 생기지 않는다
+(빠진 작업은 다음 실행에서 체크포인트/캐시 덕분에 그 부분만 이어서 처리된다).
+
+실행 중에는 BudgetGuard(ApiEngine(budget=...))가 실제 사용량(응답 usage)을 보고 상한을 지킨다.
+추정이 빗나가서(재시도, 품질 검사 재번역 포함) 상한에 닿으면 남은 작업은 호출 없이 건너뛴다.
+
+우선순위는 가중치의 곱이다: --lang-weights ko=40,ja=25 / --category-weights love=3,...
+카테고리 가중치를 주지 않으면 corpus에서 차지하는 비율을 쓴다 (앱이 무작위로 보여주므로 많을수록 자주 보임).
+"""
+
+import argparse
+import threading
+from collections import Counter
+
+from metrics import PRICING
+
+# 소요 시간 추정에 쓰는 요청 1건 지연 (실제 값은 실행 리포트의 latency_s 참고)
+DEFAULT_LATENCY_S = 2.0
+
+
+def parse_weights(text):
+    """'ko=40,ja=25' -> {'ko': 40.0, 'ja': 25.0} (argparse type)"""
+    weights = {}
+    for part in filter(None, (part.strip() for part in text.split(','))):
+        name, sep, value = part.partition('=')
+        try:
+            weights[name.strip()] = float(value) if sep else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight {part!r} (expected name=number)")
+    return weights
+
+
+def category_shares(records):
+    """카테고리별 corpus 비율 (기본 카테고리 가중치)"""
+    return count_shares(Counter(record.get('category') for record in records))
+
+
+def count_shares(counts):
+    """{이름: 수} -> {이름: 비율} (corpus_store.categories() 결과 등)"""
+    total = sum(counts.values()) or 1
+    return {name: count / total for name, count in counts.items()}
+
+
+def cost_usd(tokens_in, tokens_out, model):
+    """토큰 수 -> 달러 (가격표에 없는 모델이면 None)"""
+    price = PRICING.get(model)
+    if price is None:
+        return None
+    return (tokens_in * price[0] + tokens_out * price[1]) / 1_000_000
+
+
+def prioritize(jobs, priority):
+    """priority(job)가 큰 것부터 정렬 (같으면 원래 순서)"""
+    order = sorted(range(len(jobs)), key=lambda i: (-priority(jobs[i]), i))
+    return [jobs[i] for i in order]
+
+
+def plan_budget(jobs, estimate, priority=None, max_tokens=None, max_usd=None, model=None, group=None):
+    """
+    우선순위 순으로 예산 안에 들어가는 앞부분(selected)과 나머지(deferred)로 나눈다
+    estimate(job) -> (입력 토큰, 출력 토큰), group(job) -> 리포트 라벨 (예: 언어 코드)
+    예산을 처음 넘는 작업에서 멈춘다 (뒤의 작은 작업으로 빈자리를 채우지 않음 - 빠지는 건 항상 꼬리)
+    """
+    if priority is not None:
+        jobs = prioritize(jobs, priority)
+    plan = {
+        'selected': [], 'deferred': [], 'tokens_in': 0, 'tokens_out': 0,
+        'deferred_tokens': 0, 'max_tokens': max_tokens, 'max_usd': max_usd, 'model': model, 'groups': {},
+    }
+    for job in jobs:
+        tokens_in, tokens_out = estimate(job)
+        tokens_in_total = plan['tokens_in'] + tokens_in
+        tokens_out_total = plan['tokens_out'] + tokens_out
+        over = (
+            plan['deferred']
+            or (max_tokens is not None and tokens_in_total + tokens_out_total > max_tokens)
+            or (max_usd is not None and (cost_usd(tokens_in_total, tokens_out_total, model) or 0) > max_usd)
+        )
+        stats = plan['groups'].setdefault(group(job) if group else 'all', {
+            'selected': 0, 'deferred': 0, 'tokens': 0, 'deferred_tokens': 0,
+        })
+        if over:
+            plan['deferred'].append(job)
+            plan['deferred_tokens'] += tokens_in + tokens_out
+            stats['deferred'] += 1
+            stats['deferred_tokens'] += tokens_in + tokens_out
+        else:
+            plan['selected'].append(job)
+            plan['tokens_in'], plan['tokens_out'] = tokens_in_total, tokens_out_total
+            stats['selected'] += 1
+            stats['tokens'] += tokens_in + tokens_out
+    plan['cost_usd'] = cost_usd(plan['tokens_in'], plan['tokens_out'], model)
+    return plan
+
+
+def estimate_duration(requests, tokens, rps, tpm=None, concurrency=1, latency=DEFAULT_LATENCY_S):
+    """초당 요청 수, 분당 토큰 수, 동시 요청 수 중 가장 좁은 병목으로 본 소요 시간 (초)"""
+    bounds = [requests / rps if rps else 0.0, requests * latency / max(1, concurrency)]
+    if tpm:
+        bounds.append(tokens / tpm * 60)
+    return max(bounds)
+
+
+def plan_summary(plan, requests, duration):
+    """실행 리포트(meta)용 요약 (작업 목록 제외)"""
+    return {
+        'jobs': len(plan['selected']),
+        'deferred': len(plan['deferred']),
+        'requests': requests,
+        'tokens_in': plan['tokens_in'],
+        'tokens_out': plan['tokens_out'],
+        'cost_usd': plan['cost_usd'],
+        'duration_s': round(duration, 1),
+        'max_tokens': plan['max_tokens'],
+        'max_usd': plan['max_usd'],
+    }
+
+
+def format_plan(plan, requests, duration, group_name='group'):
+    """dry-run/실행 전 출력용 계획 리포트"""
+    tokens = plan['tokens_in'] + plan['tokens_out']
+    cost = f"${plan['cost_usd']:.4f}" if plan['cost_usd'] is not None else 'n/a'
+    limits = []
+    if plan['max_tokens'] is not None:
+        limits.append(f"{plan['max_tokens']} tokens")
+    if plan['max_usd'] is not None:
+        limits.append(f"${plan['max_usd']:g}")
+    lines = [
+        f"Plan: {len(plan['selected'])} jobs in {requests} requests, ~{tokens} tokens "
+        f"({plan['tokens_in']} in / {plan['tokens_out']} out), ~{cost}, ~{duration / 60:.1f} min"
+        + (f" (budget {', '.join(limits)})" if limits else ''),
+    ]
+    if plan['deferred']:
+        lines.append(f"  Deferred (over budget): {len(plan['deferred'])} jobs, ~{plan['deferred_tokens']} tokens")
+    for name, stats in plan['groups'].items():
+        deferred = f", {stats['deferred']} deferred" if stats['deferred'] else ''
+        lines.append(f"  {group_name} {name}: {stats['selected']} jobs, ~{stats['tokens']} tokens{deferred}")
+    return '\n'.join(lines)
+
+
+def add_budget_args(parser):
+    """예산/우선순위/dry-run 공통 CLI 옵션"""
+    parser.add_argument('--budget-tokens', type=int, default=None, help='이번 실행의 최대 토큰 수 (입력 + 출력)')
+    parser.add_argument('--budget-usd', type=float, default=None, help='이번 실행의 최대 비용 (달러)')
+    parser.add_argument('--category-weights', type=parse_weights, default=None,
+                        help='카테고리 우선순위 가중치 (예: love=3,success=2, 기본: corpus 비율)')
+    parser.add_argument('--dry-run', action='store_true', help='API 호출 없이 토큰/비용/시간 추정과 실행 계획만 출력')
+
+
+class BudgetGuard:
+    """
+    실행 중 예산 상한 (ApiEngine(budget=...)이 요청마다 reserve/release)
+    실제 사용량(metrics의 tokens_in/tokens_out) + 진행 중인 요청이 지금까지의 요청당 평균만큼 쓴다고 보고
+    상한을 넘으면 거절한다. 한 번 거절하면 이후 작업도 모두 건너뛴다 (우선순위가 낮은 꼬리만 빠짐)
+    평균이 생기기 전 첫 요청들은 호출 전 계획(plan_budget)이 막으므로, 초과분은 많아야 동시 요청 수만큼이다
+    """
+
+    def __init__(self, metrics, max_tokens=None, max_usd=None):
+        self.metrics = metrics
+        self.max_tokens = max_tokens
+        self.max_usd = max_usd
+        self.exhausted = False
+        self._in_flight = 0
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    def spent(self):
+        """(실제 사용 토큰, 실제 비용 달러 또는 None)"""
+        return self.metrics.total('tokens_in') + self.metrics.total('tokens_out'), self.metrics.cost_usd()
+
+    def reserve(self):
+        """요청 1건을 보내도 되면 True"""
+        with self._lock:
+            if self.exhausted:
+                return False
+            spent_tokens, spent_usd = self.spent()
+            average = spent_tokens / self._completed if self._completed else 0
+            projected = spent_tokens + (self._in_flight + 1) * average
+            over = self.max_tokens is not None and projected > self.max_tokens
+            if self.max_usd is not None and spent_usd is not None and spent_tokens:
+                over = over or spent_usd / spent_tokens * projected > self.max_usd
+            if over:
+                self.exhausted = True
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self):
+        """요청이 끝나면 호출 (실제 사용량은 metrics에 이미 반영됨)"""
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
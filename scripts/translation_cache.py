@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+내용 기반(content-addressed) 번역 캐시
+정규화된 원문 + 대상 언어 + 모델 + 프롬프트 버전의 해시를 키로 SQLite에 저장
+id가 바뀌어도, 같은 문장이 여러 번 나와도 API를 다시 호출하지 않는다
+
+사용 예:
+  python scripts/translation_cache.py --stats
+  python scripts/translation_cache.py --export assets/translation_seed.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_FILE = os.path.join(SCRIPT_DIR, '.cache', 'translation_cache.sqlite')
+DEFAULT_MAX_ENTRIES = 200000
+
+
+def normalize_text(text):
+    """캐시 키용 정규화 (유니코드 NFC + 공백 정리)"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+def text_hash(text):
+    """정규화된 원문의 해시 (언어/모델과 무관한 corpus 비교용)"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def cache_key(text, lang, model, prompt_version):
+    raw = '\0'.join([normalize_text(text), lang, model, prompt_version])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """
+    크기 제한이 있는 영구 번역 캐시
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, model='gpt-4o-mini', prompt_version='v1',
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.model = model
+        self.prompt_version = prompt_version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' key TEXT PRIMARY KEY,'
+            ' text TEXT NOT NULL,'
+            ' lang TEXT NOT NULL,'
+            ' model TEXT NOT NULL,'
+            ' prompt_version TEXT NOT NULL,'
+            ' translation TEXT NOT NULL,'
+            ' last_used REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_last_used ON translations(last_used)')
+        self._conn.commit()
+        # 항목 수는 한 번만 세고 put/discard/_evict에서 갱신 (put마다 COUNT(*)로 전체를 훑지 않음)
+        # 다른 프로세스가 같은 파일에 쓰면 조금 어긋날 수 있지만 상한은 느슨한 기준이라 괜찮다
+        self._count = self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def key(self, text, lang):
+        return cache_key(text, lang, self.model, self.prompt_version)
+
+    def get(self, text, lang, touch=True):
+        """
+        캐시된 번역 반환 (없으면 None), 히트/미스 통계 갱신
+        touch=False면 읽기만 한다 (통계와 LRU 순서를 건드리지 않음 - dry-run용)
+        """
+        key = self.key(text, lang)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT translation FROM translations WHERE key = ?', (key,)
+            ).fetchone()
+            if not touch:
+                return row[0] if row else None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute('UPDATE translations SET last_used = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+            return row[0]
+
+    def put(self, text, lang, translation):
+        key = self.key(text, lang)
+        with self._lock:
+            updated = self._conn.execute(
+                'UPDATE translations SET translation = ?, last_used = ? WHERE key = ?',
+                (translation, time.time(), key),
+            ).rowcount
+            if not updated:
+                self._conn.execute(
+                    'INSERT INTO translations VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, normalize_text(text), lang, self.model, self.prompt_version, translation, time.time()),
+                )
+                self._count += 1
+                self._evict()
+            self._conn.commit()
+
+    def discard(self, text, lang):
+        """잘못된 번역 삭제 (품질 검사 탈락, 다음에는 다시 번역)"""
+        with self._lock:
+            self._count -= self._conn.execute(
+                'DELETE FROM translations WHERE key = ?', (self.key(text, lang),)
+            ).rowcount
+            self._conn.commit()
+
+    def _evict(self):
+        overflow = self._count - self.max_entries
+        if overflow > 0:
+            self._count -= self._conn.execute(
+                'DELETE FROM translations WHERE key IN '
+                '(SELECT key FROM translations ORDER BY last_used LIMIT ?)',
+                (overflow,),
+            ).rowcount
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def export(self, model=None, prompt_version=None):
+        """
+        앱 TranslationService의 오프라인 번역 맵과 같은 형태로 내보내기
+        {원문: {lang: 번역}} (popularQuoteTranslations 형식)
+        """
+        query = 'SELECT text, lang, translation FROM translations WHERE model = ? AND prompt_version = ? ORDER BY text, lang'
+        seed = {}
+        with self._lock:
+            rows = self._conn.execute(
+                query, (model or self.model, prompt_version or self.prompt_version)
+            ).fetchall()
+        for text, lang, translation in rows:
+            seed.setdefault(text, {})[lang] = translation
+        return seed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or export the shared translation cache')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILE, help='캐시 파일 경로')
+    parser.add_argument('--model', default='gpt-4o-mini')
+    parser.add_argument('--prompt-version', default='v1')
+    parser.add_argument('--stats', action='store_true', help='캐시 항목 수 출력')
+    parser.add_argument('--export', metavar='PATH', help='{원문: {lang: 번역}} JSON으로 내보내기')
+    args = parser.parse_args()
+
+    cache = TranslationCache(args.cache, model=args.model, prompt_version=args.prompt_version)
+    if args.stats:
+        print(f"Cache entries: {len(cache)}")
+    if args.export:
+        seed = cache.export()
+        with open(args.export, 'w', encoding='utf-8') as f:
+            json.dump(seed, f, ensure_ascii=False, indent=2)
+        print(f"Exported {len(seed)} texts to {args.export}")
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
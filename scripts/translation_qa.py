@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+번역 품질 검사 (translate 후처리 단계)
+
+'error'/'sorry'/'cannot' 단어 검사 대신, (원문, 번역, 언어)마다 아래 규칙을 프로세스 풀에서 병렬로 돌린다.
+
+  script        대상 언어의 문자 체계 비율 (ko: 한글, ja: 가나/한자 + 가나 필수, zh: 한자, 라틴어권: 라틴)
+  language      라틴어권 번역이 영어나 다른 언어 기능어로 채워져 있으면 실패 (번역 안 됨/엉뚱한 언어)
+  length        원문 대비 길이 비율이 언어별 범위를 벗어나면 실패 (잘린 번역, 설명이 붙은 번역)
+  placeholder   {name} / %s 같은 자리표시자가 원문과 다르면 실패
+  quotes        원문에 없는 따옴표로 감싸거나 따옴표/괄호 짝이 안 맞으면 실패
+  identical     정규화한 번역이 원문과 같으면 실패
+  refusal       "I'm sorry", "Here is the translation:" 같은 모델 응답
+
+실패한 (명언, 언어)는 pre_translate_quotes.py가 재시도 큐로 다시 번역한다.
+
+사용 예:
+  python scripts/translation_qa.py                          # quotes_translations.json 검사 리포트
+  python scripts/translation_qa.py --failures qa.jsonl --workers 8
+"""
+
+import argparse
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from corpus_io import iter_items, write_records
+from corpus_store import DEFAULT_STORE_FILE, fresh_store
+from translation_cache import normalize_text
+
+CHUNK_SIZE = 500
+
+# 언어 -> (허용 문자 체계, 글자 중 최소 비율)
+SCRIPTS = {
+    'ko': ({'hangul'}, 0.5),
+    'ja': ({'kana', 'han'}, 0.5),
+    'zh': ({'han'}, 0.6),
+}
+LATIN_SCRIPT = ({'latin'}, 0.8)
+
+# 원문(영어) 대비 번역 길이 비율 범위
+LENGTH_RATIOS = {
+    'ko': (0.2, 1.5),
+    'ja': (0.15, 1.5),
+    'zh': (0.1, 1.2),
+}
+DEFAULT_LENGTH_RATIO = (0.5, 2.2)
+# 이보다 짧은 원문은 길이 비율을 보지 않음 (짧은 문장은 비율이 들쭉날쭉)
+MIN_RATIO_LENGTH = 20
+
+# 라틴어권 언어 판별용 기능어
+STOPWORDS = {
+    'en': {'the', 'and', 'of', 'to', 'is', 'in', 'that', 'you', 'it', 'for', 'are', 'be', 'your',
+           'with', 'not', 'what', 'who', 'will', 'can', 'if', 'we', 'our', 'have', 'was', 'but'},
+    'es': {'el', 'la', 'de', 'que', 'y', 'en', 'los', 'las', 'es', 'un', 'una', 'no', 'por', 'con',
+           'para', 'lo', 'se', 'del', 'su', 'al', 'más', 'pero', 'como', 'tu'},
+    'fr': {'le', 'la', 'de', 'et', 'les', 'des', 'est', 'un', 'une', 'que', 'qui', 'dans', 'pour',
+           'pas', 'ne', 'vous', 'en', 'du', 'il', 'ce', 'sur', 'au', 'mais', 'ton'},
+    'pt': {'o', 'a', 'de', 'que', 'e', 'do', 'da', 'em', 'um', 'uma', 'não', 'os', 'as', 'é',
+           'para', 'com', 'se', 'no', 'na', 'por', 'mais', 'mas', 'como', 'você'},
+}
+
+_PLACEHOLDER = re.compile(r'\{\w+\}|%[sd]')
+_WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+_REFUSAL = re.compile(
+    r"^\s*(i'?m sorry|sorry,|i cannot|i can'?t|i am unable|as an ai|here is|here's|translation\s*:)",
+    re.I,
+)
+_OPEN_CLOSE = [('“', '”'), ('「', '」'), ('『', '』'), ('«', '»'), ('(', ')')]
+_QUOTE_START = '"“„「『«\''
+_QUOTE_END = '"”」』»\''
+
+
+def char_script(char):
+    code = ord(char)
+    if 0xAC00 <= code <= 0xD7AF or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+        return 'hangul'
+    if 0x3040 <= code <= 0x30FF or 0x31F0 <= code <= 0x31FF or 0xFF66 <= code <= 0xFF9F:
+        return 'kana'
+    if (0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF
+            or 0xF900 <= code <= 0xFAFF or 0x20000 <= code <= 0x2A6DF):
+        return 'han'
+    if char.isalpha():
+        if code < 0x250 or 0x1E00 <= code <= 0x1EFF:
+            return 'latin'
+        return 'other'
+    return None
+
+
+def script_counts(text):
+    return Counter(script for script in map(char_script, text) if script)
+
+
+def looks_like_refusal(translation):
+    """모델이 번역 대신 사과/설명으로 답한 경우"""
+    return bool(_REFUSAL.match(translation))
+
+
+def _latin_language(text):
+    """기능어 수로 가장 그럴듯한 라틴어권 언어와 언어별 점수"""
+    words = [word.lower() for word in _WORD.findall(text)]
+    scores = {lang: sum(word in stopwords for word in words) for lang, stopwords in STOPWORDS.items()}
+    return max(scores, key=scores.get), scores
+
+
+def _wrapped(text):
+    return len(text) >= 2 and text[0] in _QUOTE_START and text[-1] in _QUOTE_END
+
+
+def check_translation(source, translation, lang):
+    """실패 사유 목록 (비어 있으면 통과)"""
+    reasons = []
+    text = translation.strip()
+    if not text:
+        return ['empty']
+
+    if looks_like_refusal(text):
+        reasons.append('refusal')
+
+    if normalize_text(text).casefold() == normalize_text(source).casefold():
+        reasons.append('identical')
+
+    allowed, minimum = SCRIPTS.get(lang, LATIN_SCRIPT)
+    counts = script_counts(text)
+    letters = sum(counts.values())
+    if letters:
+        if sum(counts[script] for script in allowed) / letters < minimum:
+            reasons.append('script')
+        elif lang == 'ja' and letters >= 8 and not counts['kana']:
+            reasons.append('script')
+
+    if lang in STOPWORDS and lang != 'en':
+        best, scores = _latin_language(text)
+        if best != lang and scores[best] >= scores[lang] + 2:
+            reasons.append(f'language:{best}')
+
+    if len(source) >= MIN_RATIO_LENGTH:
+        low, high = LENGTH_RATIOS.get(lang, DEFAULT_LENGTH_RATIO)
+        ratio = len(text) / len(source)
+        if ratio < low:
+            reasons.append('too_short')
+        elif ratio > high:
+            reasons.append('too_long')
+
+    if sorted(_PLACEHOLDER.findall(source)) != sorted(_PLACEHOLDER.findall(text)):
+        reasons.append('placeholder')
+
+    if _wrapped(text) and not _wrapped(source.strip()):
+        reasons.append('wrapped_in_quotes')
+    elif (any(text.count(open_) != text.count(close) for open_, close in _OPEN_CLOSE)
+          or text.count('"') % 2):
+        reasons.append('unbalanced_quotes')
+
+    return reasons
+
+
+def check_chunk(items):
+    """[(quote_id, lang, 원문, 번역)] -> 실패 항목 [(quote_id, lang, 사유 목록)] (프로세스 풀 작업 단위)"""
+    failures = []
+    for quote_id, lang, source, translation in items:
+        reasons = check_translation(source, translation, lang)
+        if reasons:
+            failures.append((quote_id, lang, reasons))
+    return failures
+
+
+def find_failures(items, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    (quote_id, lang, 원문, 번역) iterable 전체를 검사해서 실패 항목 목록 반환
+    workers=1이거나 항목이 적으면 현재 프로세스에서 실행
+    """
+    items = list(items)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return [failure for chunk in chunks for failure in check_chunk(chunk)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [failure for result in pool.map(check_chunk, chunks) for failure in result]
+
+
+def translation_items(translations):
+    """{quote_id: {'quote', 'translations': {lang: 번역}}} -> 검사 항목"""
+    for quote_id, entry in translations.items():
+        for lang, translation in entry['translations'].items():
+            yield quote_id, lang, entry['quote'], translation
+
+
+def load_translations(path, store_path=DEFAULT_STORE_FILE):
+    """
+    {quote_id: {'quote', 'translations'}} - 저장소가 번역 파일보다 최신이면 저장소에서
+    (pre_translate_quotes.py 컴팩션이 둘 다 갱신함)
+    """
+    store = fresh_store(store_path, path)
+    if store is None:
+        return {quote_id: entry for quote_id, entry in iter_items(path)}
+    with store:
+        return {
+            quote_id: {'quote': quote, 'translations': translations}
+            for quote_id, quote, translations in store.iter_translated()
+        }
+
+
+def summarize(failures):
+    """사유별/언어별 실패 수"""
+    by_reason = Counter(reason.split(':')[0] for _, _, reasons in failures for reason in reasons)
+    by_lang = Counter(lang for _, lang, _ in failures)
+    return dict(by_reason.most_common()), dict(by_lang.most_common())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Quality-check pre-translated quotes')
+    parser.add_argument('--input', default='assets/quotes_translations.json')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='검사 프로세스 수')
+    parser.add_argument('--failures', default=None, help='실패 항목을 기록할 JSONL 경로')
+    parser.add_argument('--store', default=DEFAULT_STORE_FILE, help='corpus 저장소 (빈 문자열이면 번역 파일을 읽음)')
+    args = parser.parse_args()
+
+    translations = load_translations(args.input, args.store)
+    items = list(translation_items(translations))
+    failures = find_failures(items, args.workers)
+    by_reason, by_lang = summarize(failures)
+
+    print(f"Checked {len(items)} translations: {len(failures)} failed")
+    print(f"  By reason: {by_reason}")
+    print(f"  By language: {by_lang}")
+    if args.failures:
+        write_records(args.failures, (
+            {'id': quote_id, 'lang': lang, 'reasons': reasons,
+             'quote': translations[quote_id]['quote'], 'translation': translations[quote_id]['translations'][lang]}
+            for quote_id, lang, reasons in failures
+        ))
+        print(f"  Wrote {args.failures}")
+
+
+if __name__ == '__main__':
+    main()
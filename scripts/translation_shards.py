@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+언어별 번역 샤드 (assets/translations/)
+
+quotes_translations.json은 명언 id마다 6개 언어를 모두 담고 있어서, 한 언어만 쓰는 앱도
+전체를 받아서 파싱해야 한다. 샤드는 언어 하나만 담은 compact JSON 배열이고
+i번째 원소가 corpus(quotes.json) i번째 명언의 번역이다 (번역이 없으면 null).
+
+  ids.json        corpus 순서의 id 배열 (모든 샤드가 이 순서에 맞춰 정렬됨)
+  <lang>.json     ["번역", null, ...]  길이 = count
+  manifest.json
+    version       샤드 형식 버전
+    count         명언 수
+    corpus_hash   id 순서 해시 - quotes.json과 정렬이 맞는지 확인용
+    languages     lang -> {file, translated, bytes, sha256}
+
+사용 예:
+  python scripts/translation_shards.py                 # quotes_translations.json -> 샤드
+  python scripts/translation_shards.py --check         # 샤드가 현재 quotes.json과 맞는지 확인
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+from corpus_io import iter_items, iter_records, write_items, write_records
+
+SHARD_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+IDS_NAME = 'ids.json'
+
+
+def corpus_hash(ids):
+    """id 순서 해시 (corpus가 재정렬/변경되면 달라짐)"""
+    return hashlib.sha256(json.dumps(list(ids)).encode('utf-8')).hexdigest()[:16]
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_shards(directory, ids, translations, languages):
+    """
+    {quote_id: {lang: 번역}}을 corpus id 순서(ids)에 맞춘 언어별 샤드로 저장하고 manifest 반환
+    languages 순서대로 샤드를 만든다 (번역이 하나도 없는 언어도 null 배열로 만듦)
+    """
+    ids = list(ids)
+    os.makedirs(directory, exist_ok=True)
+    write_records(os.path.join(directory, IDS_NAME), ids, indent=None)
+
+    entries = {}
+    for lang in languages:
+        filename = f'{lang}.json'
+        path = os.path.join(directory, filename)
+        column = [translations.get(quote_id, {}).get(lang) for quote_id in ids]
+        write_records(path, column, indent=None)
+        entries[lang] = {
+            'file': filename,
+            'translated': sum(1 for text in column if text),
+            'bytes': os.path.getsize(path),
+            'sha256': _file_sha256(path),
+        }
+
+    manifest = {
+        'version': SHARD_VERSION,
+        'count': len(ids),
+        'corpus_hash': corpus_hash(ids),
+        'languages': entries,
+    }
+    write_items(os.path.join(directory, MANIFEST_NAME), manifest.items())
+    return manifest
+
+
+def load_manifest(directory):
+    with open(os.path.join(directory, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != SHARD_VERSION:
+        raise ValueError(f"Unsupported shard version {manifest.get('version')} in {directory}")
+    return manifest
+
+
+def iter_language(directory, lang):
+    """한 언어의 (quote_id, 번역)을 corpus 순서로 하나씩 yield (번역 없는 명언은 건너뜀)"""
+    manifest = load_manifest(directory)
+    entry = manifest['languages'].get(lang)
+    if entry is None:
+        raise KeyError(f"No shard for language {lang!r} in {directory}")
+    ids = iter_records(os.path.join(directory, IDS_NAME))
+    for quote_id, text in zip(ids, iter_records(os.path.join(directory, entry['file']))):
+        if text:
+            yield quote_id, text
+
+
+def load_language(directory, lang):
+    return dict(iter_language(directory, lang))
+
+
+def read_monolithic(path):
+    """quotes_translations.json -> ({quote_id: {lang: 번역}}, 나온 순서대로의 언어 목록)"""
+    translations = {}
+    languages = {}
+    for key, entry in iter_items(path):
+        per_lang = entry.get('translations', {})
+        translations[int(key)] = per_lang
+        for lang in per_lang:
+            languages.setdefault(lang, None)
+    return translations, list(languages)
+
+
+def shards_from_monolithic(path, ids, directory, languages=None):
+    """기존 quotes_translations.json을 corpus 순서(ids)에 맞춘 샤드로 다시 만듦"""
+    translations, found = read_monolithic(path)
+    return write_shards(directory, ids, translations, languages or found)
+
+
+def check_shards(directory, ids):
+    """샤드 정렬/무결성 문제 목록 (비어 있으면 정상)"""
+    manifest = load_manifest(directory)
+    problems = []
+    if manifest['corpus_hash'] != corpus_hash(ids):
+        problems.append('corpus id order changed since shards were written (re-run to re-align)')
+    for lang, entry in manifest['languages'].items():
+        path = os.path.join(directory, entry['file'])
+        if not os.path.exists(path):
+            problems.append(f"{lang}: missing {entry['file']}")
+        elif _file_sha256(path) != entry['sha256']:
+            problems.append(f"{lang}: {entry['file']} does not match manifest checksum")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split quotes_translations.json into per-language shards')
+    parser.add_argument('--input', default='assets/quotes_translations.json')
+    parser.add_argument('--quotes', default='assets/quotes.json', help='샤드 정렬 기준 corpus')
+    parser.add_argument('--output-dir', default='assets/translations')
+    parser.add_argument('--check', action='store_true', help='샤드가 현재 corpus와 맞는지만 확인')
+    args = parser.parse_args()
+
+    ids = [record['id'] for record in iter_records(args.quotes)]
+
+    if args.check:
+        problems = check_shards(args.output_dir, ids)
+        for problem in problems:
+            print(f"[STALE] {problem}")
+        if not problems:
+            print(f"OK: {args.output_dir} matches {args.quotes}")
+        raise SystemExit(1 if problems else 0)
+
+    manifest = shards_from_monolithic(args.input, ids, args.output_dir)
+    print(f"Wrote {len(manifest['languages'])} shards to {args.output_dir} ({manifest['count']} quotes)")
+    for lang, entry in manifest['languages'].items():
+        print(f"  {lang}: {entry['translated']} translated, {entry['bytes']} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+웹 빌드용 사전 압축 + 콘텐츠 해시 데이터 에셋 (flutter build web 다음에 실행)
+
+웹 앱은 assets/quotes.json과 번역 파일을 압축/지문 없이 받아서, 배포할 때마다 브라우저가
+다시 받고 오래 캐시할 수도 없다. 여기서는 데이터 에셋마다
+
+  build/web/data/<이름>.<sha256 앞 12자리>.<확장자>      원본 (내용이 같으면 파일명도 같음)
+              ... .gz / .br                          gzip -9 / brotli -11 사전 압축본 (작아질 때만)
+  build/web/asset_manifest.json                      에셋 경로 -> 해시 파일명 + 크기
+  build/web/_headers                                 data/는 immutable 1년, 매니페스트는 no-cache
+
+를 만든다. 앱(AssetLoader)은 웹에서 매니페스트로 해시 파일을 찾아 받고, 매니페스트가 없으면
+번들 에셋을 그대로 쓴다. 사전 압축본은 서버가 Accept-Encoding을 보고 .br/.gz 파일을
+Content-Encoding과 함께 골라 보내야 쓰인다 (nginx gzip_static/brotli_static, 또는 같은 일을 하는
+서버/엣지 규칙). Netlify/Cloudflare Pages의 _headers는 Cache-Control만 정할 뿐 .br/.gz 파일을
+고르지 않는다 (그 경우 원본이 가고 압축은 CDN이 알아서 한다).
+brotli 모듈이 없으면 .br은 건너뛴다 (pip install brotli).
+
+사용 예:
+  flutter build web && python scripts/web_assets.py
+  python scripts/web_assets.py --build-dir build/web --report web_assets.json
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+
+from corpus_io import write_items
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 사항 (없으면 gzip만)
+    brotli = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+MANIFEST_NAME = 'asset_manifest.json'
+DATA_DIR = 'data'
+HASH_LENGTH = 12
+MANIFEST_VERSION = 1
+
+# pubspec.yaml에 등록된 데이터 에셋 (앱이 AssetLoader로 읽는 것)
+DEFAULT_ASSETS = [
+    'assets/quotes.json',
+    'assets/quote_id_map.json',
+    'assets/quote_related.json',
+    'assets/quote_indexes.json',
+    'assets/ui_translations.json',
+    'assets/notification_payloads.json',
+    'assets/translations/*.json',
+]
+
+HEADERS = """\
+/data/*
+  Cache-Control: public, max-age=31536000, immutable
+/asset_manifest.json
+  Cache-Control: no-cache
+"""
+
+
+def hashed_name(path, data):
+    """assets/translations/ko.json -> translations/ko.<hash>.json (assets/ 접두어 제거)"""
+    relative = os.path.relpath(path, 'assets')
+    stem, ext = os.path.splitext(relative)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f'{stem}.{digest}{ext}'.replace(os.sep, '/')
+
+
+def _write_if_changed(path, data):
+    """내용이 같은 파일이 이미 있으면 건너뜀 (해시 파일명이라 이름이 같으면 내용도 같음)"""
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
+
+
+def compress_variants(data):
+    """{'gzip': bytes, 'br': bytes} - 원본보다 작아지는 것만"""
+    variants = {'gzip': gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(data, quality=11)
+    return {name: body for name, body in variants.items() if len(body) < len(data)}
+
+
+def emit_assets(asset_paths, build_dir, project_root=PROJECT_ROOT):
+    """
+    에셋을 해시 파일명 + 압축본으로 build_dir/data/에 쓰고 매니페스트 반환
+    매니페스트에 없는 예전 해시 파일은 지운다
+    """
+    data_dir = os.path.join(build_dir, DATA_DIR)
+    files = {}
+    for path in asset_paths:
+        with open(os.path.join(project_root, path), 'rb') as f:
+            data = f.read()
+        name = f'{DATA_DIR}/{hashed_name(path, data)}'
+        target = os.path.join(build_dir, name)
+        _write_if_changed(target, data)
+        entry = {'file': name, 'sha256': hashlib.sha256(data).hexdigest(), 'bytes': len(data)}
+        for encoding, body in compress_variants(data).items():
+            _write_if_changed(f'{target}.{"gz" if encoding == "gzip" else encoding}', body)
+            entry[encoding] = len(body)
+        files[path] = entry
+
+    keep = set()
+    for entry in files.values():
+        base = os.path.join(build_dir, entry['file'])
+        keep.update({base, base + '.gz', base + '.br'})
+    for path in glob.glob(os.path.join(data_dir, '**', '*'), recursive=True):
+        if os.path.isfile(path) and path not in keep:
+            os.remove(path)
+
+    return {
+        'version': MANIFEST_VERSION,
+        'files': files,
+        'totals': {
+            'bytes': sum(entry['bytes'] for entry in files.values()),
+            'gzip': sum(entry.get('gzip', entry['bytes']) for entry in files.values()),
+            'br': sum(entry.get('br', entry.get('gzip', entry['bytes'])) for entry in files.values()),
+        },
+    }
+
+
+def resolve_assets(patterns, project_root=PROJECT_ROOT):
+    """에셋 경로/글롭 -> 존재하는 파일 경로 (project_root 기준, 정렬)"""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(os.path.join(project_root, pattern)))
+        paths.extend(os.path.relpath(match, project_root).replace(os.sep, '/') for match in matches)
+    return list(dict.fromkeys(paths))
+
+
+def load_manifest(build_dir):
+    path = os.path.join(build_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def transfer_report(manifest, previous=None):
+    """
+    파일별 전송 크기와 이전 배포 대비 바뀐 파일
+    unchanged는 해시 파일명이 그대로라 브라우저/CDN 캐시에서 바로 나오는 파일
+    """
+    previous_files = (previous or {}).get('files', {})
+    rows = []
+    changed_bytes = 0
+    for path, entry in manifest['files'].items():
+        unchanged = previous_files.get(path, {}).get('file') == entry['file']
+        best = entry.get('br', entry.get('gzip', entry['bytes']))
+        if not unchanged:
+            changed_bytes += best
+        rows.append({
+            'asset': path, 'file': entry['file'], 'bytes': entry['bytes'],
+            'gzip': entry.get('gzip'), 'br': entry.get('br'), 'unchanged': unchanged,
+        })
+    return {
+        'files': rows,
+        'totals': manifest['totals'],
+        'changed': sum(1 for row in rows if not row['unchanged']),
+        'unchanged': sum(1 for row in rows if row['unchanged']),
+        'redownload_bytes': changed_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Emit content-hashed, precompressed data assets for the web build')
+    parser.add_argument('--build-dir', default=os.path.join(PROJECT_ROOT, 'build', 'web'))
+    parser.add_argument('--asset', action='append', default=None,
+                        help='에셋 경로/글롭 (여러 번 지정 가능, 기본: pubspec 데이터 에셋)')
+    parser.add_argument('--no-headers', action='store_true', help='_headers 파일을 쓰지 않음')
+    parser.add_argument('--report', default=None, help='전송 크기 리포트 JSON 경로')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.build_dir):
+        print(f"ERROR: {args.build_dir} not found (run 'flutter build web' first)")
+        raise SystemExit(1)
+    if brotli is None:
+        print("[WARN] brotli not installed - emitting gzip variants only (pip install brotli)")
+
+    paths = resolve_assets(args.asset or DEFAULT_ASSETS)
+    previous = load_manifest(args.build_dir)
+    manifest = emit_assets(paths, args.build_dir)
+    write_items(os.path.join(args.build_dir, MANIFEST_NAME), manifest.items())
+    if not args.no_headers:
+        with open(os.path.join(args.build_dir, '_headers'), 'w', encoding='utf-8') as f:
+            f.write(HEADERS)
+
+    report = transfer_report(manifest, previous)
+    print(f"Emitted {len(paths)} assets to {os.path.join(args.build_dir, DATA_DIR)}")
+    for row in report['files']:
+        sizes = ', '.join(f"{name} {row[name]}" for name in ('gzip', 'br') if row[name] is not None)
+        sizes = f" ({sizes})" if sizes else ''
+        print(f"  {row['file']}: {row['bytes']} bytes{sizes}{' [cached]' if row['unchanged'] else ''}")
+    totals = report['totals']
+    print(f"Total: {totals['bytes']} bytes raw, {totals['gzip']} gzip, {totals['br']} best"
+          f" | {report['changed']} changed, {report['unchanged']} unchanged,"
+          f" {report['redownload_bytes']} bytes to re-download after this deploy")
+    if args.report:
+        write_items(args.report, report.items())
+        print(f"Report: {args.report}")
+
+
+if __name__ == '__main__':
+    main()